@@ -1,5 +1,6 @@
 """Service adapters bridging infrastructure with application layer."""
 
+from collections.abc import Sequence
 from typing import Any
 
 from ableton_mcp.domain.ports import AbletonGateway
@@ -175,6 +176,14 @@ class AbletonClipService:
             mute=note.mute,
         )
 
+    async def add_notes(self, track_id: int, clip_id: int, notes: Sequence[Any]) -> None:
+        """Add several MIDI notes to a clip in as few messages as possible."""
+        await self._gateway.add_notes(
+            track_id,
+            clip_id,
+            [(n.pitch, n.start, n.duration, n.velocity, n.mute) for n in notes],
+        )
+
     async def create_clip(self, track_id: int, clip_id: int, length: float) -> None:
         """Create a new clip."""
         await self._gateway.create_clip(track_id, clip_id, length)
@@ -1,6 +1,8 @@
 """Application use cases implementing business workflows."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -53,6 +55,83 @@ class UseCase(ABC):
         pass
 
 
+async def _gather_settled(*queries: Awaitable[Any]) -> list[Any]:
+    """Run queries concurrently and raise the first failure once all have settled."""
+    results = await asyncio.gather(*queries, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+async def _sync_song_data(gateway: Any, song_repository: SongRepository) -> None:
+    """Fetch song data from Ableton and store in repository."""
+    # Get basic song info; the queries use distinct addresses, so they can
+    # all be in flight at once and cost one round trip instead of five
+    tempo, time_sig, song_time, is_playing, num_tracks = await _gather_settled(
+        gateway.get_tempo(),
+        gateway.get_time_signature(),
+        gateway.get_song_time(),
+        gateway.get_is_playing(),
+        gateway.get_num_tracks(),
+    )
+
+    # Build track list
+    tracks: list[Track] = []
+    for i in range(num_tracks):
+        try:
+            # Pipeline one track's properties; all of them settle before the
+            # next track's queries go out, so a failed track leaves nothing
+            # pending behind it
+            (
+                track_name,
+                track_volume,
+                track_pan,
+                has_midi_input,
+                is_muted,
+                is_soloed,
+                is_armed,
+            ) = await _gather_settled(
+                gateway.get_track_name(i),
+                gateway.get_track_volume(i),
+                gateway.get_track_pan(i),
+                gateway.get_track_has_midi_input(i),
+                gateway.get_track_mute(i),
+                gateway.get_track_solo(i),
+                gateway.get_track_arm(i),
+            )
+            track_type = TrackType.MIDI if has_midi_input else TrackType.AUDIO
+
+            track = Track(
+                id=EntityId(value=f"track_{i}"),
+                name=track_name,
+                track_type=track_type,
+                volume=track_volume,
+                pan=track_pan,
+                is_muted=is_muted,
+                is_soloed=is_soloed,
+                is_armed=is_armed,
+            )
+            tracks.append(track)
+        except Exception:
+            # Skip tracks that fail to load
+            continue
+
+    # Build and save song
+    song = Song(
+        id=EntityId(value="current_song"),
+        name="Live Set",
+        tempo=tempo,
+        time_signature_numerator=time_sig[0],
+        time_signature_denominator=time_sig[1],
+        current_song_time=song_time,
+        transport_state=TransportState.PLAYING if is_playing else TransportState.STOPPED,
+        tracks=tracks,
+    )
+
+    await song_repository.save_song(song)
+
+
 @dataclass
 class ConnectToAbletonRequest:
     """Request to connect to Ableton Live."""
@@ -83,7 +162,7 @@ class ConnectToAbletonUseCase(UseCase):
             )
 
             # Fetch and store song data from Ableton
-            await self._sync_song_data()
+            await _sync_song_data(self._gateway, self._song_repository)
 
             return UseCaseResult(
                 success=True,
@@ -96,57 +175,6 @@ class ConnectToAbletonUseCase(UseCase):
                 error_code="CONNECTION_FAILED",
             )
 
-    async def _sync_song_data(self) -> None:
-        """Fetch song data from Ableton and store in repository."""
-        # Get basic song info
-        tempo = await self._gateway.get_tempo()
-        time_sig = await self._gateway.get_time_signature()
-        song_time = await self._gateway.get_song_time()
-        is_playing = await self._gateway.get_is_playing()
-        num_tracks = await self._gateway.get_num_tracks()
-
-        # Build track list
-        tracks: list[Track] = []
-        for i in range(num_tracks):
-            try:
-                track_name = await self._gateway.get_track_name(i)
-                track_volume = await self._gateway.get_track_volume(i)
-                track_pan = await self._gateway.get_track_pan(i)
-                has_midi_input = await self._gateway.get_track_has_midi_input(i)
-                track_type = TrackType.MIDI if has_midi_input else TrackType.AUDIO
-                is_muted = await self._gateway.get_track_mute(i)
-                is_soloed = await self._gateway.get_track_solo(i)
-                is_armed = await self._gateway.get_track_arm(i)
-
-                track = Track(
-                    id=EntityId(value=f"track_{i}"),
-                    name=track_name,
-                    track_type=track_type,
-                    volume=track_volume,
-                    pan=track_pan,
-                    is_muted=is_muted,
-                    is_soloed=is_soloed,
-                    is_armed=is_armed,
-                )
-                tracks.append(track)
-            except Exception:
-                # Skip tracks that fail to load
-                continue
-
-        # Build and save song
-        song = Song(
-            id=EntityId(value="current_song"),
-            name="Live Set",
-            tempo=tempo,
-            time_signature_numerator=time_sig[0],
-            time_signature_denominator=time_sig[1],
-            current_song_time=song_time,
-            transport_state=TransportState.PLAYING if is_playing else TransportState.STOPPED,
-            tracks=tracks,
-        )
-
-        await self._song_repository.save_song(song)
-
 
 @dataclass
 class RefreshSongDataRequest:
@@ -171,7 +199,7 @@ class RefreshSongDataUseCase(UseCase):
         """Refresh song data from Ableton Live."""
         try:
             self._logger.info("Refreshing song data from Ableton")
-            await self._sync_song_data()
+            await _sync_song_data(self._gateway, self._song_repository)
             self._logger.info("Song data refreshed successfully")
             return UseCaseResult(
                 success=True,
@@ -185,57 +213,6 @@ class RefreshSongDataUseCase(UseCase):
                 error_code="REFRESH_FAILED",
             )
 
-    async def _sync_song_data(self) -> None:
-        """Fetch song data from Ableton and store in repository."""
-        # Get basic song info
-        tempo = await self._gateway.get_tempo()
-        time_sig = await self._gateway.get_time_signature()
-        song_time = await self._gateway.get_song_time()
-        is_playing = await self._gateway.get_is_playing()
-        num_tracks = await self._gateway.get_num_tracks()
-
-        # Build track list
-        tracks: list[Track] = []
-        for i in range(num_tracks):
-            try:
-                track_name = await self._gateway.get_track_name(i)
-                track_volume = await self._gateway.get_track_volume(i)
-                track_pan = await self._gateway.get_track_pan(i)
-                has_midi_input = await self._gateway.get_track_has_midi_input(i)
-                track_type = TrackType.MIDI if has_midi_input else TrackType.AUDIO
-                is_muted = await self._gateway.get_track_mute(i)
-                is_soloed = await self._gateway.get_track_solo(i)
-                is_armed = await self._gateway.get_track_arm(i)
-
-                track = Track(
-                    id=EntityId(value=f"track_{i}"),
-                    name=track_name,
-                    track_type=track_type,
-                    volume=track_volume,
-                    pan=track_pan,
-                    is_muted=is_muted,
-                    is_soloed=is_soloed,
-                    is_armed=is_armed,
-                )
-                tracks.append(track)
-            except Exception:
-                # Skip tracks that fail to load
-                continue
-
-        # Build and save song
-        song = Song(
-            id=EntityId(value="current_song"),
-            name="Live Set",
-            tempo=tempo,
-            time_signature_numerator=time_sig[0],
-            time_signature_denominator=time_sig[1],
-            current_song_time=song_time,
-            transport_state=TransportState.PLAYING if is_playing else TransportState.STOPPED,
-            tracks=tracks,
-        )
-
-        await self._song_repository.save_song(song)
-
 
 @dataclass
 class TransportControlRequest:
@@ -689,8 +666,7 @@ class AddNotesUseCase(UseCase):
             await self._clip_service.create_clip(request.track_id, request.clip_id, clip_length)
 
             # Add notes directly to Ableton via clip service
-            for note in notes:
-                await self._clip_service.add_note(request.track_id, request.clip_id, note)
+            await self._clip_service.add_notes(request.track_id, request.clip_id, notes)
 
             return UseCaseResult(
                 success=True,
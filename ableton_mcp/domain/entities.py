@@ -6,10 +6,30 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
+from functools import cache
 from typing import Any
 
 from pydantic import BaseModel, Field, validator
 
+# Scale interval patterns understood by MusicKey
+_SCALE_INTERVALS: dict[str, tuple[int, ...]] = {
+    "major": (0, 2, 4, 5, 7, 9, 11),
+    "minor": (0, 2, 3, 5, 7, 8, 10),
+    # ... more scales
+}
+
+
+@cache
+def _scale_pitch_classes(root: int, mode: str) -> tuple[int, ...]:
+    """Get the pitch classes of a scale, memoized per (root, mode)."""
+    return tuple((root + interval) % 12 for interval in _SCALE_INTERVALS.get(mode, ()))
+
+
+@cache
+def _scale_pitch_class_set(root: int, mode: str) -> frozenset[int]:
+    """Get the pitch classes of a scale as a set, memoized per (root, mode)."""
+    return frozenset(_scale_pitch_classes(root, mode))
+
 
 class TransportState(StrEnum):
     """Transport playback states."""
@@ -267,15 +287,12 @@ class MusicKey(BaseModel):
     @property
     def scale_notes(self) -> list[int]:
         """Get the scale notes for this key."""
-        # This would be expanded with full scale definitions
-        scales = {
-            "major": [0, 2, 4, 5, 7, 9, 11],
-            "minor": [0, 2, 3, 5, 7, 8, 10],
-            # ... more scales
-        }
-        if self.mode in scales:
-            return [(self.root + interval) % 12 for interval in scales[self.mode]]
-        return []
+        return list(_scale_pitch_classes(self.root, self.mode))
+
+    @property
+    def scale_set(self) -> frozenset[int]:
+        """Get the scale notes for this key as a set for O(1) membership tests."""
+        return _scale_pitch_class_set(self.root, self.mode)
 
 
 class AnalysisResult(BaseModel):
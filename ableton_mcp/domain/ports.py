@@ -5,6 +5,7 @@ defines the contracts, and infrastructure provides implementations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 
@@ -244,6 +245,22 @@ class AbletonGateway(ABC):
         """
         ...
 
+    @abstractmethod
+    async def add_notes(
+        self,
+        track_id: int,
+        clip_id: int,
+        notes: Sequence[tuple[int, float, float, int, bool]],
+    ) -> None:
+        """Add several MIDI notes to a clip.
+
+        Args:
+            track_id: Track index
+            clip_id: Clip slot index
+            notes: (pitch, start, duration, velocity, mute) tuples
+        """
+        ...
+
     @abstractmethod
     async def remove_notes(
         self,
@@ -5,6 +5,8 @@ This module correlates requests with their responses using FIFO queues.
 """
 
 import asyncio
+import sys
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -16,7 +18,7 @@ logger = structlog.get_logger(__name__)
 DEFAULT_TIMEOUT_SECONDS = 5.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingRequest:
     """Represents a pending request awaiting a response.
 
@@ -43,8 +45,12 @@ class OSCCorrelator:
         Args:
             default_timeout: Default timeout for waiting on responses
         """
-        # Use regular dict instead of defaultdict to avoid creating Queue outside async context
-        self._pending: dict[str, asyncio.Queue[PendingRequest]] = {}
+        # Plain deques rather than asyncio.Queue: every access is synchronous on
+        # the loop thread, so the queue's waiter bookkeeping is pure overhead
+        self._pending: dict[str, deque[PendingRequest]] = {}
+        # Total queued requests across addresses; the per-address deques are
+        # kept once created, so this is what tells an idle correlator apart
+        self._pending_count = 0
         self._default_timeout = default_timeout
 
     async def expect_response(
@@ -70,11 +76,12 @@ class OSCCorrelator:
             timestamp=loop.time(),
         )
 
-        # Create queue for this address if it doesn't exist (inside async context)
-        if address not in self._pending:
-            self._pending[address] = asyncio.Queue()
-
-        await self._pending[address].put(request)
+        queue = self._pending.get(address)
+        if queue is None:
+            # Interned so keys are the same objects the transport decodes
+            queue = self._pending[sys.intern(address)] = deque()
+        queue.append(request)
+        self._pending_count += 1
 
         logger.debug("Registered pending request", address=address)
         return future
@@ -89,32 +96,33 @@ class OSCCorrelator:
         Returns:
             True if a pending request was matched, False otherwise
         """
+        # Unsolicited messages usually arrive with nothing in flight; skip the
+        # lookup and the debug log for them
+        if not self._pending_count:
+            return False
+
         queue = self._pending.get(address)
-        if queue is None or queue.empty():
+        if not queue:
             logger.debug("No pending request for response", address=address)
             return False
 
-        try:
-            # Get the oldest pending request (FIFO)
-            request = queue.get_nowait()
-
-            if not request.future.done():
-                request.future.set_result(args)
-                logger.debug(
-                    "Resolved pending request",
-                    address=address,
-                    args=args,
-                )
-                return True
-            else:
-                logger.warning(
-                    "Pending request future already done",
-                    address=address,
-                )
-                return False
-
-        except asyncio.QueueEmpty:
-            logger.debug("Queue empty for response", address=address)
+        # Get the oldest pending request (FIFO)
+        request = queue.popleft()
+        self._pending_count -= 1
+
+        if not request.future.done():
+            request.future.set_result(args)
+            logger.debug(
+                "Resolved pending request",
+                address=address,
+                args=args,
+            )
+            return True
+        else:
+            logger.warning(
+                "Pending request future already done",
+                address=address,
+            )
             return False
 
     async def wait_for_response(
@@ -156,33 +164,22 @@ class OSCCorrelator:
         if queue is None:
             return
 
-        # Drain and rebuild the queue without the timed-out future
-        remaining: list[PendingRequest] = []
-        while not queue.empty():
-            try:
-                request = queue.get_nowait()
-                if request.future is not future:
-                    remaining.append(request)
-            except asyncio.QueueEmpty:
+        for request in queue:
+            if request.future is future:
+                queue.remove(request)
+                self._pending_count -= 1
                 break
 
-        # Re-add non-timed-out requests
-        for request in remaining:
-            queue.put_nowait(request)
-
     def cancel_all(self) -> None:
         """Cancel all pending requests.
 
         Useful during disconnect to clean up.
         """
-        for _address, queue in self._pending.items():
-            while not queue.empty():
-                try:
-                    request = queue.get_nowait()
-                    if not request.future.done():
-                        request.future.cancel()
-                except asyncio.QueueEmpty:
-                    break
+        for queue in self._pending.values():
+            for request in queue:
+                if not request.future.done():
+                    request.future.cancel()
 
         self._pending.clear()
+        self._pending_count = 0
         logger.debug("Cancelled all pending requests")
@@ -4,6 +4,7 @@ This implements the AbletonGateway port defined in the domain layer.
 """
 
 import asyncio
+from collections.abc import Sequence
 from typing import Any
 
 import structlog
@@ -16,6 +17,13 @@ from ableton_mcp.infrastructure.osc.transport import AsyncOSCTransport
 logger = structlog.get_logger(__name__)
 
 
+def _expire(*futures: asyncio.Future[list[Any]]) -> None:
+    """Fail still-pending response futures with TimeoutError."""
+    for future in futures:
+        if not future.done():
+            future.set_exception(TimeoutError())
+
+
 class AbletonOSCGateway(AbletonGateway):
     """High-level async gateway to Ableton Live via OSC.
 
@@ -23,6 +31,10 @@ class AbletonOSCGateway(AbletonGateway):
     that implements the AbletonGateway port.
     """
 
+    # Notes per /live/clip/add/notes message; 32 notes keep a datagram
+    # around 800 bytes, inside a single Ethernet frame.
+    NOTE_BATCH_SIZE = 32
+
     def __init__(
         self,
         transport: AsyncOSCTransport | None = None,
@@ -39,6 +51,9 @@ class AbletonOSCGateway(AbletonGateway):
         self._transport = transport or AsyncOSCTransport()
         self._correlator = correlator or OSCCorrelator(default_timeout=default_timeout)
         self._default_timeout = default_timeout
+        # Mirrors the transport's state so the per-message checks in _send and
+        # _request are a plain attribute read.
+        self._connected = False
 
     def _handle_osc_message(self, address: str, args: list[Any]) -> None:
         """Handle incoming OSC messages from transport."""
@@ -48,6 +63,8 @@ class AbletonOSCGateway(AbletonGateway):
 
     async def connect(self, host: str, send_port: int, receive_port: int) -> None:
         """Establish connection to Ableton Live."""
+        # The transport tears down any existing connection before reconnecting
+        self._connected = False
         try:
             await self._transport.connect(
                 host=host,
@@ -55,6 +72,7 @@ class AbletonOSCGateway(AbletonGateway):
                 receive_port=receive_port,
                 message_handler=self._handle_osc_message,
             )
+            self._connected = True
 
             # Test connection by requesting tempo
             try:
@@ -67,6 +85,7 @@ class AbletonOSCGateway(AbletonGateway):
                     tempo=tempo,
                 )
             except TimeoutError:
+                self._connected = False
                 # Ensure cleanup even if disconnect fails
                 try:
                     await self._transport.disconnect()
@@ -84,19 +103,20 @@ class AbletonOSCGateway(AbletonGateway):
 
     async def disconnect(self) -> None:
         """Disconnect from Ableton Live."""
+        self._connected = False
         self._correlator.cancel_all()
         await self._transport.disconnect()
         logger.info("Disconnected from Ableton Live")
 
     def is_connected(self) -> bool:
         """Check if currently connected."""
-        return self._transport.is_connected()
+        return self._connected
 
     # Internal helpers
 
     def _send(self, address: str, args: list[Any] | None = None) -> None:
         """Send an OSC message without waiting for response."""
-        if not self.is_connected():
+        if not self._connected:
             raise OSCCommunicationError("Not connected to Ableton Live")
         self._transport.send(address, args or [])
 
@@ -120,7 +140,7 @@ class AbletonOSCGateway(AbletonGateway):
             OSCCommunicationError: If not connected or communication fails
             asyncio.TimeoutError: If response not received in time
         """
-        if not self.is_connected():
+        if not self._connected:
             raise OSCCommunicationError("Not connected to Ableton Live")
 
         # Register expectation before sending
@@ -129,13 +149,57 @@ class AbletonOSCGateway(AbletonGateway):
         # Send the request
         self._transport.send(address, args or [])
 
-        # Wait for response
+        # Wait for response; a timer on the future itself replaces wait_for,
+        # which would allocate a waiter future and callbacks per request
         effective_timeout = timeout if timeout is not None else self._default_timeout
+        timer = asyncio.get_running_loop().call_later(effective_timeout, _expire, future)
         try:
-            return await asyncio.wait_for(future, timeout=effective_timeout)
+            return await future
         except TimeoutError:
             logger.warning("Request timed out", address=address, timeout=effective_timeout)
             raise
+        finally:
+            timer.cancel()
+
+    async def _request_bundle(
+        self,
+        requests: Sequence[tuple[str, list[Any]]],
+        timeout: float | None = None,
+    ) -> list[list[Any]]:
+        """Send several requests in one bundle and wait for all responses.
+
+        Args:
+            requests: (address, args) pairs
+            timeout: Optional timeout override for the whole batch
+
+        Returns:
+            Response arguments, in request order
+
+        Raises:
+            OSCCommunicationError: If not connected
+            asyncio.TimeoutError: If any response is not received in time
+        """
+        if not self._connected:
+            raise OSCCommunicationError("Not connected to Ableton Live")
+
+        # Register every expectation before the bundle goes out
+        futures = [await self._correlator.expect_response(address) for address, _ in requests]
+
+        self._transport.send_bundle(requests)
+
+        effective_timeout = timeout if timeout is not None else self._default_timeout
+        timer = asyncio.get_running_loop().call_later(effective_timeout, _expire, *futures)
+        try:
+            return await asyncio.gather(*futures)
+        except TimeoutError:
+            logger.warning(
+                "Bundled request timed out",
+                addresses=[address for address, _ in requests],
+                timeout=effective_timeout,
+            )
+            raise
+        finally:
+            timer.cancel()
 
     # Transport control (fire-and-forget commands)
     # These are async for interface consistency but execute synchronously.
@@ -174,8 +238,12 @@ class AbletonOSCGateway(AbletonGateway):
 
     async def get_time_signature(self) -> tuple[int, int]:
         """Get time signature as (numerator, denominator)."""
-        num_response = await self._request("/live/song/get/signature_numerator")
-        denom_response = await self._request("/live/song/get/signature_denominator")
+        num_response, denom_response = await self._request_bundle(
+            [
+                ("/live/song/get/signature_numerator", []),
+                ("/live/song/get/signature_denominator", []),
+            ]
+        )
         if not num_response or not denom_response:
             raise OSCCommunicationError("Empty response from Ableton Live for time signature")
         return int(num_response[0]), int(denom_response[0])
@@ -336,6 +404,26 @@ class AbletonOSCGateway(AbletonGateway):
             [track_id, clip_id, pitch, start, duration, velocity, 1 if mute else 0],
         )
 
+    async def add_notes(
+        self,
+        track_id: int,
+        clip_id: int,
+        notes: Sequence[tuple[int, float, float, int, bool]],
+    ) -> None:
+        """Add several MIDI notes to a clip (fire-and-forget, no confirmation).
+
+        AbletonOSC accepts any number of pitch/start/duration/velocity/mute
+        groups per message, so notes go out NOTE_BATCH_SIZE per datagram
+        instead of one datagram each.
+        """
+        for offset in range(0, len(notes), self.NOTE_BATCH_SIZE):
+            args: list[Any] = [track_id, clip_id]
+            for pitch, start, duration, velocity, mute in notes[
+                offset : offset + self.NOTE_BATCH_SIZE
+            ]:
+                args.extend((pitch, start, duration, velocity, 1 if mute else 0))
+            self._send("/live/clip/add/notes", args)
+
     async def remove_notes(
         self,
         track_id: int,
@@ -357,29 +445,32 @@ class AbletonOSCGateway(AbletonGateway):
 
         # AbletonOSC returns notes in flat format:
         # [track_id, clip_id, pitch1, start1, duration1, velocity1, mute1, ...]
-        notes: list[dict[str, Any]] = []
         if not response or len(response) < 2:
-            return notes
+            return []
 
         # Skip track_id and clip_id prefix, notes data starts at index 2
         data = response[2:]
 
-        # Each note has 5 values: pitch, start, duration, velocity, mute
-        note_count = len(data) // 5
-        for i in range(note_count):
-            base = i * 5
-            if base + 5 <= len(data):
-                notes.append(
-                    {
-                        "pitch": int(data[base]),
-                        "start": float(data[base + 1]),
-                        "duration": float(data[base + 2]),
-                        "velocity": int(data[base + 3]),
-                        "mute": bool(data[base + 4]),
-                    }
-                )
-
-        return notes
+        # Each note has 5 values: pitch, start, duration, velocity, mute.
+        # Read them as five strided columns, dropping any trailing partial note.
+        end = len(data) - len(data) % 5
+        return [
+            {
+                "pitch": int(pitch),
+                "start": float(start),
+                "duration": float(duration),
+                "velocity": int(velocity),
+                "mute": bool(mute),
+            }
+            for pitch, start, duration, velocity, mute in zip(
+                data[0:end:5],
+                data[1:end:5],
+                data[2:end:5],
+                data[3:end:5],
+                data[4:end:5],
+                strict=True,
+            )
+        ]
 
     # Device operations
 
@@ -389,28 +480,31 @@ class AbletonOSCGateway(AbletonGateway):
 
         # AbletonOSC returns parameters in flat format:
         # [param_count, id1, name1, value1, min1, max1, ...]
-        parameters: list[dict[str, Any]] = []
         if not response:
-            return parameters
+            return []
 
-        param_count = int(response[0])
         data = response[1:]
 
-        # Each parameter has 5 values: id, name, value, min, max
-        for i in range(param_count):
-            base = i * 5
-            if base + 5 <= len(data):
-                parameters.append(
-                    {
-                        "id": int(data[base]),
-                        "name": str(data[base + 1]),
-                        "value": float(data[base + 2]),
-                        "min": float(data[base + 3]),
-                        "max": float(data[base + 4]),
-                    }
-                )
-
-        return parameters
+        # Each parameter has 5 values: id, name, value, min, max.
+        # Read them as five strided columns, capped at the reported count.
+        end = max(min(int(response[0]), len(data) // 5), 0) * 5
+        return [
+            {
+                "id": int(param_id),
+                "name": str(name),
+                "value": float(value),
+                "min": float(min_value),
+                "max": float(max_value),
+            }
+            for param_id, name, value, min_value, max_value in zip(
+                data[0:end:5],
+                data[1:end:5],
+                data[2:end:5],
+                data[3:end:5],
+                data[4:end:5],
+                strict=True,
+            )
+        ]
 
     async def set_device_parameter(
         self, track_id: int, device_id: int, parameter_id: int, value: float
@@ -1,22 +1,167 @@
 """Async UDP transport for OSC communication using asyncio.DatagramProtocol."""
 
 import asyncio
-from collections.abc import Callable
+import logging
+import socket
+import struct
+import sys
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import Any
 
 import structlog
 from pythonosc.osc_bundle import OscBundle
+from pythonosc.osc_bundle_builder import IMMEDIATELY, OscBundleBuilder
 from pythonosc.osc_message import OscMessage
 from pythonosc.osc_message_builder import OscMessageBuilder
 
 logger = structlog.get_logger(__name__)
 
+# Socket buffer size requested for both endpoints; kernel defaults are small
+# enough that bursts of replies (e.g. a full song sync) can be dropped
+DEFAULT_SOCKET_BUFFER_BYTES = 1 << 20
+
+_INT32 = struct.Struct(">i")
+_FLOAT32 = struct.Struct(">f")
+
+
+# Upper bound on distinct addresses kept by _decode_address; AbletonOSC uses a
+# few dozen, so the cap only matters if a peer sends arbitrary addresses
+_ADDRESS_CACHE_SIZE = 1024
+_addresses: dict[bytes, str] = {}
+
+
+def _decode_address(raw: bytes) -> str:
+    """Decode an address, reusing one interned str per distinct address.
+
+    Repeated replies then hand the correlator the same string object it keys
+    its pending requests on, so dict lookups match by identity.
+    """
+    address = _addresses.get(raw)
+    if address is None:
+        address = sys.intern(raw.decode())
+        if len(_addresses) < _ADDRESS_CACHE_SIZE:
+            _addresses[raw] = address
+    return address
+
+
+def _padded(index: int) -> int:
+    """Return the 4-byte aligned offset just past a NUL at ``index``."""
+    return (index + 4) & ~3
+
+
+def _parse_message(data: bytes) -> tuple[str, list[Any]] | None:
+    """Decode a plain OSC message in a single pass over the datagram.
+
+    Handles the int32, float32, string and boolean arguments AbletonOSC sends.
+    Returns None for any other type tag so the caller can fall back to
+    pythonosc; truncated payloads raise struct.error or ValueError.
+    """
+    if not data.startswith(b"/"):
+        return None
+    address_end = data.index(b"\0")
+    pos = _padded(address_end)
+    if data[pos : pos + 1] != b",":
+        return None
+    tags_end = data.index(b"\0", pos)
+    tags = data[pos + 1 : tags_end]
+    pos = _padded(tags_end)
+
+    args: list[Any] = []
+    for tag in tags:
+        if tag == 0x69:  # i
+            args.append(_INT32.unpack_from(data, pos)[0])
+            pos += 4
+        elif tag == 0x66:  # f
+            args.append(_FLOAT32.unpack_from(data, pos)[0])
+            pos += 4
+        elif tag == 0x73:  # s
+            string_end = data.index(b"\0", pos)
+            args.append(data[pos:string_end].decode())
+            pos = _padded(string_end)
+        elif tag == 0x54:  # T
+            args.append(True)
+        elif tag == 0x46:  # F
+            args.append(False)
+        else:
+            return None
+    return _decode_address(data[:address_end]), args
+
+
+def _osc_string(value: str) -> bytes:
+    """Encode ``value`` as a NUL-terminated, 4-byte padded OSC string."""
+    raw = value.encode()
+    return raw + b"\0" * (4 - len(raw) % 4)
+
+
+@lru_cache(maxsize=256)
+def _message_layout(address: str, tags: str) -> tuple[bytes, struct.Struct]:
+    """Return the address/type-tag prefix and argument packer for a signature.
+
+    Gateway methods send the same address with the same argument types every
+    time, so both are built once per signature and reused.
+    """
+    values = tags.replace("T", "").replace("F", "")
+    return _osc_string(address) + _osc_string("," + tags), struct.Struct(">" + values)
+
+
+def _encode_message(address: str, args: list[Any]) -> bytes | None:
+    """Encode a message whose arguments are all int32, float32 or bool.
+
+    Produces the same bytes as OscMessageBuilder. Returns None for any other
+    argument type so the caller can fall back to the builder.
+    """
+    tags = []
+    values = []
+    for arg in args:
+        kind = type(arg)
+        if kind is float:
+            tags.append("f")
+            values.append(arg)
+        elif kind is int and arg.bit_length() <= 31:
+            tags.append("i")
+            values.append(arg)
+        elif kind is bool:
+            tags.append("T" if arg else "F")
+        else:
+            return None
+    prefix, packer = _message_layout(address, "".join(tags))
+    return prefix + packer.pack(*values)
+
+
+@lru_cache(maxsize=256)
+def _bare_message(address: str) -> bytes:
+    """Build and cache the datagram for an argument-less message.
+
+    Fire-and-forget commands such as /live/song/start_playing always encode to
+    the same bytes, so they skip the builder after the first send.
+    """
+    return OscMessageBuilder(address=address).build().dgram
+
+
+def _set_buffer_size(transport: asyncio.DatagramTransport, option: int, size: int | None) -> None:
+    """Request a kernel buffer size on the transport's socket, if configured.
+
+    Failures are logged rather than raised; the connection still works with
+    the default buffers.
+    """
+    if size is None:
+        return
+    sock = transport.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, option, size)
+    except OSError as e:
+        logger.warning("Failed to set OSC socket buffer size", size=size, error=str(e))
+
 
 class OSCProtocol(asyncio.DatagramProtocol):
     """Asyncio datagram protocol for receiving OSC messages."""
 
-    # Threshold for warning about parse errors
-    PARSE_ERROR_WARN_THRESHOLD = 10
+    # Consecutive parse errors before warning; further warnings only fire when
+    # the count reaches the next power of two, so a burst logs O(log n) of them
+    PARSE_ERROR_WARN_THRESHOLD = 8
 
     def __init__(
         self,
@@ -30,6 +175,17 @@ class OSCProtocol(asyncio.DatagramProtocol):
         self._message_handler = message_handler
         self._transport: asyncio.DatagramTransport | None = None
         self._parse_error_count: int = 0
+        self._debug_enabled: bool = False
+        self.refresh_log_levels()
+
+    def refresh_log_levels(self) -> None:
+        """Re-read whether per-message debug logging is enabled.
+
+        The level is cached because a disabled structlog debug call still runs
+        the processor chain up to filter_by_level for every datagram. Call this
+        after changing the logging configuration of a live connection.
+        """
+        self._debug_enabled = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
 
     def connection_made(self, transport: asyncio.DatagramTransport) -> None:  # type: ignore[override]
         """Called when connection is established."""
@@ -51,7 +207,8 @@ class OSCProtocol(asyncio.DatagramProtocol):
                 data_length=len(data),
                 error_count=self._parse_error_count,
             )
-            if self._parse_error_count >= self.PARSE_ERROR_WARN_THRESHOLD:
+            count = self._parse_error_count
+            if count >= self.PARSE_ERROR_WARN_THRESHOLD and not count & (count - 1):
                 logger.warning(
                     "High number of consecutive OSC parse errors - connection may be corrupted",
                     error_count=self._parse_error_count,
@@ -64,18 +221,20 @@ class OSCProtocol(asyncio.DatagramProtocol):
             for content in bundle:
                 if isinstance(content, OscMessage):
                     self._dispatch_message(content)
+        elif (parsed := _parse_message(data)) is not None:
+            self._dispatch(*parsed)
         else:
-            message = OscMessage(data)
-            self._dispatch_message(message)
+            self._dispatch_message(OscMessage(data))
 
     def _dispatch_message(self, message: OscMessage) -> None:
-        """Dispatch a parsed OSC message to the handler."""
-        logger.debug(
-            "Received OSC message",
-            address=message.address,
-            args=message.params,
-        )
-        self._message_handler(message.address, list(message.params))
+        """Dispatch a pythonosc-parsed OSC message to the handler."""
+        self._dispatch(message.address, list(message.params))
+
+    def _dispatch(self, address: str, args: list[Any]) -> None:
+        """Dispatch a decoded OSC message to the handler."""
+        if self._debug_enabled:
+            logger.debug("Received OSC message", address=address, args=args)
+        self._message_handler(address, args)
 
     def error_received(self, exc: Exception) -> None:
         """Called when an error is received."""
@@ -92,7 +251,19 @@ class OSCProtocol(asyncio.DatagramProtocol):
 class AsyncOSCTransport:
     """Async OSC transport managing send and receive endpoints."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        send_buffer_bytes: int | None = DEFAULT_SOCKET_BUFFER_BYTES,
+        receive_buffer_bytes: int | None = DEFAULT_SOCKET_BUFFER_BYTES,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            send_buffer_bytes: SO_SNDBUF size for the send socket (None keeps the OS default)
+            receive_buffer_bytes: SO_RCVBUF size for the receive socket (None keeps the OS default)
+        """
+        self._send_buffer_bytes = send_buffer_bytes
+        self._receive_buffer_bytes = receive_buffer_bytes
         self._send_transport: asyncio.DatagramTransport | None = None
         self._receive_transport: asyncio.DatagramTransport | None = None
         self._protocol: OSCProtocol | None = None
@@ -100,6 +271,21 @@ class AsyncOSCTransport:
         self._send_port: int = 11000
         self._receive_port: int = 11001
         self._connected: bool = False
+        # Bound sendto of the send endpoint while connected, so the send path
+        # is one attribute read plus the call
+        self._sendto: Callable[[bytes], None] | None = None
+        # Reused for every outgoing message; sends only happen on the loop
+        # thread, so a single builder per transport is safe.
+        self._builder = OscMessageBuilder()
+
+    def _build_message(self, address: str, args: list[Any]) -> OscMessage:
+        """Encode a message with the shared builder, clearing prior args."""
+        builder = self._builder
+        builder.address = address
+        builder.args.clear()
+        for arg in args:
+            builder.add_arg(arg)
+        return builder.build()
 
     async def connect(
         self,
@@ -139,6 +325,10 @@ class AsyncOSCTransport:
             local_addr=("0.0.0.0", receive_port),
         )
 
+        _set_buffer_size(self._send_transport, socket.SO_SNDBUF, self._send_buffer_bytes)
+        _set_buffer_size(self._receive_transport, socket.SO_RCVBUF, self._receive_buffer_bytes)
+
+        self._sendto = self._send_transport.sendto
         self._connected = True
         logger.info(
             "OSC transport connected",
@@ -158,6 +348,7 @@ class AsyncOSCTransport:
             self._receive_transport = None
 
         self._protocol = None
+        self._sendto = None
         self._connected = False
         logger.info("OSC transport disconnected")
 
@@ -175,14 +366,36 @@ class AsyncOSCTransport:
         Raises:
             RuntimeError: If not connected
         """
-        if not self._connected or not self._send_transport:
+        sendto = self._sendto
+        if sendto is None:
             raise RuntimeError("Transport not connected")
 
-        builder = OscMessageBuilder(address=address)
-        for arg in args:
-            builder.add_arg(arg)
-
-        message = builder.build()
-        self._send_transport.sendto(message.dgram)
+        if not args:
+            dgram = _bare_message(address)
+        elif (encoded := _encode_message(address, args)) is not None:
+            dgram = encoded
+        else:
+            dgram = self._build_message(address, args).dgram
+        sendto(dgram)
 
         logger.debug("Sent OSC message", address=address, args=args)
+
+    def send_bundle(self, messages: Sequence[tuple[str, list[Any]]]) -> None:
+        """Send several OSC messages in a single bundle datagram.
+
+        Args:
+            messages: (address, args) pairs, delivered in order
+
+        Raises:
+            RuntimeError: If not connected
+        """
+        sendto = self._sendto
+        if sendto is None:
+            raise RuntimeError("Transport not connected")
+
+        bundle = OscBundleBuilder(IMMEDIATELY)
+        for address, args in messages:
+            bundle.add_content(self._build_message(address, args))
+        sendto(bundle.build().dgram)
+
+        logger.debug("Sent OSC bundle", addresses=[address for address, _ in messages])
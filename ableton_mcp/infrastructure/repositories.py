@@ -5,6 +5,7 @@ in concurrent async contexts.
 """
 
 import asyncio
+from collections.abc import Iterable
 
 from ableton_mcp.domain.entities import (
     AnalysisResult,
@@ -29,8 +30,9 @@ class InMemorySongRepository(SongRepository):
     Thread-safe via asyncio.Lock for concurrent access.
     """
 
-    def __init__(self) -> None:
-        self._current_song: Song | None = None
+    def __init__(self, song: Song | None = None) -> None:
+        """Initialize the repository, optionally with a current song."""
+        self._current_song: Song | None = song
         self._lock = asyncio.Lock()
 
     async def get_current_song(self) -> Song | None:
@@ -56,8 +58,9 @@ class InMemoryTrackRepository(TrackRepository):
     Thread-safe via asyncio.Lock for concurrent access.
     """
 
-    def __init__(self) -> None:
-        self._tracks: dict[str, Track] = {}
+    def __init__(self, tracks: Iterable[Track] = ()) -> None:
+        """Initialize the repository, optionally seeded with tracks."""
+        self._tracks: dict[str, Track] = {track.id.value: track for track in tracks}
         self._lock = asyncio.Lock()
 
     async def get_track(self, track_id: EntityId) -> Track | None:
@@ -94,8 +97,9 @@ class InMemoryDeviceRepository(DeviceRepository):
     Thread-safe via asyncio.Lock for concurrent access.
     """
 
-    def __init__(self) -> None:
-        self._devices: dict[str, Device] = {}
+    def __init__(self, devices: Iterable[Device] = ()) -> None:
+        """Initialize the repository, optionally seeded with devices."""
+        self._devices: dict[str, Device] = {device.id.value: device for device in devices}
         self._lock = asyncio.Lock()
 
     async def get_device(self, device_id: EntityId) -> Device | None:
@@ -132,8 +136,9 @@ class InMemoryClipRepository(ClipRepository):
     Thread-safe via asyncio.Lock for concurrent access.
     """
 
-    def __init__(self) -> None:
-        self._clips: dict[str, Clip] = {}
+    def __init__(self, clips: Iterable[Clip] = ()) -> None:
+        """Initialize the repository, optionally seeded with clips."""
+        self._clips: dict[str, Clip] = {clip.id.value: clip for clip in clips}
         self._lock = asyncio.Lock()
 
     async def get_clip(self, clip_id: EntityId) -> Clip | None:
@@ -170,8 +175,9 @@ class InMemoryAnalysisRepository(AnalysisRepository):
     Thread-safe via asyncio.Lock for concurrent access.
     """
 
-    def __init__(self) -> None:
-        self._analyses: dict[str, AnalysisResult] = {}
+    def __init__(self, analyses: Iterable[AnalysisResult] = ()) -> None:
+        """Initialize the repository, optionally seeded with analysis results."""
+        self._analyses: dict[str, AnalysisResult] = {result.id.value: result for result in analyses}
         self._lock = asyncio.Lock()
 
     async def save_analysis(self, result: AnalysisResult) -> None:
@@ -1,5 +1,8 @@
 """Concrete implementations of domain services."""
 
+from functools import lru_cache
+from itertools import pairwise
+from statistics import median_high
 from typing import Any
 
 from ableton_mcp.domain.entities import (
@@ -86,7 +89,8 @@ class MusicTheoryServiceImpl(MusicTheoryService):
             return []
 
         # Extract pitch classes from notes
-        pitch_classes = list({note.pitch_class for note in notes})
+        input_set = {note.pitch_class for note in notes}
+        pitch_classes = list(input_set)
 
         # Calculate key candidates with confidence scores
         key_candidates = []
@@ -96,7 +100,6 @@ class MusicTheoryServiceImpl(MusicTheoryService):
                 scale_notes = {(root + interval) % 12 for interval in scale_intervals}
 
                 # Calculate match score - how many input notes are in the scale
-                input_set = set(pitch_classes)
                 matches = len(input_set.intersection(scale_notes))
 
                 # Base confidence: percentage of input notes that fit the scale
@@ -284,29 +287,24 @@ class TempoAnalysisServiceImpl(TempoAnalysisService):
         if clip.clip_type != ClipType.MIDI or not clip.notes:
             return 120.0
 
-        # Sort notes by start time
-        sorted_notes = sorted(clip.notes, key=lambda n: n.start)
+        # Sort onset times directly rather than the notes themselves
+        starts = sorted(note.start for note in clip.notes)
 
-        if len(sorted_notes) < 2:
+        if len(starts) < 2:
             return 120.0
 
-        # Calculate inter-onset intervals (IOI)
-        iois: list[float] = []
-        for i in range(1, len(sorted_notes)):
-            delta = sorted_notes[i].start - sorted_notes[i - 1].start
-            # Filter out simultaneous notes and very long gaps
-            if 0.01 < delta < 4.0:
-                iois.append(delta)
+        # Calculate inter-onset intervals (IOI), filtering out simultaneous
+        # notes and very long gaps
+        iois = [delta for a, b in pairwise(starts) if 0.01 < (delta := b - a) < 4.0]
 
         if not iois:
             return 120.0
 
         # Find median IOI (more robust than mean for rhythm analysis)
-        iois.sort()
-        median_ioi = iois[len(iois) // 2]
+        median_ioi = median_high(iois)
 
         # Calculate note density (notes per beat)
-        density = len(sorted_notes) / clip.length if clip.length > 0 else 1.0
+        density = len(starts) / clip.length if clip.length > 0 else 1.0
 
         # Estimate BPM based on rhythmic patterns
         # Common IOI values: 0.25 (16th), 0.5 (8th), 1.0 (quarter), 2.0 (half)
@@ -328,13 +326,17 @@ class TempoAnalysisServiceImpl(TempoAnalysisService):
 
     async def suggest_tempo_for_genre(self, genre: str, energy_level: str) -> float:
         """Suggest appropriate tempo for genre and energy level."""
-        genre_lower = genre.lower()
+        return self._tempo_for_genre(genre.lower(), energy_level)
 
-        if genre_lower not in self.GENRE_BPM_RANGES:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _tempo_for_genre(genre_lower: str, energy_level: str) -> float:
+        """Compute the genre tempo, memoized per (genre, energy level)."""
+        if genre_lower not in TempoAnalysisServiceImpl.GENRE_BPM_RANGES:
             # Default to moderate tempo if genre not found
             base_tempo = 120.0
         else:
-            min_bpm, max_bpm = self.GENRE_BPM_RANGES[genre_lower]
+            min_bpm, max_bpm = TempoAnalysisServiceImpl.GENRE_BPM_RANGES[genre_lower]
 
             # Calculate base tempo based on energy level
             if energy_level == "low":
@@ -459,22 +461,14 @@ class TempoAnalysisServiceImpl(TempoAnalysisService):
         self, song: Song, target_energy: list[float]
     ) -> list[tuple[float, float]]:
         """Suggest tempo changes to match target energy curve."""
-        suggestions = []
         base_tempo = song.tempo
 
-        for i, energy in enumerate(target_energy):
-            # Calculate tempo adjustment based on energy level
-            # Higher energy = faster tempo (up to +20% of base)
-            tempo_multiplier = 1.0 + (energy - 0.5) * 0.4
-            suggested_tempo = base_tempo * tempo_multiplier
-
-            # Clamp to reasonable range
-            suggested_tempo = max(60.0, min(200.0, suggested_tempo))
-
-            time_position = i * 4.0  # Assume 4-bar sections
-            suggestions.append((time_position, suggested_tempo))
-
-        return suggestions
+        # Higher energy = faster tempo (up to +20% of base), clamped to a
+        # reasonable range; one suggestion per section (assume 4-bar sections)
+        return [
+            (i * 4.0, max(60.0, min(200.0, base_tempo * (1.0 + (energy - 0.5) * 0.4))))
+            for i, energy in enumerate(target_energy)
+        ]
 
 
 class ArrangementServiceImpl(ArrangementService):
@@ -681,9 +675,10 @@ class ArrangementServiceImpl(ArrangementService):
         """
         from ableton_mcp.domain.entities import ClipType
 
-        # Collect all note events with their energy contribution
-        energy_events: list[tuple[float, float]] = []  # (time, energy)
-        max_time = 0.0
+        # Collect note events as parallel time/energy columns so the bucketing
+        # pass below reads flat lists instead of per-event tuples
+        times: list[float] = []
+        energies: list[float] = []
 
         for track in song.tracks:
             track_weight = track.volume
@@ -696,22 +691,19 @@ class ArrangementServiceImpl(ArrangementService):
                 clip_start = slot_idx * 16.0  # 4 bars per slot
 
                 if clip.clip_type == ClipType.MIDI and clip.notes:
-                    # Calculate energy from MIDI notes
-                    for note in clip.notes:
-                        abs_time = clip_start + note.start
-                        # Energy = velocity normalized * track volume
-                        energy = (note.velocity / 127.0) * track_weight
-                        energy_events.append((abs_time, energy))
-                        max_time = max(max_time, abs_time)
+                    # Energy = velocity normalized * track volume
+                    times.extend(clip_start + note.start for note in clip.notes)
+                    energies.extend((note.velocity / 127.0) * track_weight for note in clip.notes)
                 else:
                     # Audio clip: assume moderate energy throughout
-                    for beat in range(int(clip.length)):
-                        abs_time = clip_start + beat
-                        energy_events.append((abs_time, 0.5 * track_weight))
-                        max_time = max(max_time, abs_time)
+                    beats = int(clip.length)
+                    times.extend(clip_start + beat for beat in range(beats))
+                    energies.extend([0.5 * track_weight] * beats)
+
+        max_time = max(times, default=0.0)
 
         # Handle empty song
-        if not energy_events or max_time == 0:
+        if max_time <= 0:
             # Return flat energy curve for 4 minutes
             return [(i * 8.0, 0.5) for i in range(30)]
 
@@ -722,7 +714,7 @@ class ArrangementServiceImpl(ArrangementService):
         buckets: list[float] = [0.0] * num_buckets
         bucket_counts: list[int] = [0] * num_buckets
 
-        for time, energy in energy_events:
+        for time, energy in zip(times, energies, strict=True):
             bucket_idx = min(int(time / bucket_size), num_buckets - 1)
             buckets[bucket_idx] += energy
             bucket_counts[bucket_idx] += 1
@@ -759,7 +751,14 @@ class ArrangementServiceImpl(ArrangementService):
 
     async def suggest_section_lengths(self, genre: str, song_length: float) -> dict[str, float]:
         """Suggest optimal section lengths for a genre."""
-        if genre.lower() == "pop":
+        # Copy so callers cannot mutate the memoized template
+        return dict(self._section_lengths(genre.lower()))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _section_lengths(genre_lower: str) -> dict[str, float]:
+        """Build the section length template, memoized per genre."""
+        if genre_lower == "pop":
             return {
                 "intro": 8.0,
                 "verse": 16.0,
@@ -767,7 +766,7 @@ class ArrangementServiceImpl(ArrangementService):
                 "bridge": 8.0,
                 "outro": 8.0,
             }
-        elif genre.lower() in ["electronic", "house"]:
+        elif genre_lower in ["electronic", "house"]:
             return {
                 "intro": 32.0,
                 "build": 32.0,
@@ -788,6 +787,26 @@ class ArrangementServiceImpl(ArrangementService):
 class MixingServiceImpl(MixingService):
     """Implementation of mixing service."""
 
+    # Streaming platform loudness targets (LUFS)
+    PLATFORM_LUFS_TARGETS: dict[str, int] = {
+        "spotify": -14,
+        "apple_music": -16,
+        "youtube": -14,
+        "tidal": -14,
+        "soundcloud": -12,
+        "bandcamp": -16,
+    }
+
+    # Genre loudness adjustments (LU)
+    GENRE_LUFS_ADJUSTMENTS: dict[str, int] = {
+        "electronic": 1,  # Slightly louder
+        "hip_hop": 1,
+        "pop": 0,
+        "rock": 0,
+        "jazz": -2,  # More dynamic range
+        "classical": -6,  # Much more dynamic range
+    }
+
     # Track name keywords mapped to frequency ranges
     FREQUENCY_KEYWORDS: dict[str, dict[str, Any]] = {
         "sub_bass": {
@@ -1040,31 +1059,17 @@ class MixingServiceImpl(MixingService):
 
     async def calculate_lufs_target(self, genre: str, platform: str) -> tuple[float, float]:
         """Calculate target LUFS and peak levels for genre/platform."""
-        # Streaming platform targets
-        platform_targets = {
-            "spotify": -14,
-            "apple_music": -16,
-            "youtube": -14,
-            "tidal": -14,
-            "soundcloud": -12,
-            "bandcamp": -16,
-        }
-
-        # Genre adjustments
-        genre_adjustments = {
-            "electronic": 1,  # Slightly louder
-            "hip_hop": 1,
-            "pop": 0,
-            "rock": 0,
-            "jazz": -2,  # More dynamic range
-            "classical": -6,  # Much more dynamic range
-        }
-
-        base_lufs = platform_targets.get(platform.lower(), -14)
-        genre_adj = genre_adjustments.get(genre.lower(), 0)
+        return self._lufs_target(genre.lower(), platform.lower())
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _lufs_target(genre_lower: str, platform_lower: str) -> tuple[float, float]:
+        """Compute LUFS and peak targets, memoized per (genre, platform)."""
+        base_lufs = MixingServiceImpl.PLATFORM_LUFS_TARGETS.get(platform_lower, -14)
+        genre_adj = MixingServiceImpl.GENRE_LUFS_ADJUSTMENTS.get(genre_lower, 0)
         target_lufs = base_lufs + genre_adj
 
         # True peak should be at least -1 dBFS, more for genres needing headroom
-        target_peak = -3.0 if genre.lower() in ["jazz", "classical"] else -1.0
+        target_peak = -3.0 if genre_lower in ["jazz", "classical"] else -1.0
 
         return target_lufs, target_peak
@@ -1,11 +1,13 @@
 """Pytest configuration and shared fixtures."""
 
 import asyncio
-from collections.abc import Generator
+import os
+from collections.abc import Callable
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from dependency_injector import containers, providers
+from hypothesis import HealthCheck, Phase, settings
 
 from ableton_mcp.adapters.service_adapters import (
     AbletonClipService,
@@ -40,6 +42,23 @@ from ableton_mcp.infrastructure.repositories import (
 )
 from ableton_mcp.infrastructure.services import MusicTheoryServiceImpl
 
+# Hypothesis profiles: "dev" (default) is reproducible and skips shrinking and the
+# example database, "fast" is the smallest budget, "ci" restores the full budget
+# with every phase. Select with HYPOTHESIS_PROFILE=<name>.
+settings.register_profile(
+    "fast", max_examples=15, deadline=None, suppress_health_check=[HealthCheck.too_slow]
+)
+settings.register_profile(
+    "dev",
+    max_examples=25,
+    deadline=200,
+    derandomize=True,
+    database=None,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+settings.register_profile("ci", max_examples=50, deadline=2000)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
 
 def create_mock_gateway() -> Mock:
     """Create a mock gateway with all async methods set up."""
@@ -84,6 +103,7 @@ def create_mock_gateway() -> Mock:
     mock.create_clip = AsyncMock()
     mock.delete_clip = AsyncMock()
     mock.add_note = AsyncMock()
+    mock.add_notes = AsyncMock()
     mock.remove_notes = AsyncMock()
     mock.get_clip_notes = AsyncMock(return_value=[])
 
@@ -149,12 +169,16 @@ class TestContainer(containers.DeclarativeContainer):
     )
 
 
-@pytest.fixture
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture
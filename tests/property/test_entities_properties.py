@@ -289,6 +289,12 @@ class TestMusicKeyProperties:
         for note in key.scale_notes:
             assert 0 <= note <= 11
 
+    @given(root=pitch_class, mode=st.sampled_from(["major", "minor", "dorian"]))
+    def test_scale_set_matches_scale_notes(self, root: int, mode: str) -> None:
+        """Property: scale_set holds exactly the scale notes."""
+        key = MusicKey(root=root, mode=mode)
+        assert key.scale_set == frozenset(key.scale_notes)
+
 
 # =============================================================================
 # Parameter Tests
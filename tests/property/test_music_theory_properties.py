@@ -2,19 +2,14 @@
 
 These tests verify that music theory operations maintain mathematical
 properties and musical invariants regardless of input.
-
-NOTE: Some tests are skipped due to MusicTheoryServiceImpl API changes.
 """
 
+from itertools import pairwise
+
 import pytest
-from hypothesis import given, settings
+from hypothesis import assume, example, given, settings, target
 from hypothesis import strategies as st
 
-# Skip tests that don't match current API
-pytestmark = pytest.mark.skip(
-    reason="Property tests need updates to match current MusicTheoryServiceImpl API"
-)
-
 from ableton_mcp.domain.entities import MusicKey, Note
 from ableton_mcp.infrastructure.services import MusicTheoryServiceImpl
 
@@ -25,6 +20,8 @@ from ableton_mcp.infrastructure.services import MusicTheoryServiceImpl
 midi_pitch = st.integers(min_value=0, max_value=127)
 pitch_class = st.integers(min_value=0, max_value=11)
 valid_mode = st.sampled_from(["major", "minor", "dorian", "phrygian", "lydian", "mixolydian"])
+# Modes for which MusicKey defines a scale
+scale_mode = st.sampled_from(["major", "minor"])
 valid_genre = st.sampled_from(["pop", "jazz", "rock", "electronic", "classical"])
 
 note_strategy = st.builds(
@@ -35,10 +32,24 @@ note_strategy = st.builds(
     velocity=st.integers(min_value=1, max_value=127),
 )
 
+# Composite strategies shared across tests
+note_lists = st.lists(note_strategy, min_size=1, max_size=100)
+pitch_lists = st.lists(midi_pitch, min_size=1, max_size=20)
+scale_base_pitch = st.integers(min_value=24, max_value=96)
+major_intervals = st.lists(st.sampled_from((0, 2, 4, 5, 7, 9, 11)), min_size=4, max_size=7)
+beat_time = st.floats(min_value=0.0, max_value=1000.0, allow_nan=False, allow_infinity=False)
+grid_beats = st.sampled_from((0.0625, 0.125, 0.25, 0.5, 1.0))
+
+
+def _circular_distance(a: int, b: int) -> int:
+    """Distance between two pitch classes around the 12-tone circle."""
+    d = (a - b) % 12
+    return d if d < 6 else 12 - d
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def music_service() -> MusicTheoryServiceImpl:
-    """Provide music theory service instance."""
+    """Provide a stateless music theory service shared across all examples."""
     return MusicTheoryServiceImpl()
 
 
@@ -50,47 +61,30 @@ def music_service() -> MusicTheoryServiceImpl:
 class TestKeyAnalysisProperties:
     """Property-based tests for key analysis."""
 
-    @given(notes=st.lists(note_strategy, min_size=1, max_size=100))
-    @settings(max_examples=50)
-    async def test_analyze_key_never_crashes(
+    @given(notes=note_lists)
+    @example(notes=[Note(pitch=0, start=0.0, duration=0.01, velocity=1)])
+    @example(notes=[Note(pitch=127, start=100.0, duration=10.0, velocity=127)])
+    @example(notes=[Note(pitch=p, start=0.0, duration=1.0) for p in range(60, 72)])
+    @example(notes=[Note(pitch=p, start=0.0, duration=1.0) for p in (60, 64, 67)])
+    @example(notes=[Note(pitch=p, start=0.0, duration=1.0) for p in (57, 60, 64)])
+    async def test_analyze_key_invariants(
         self, music_service: MusicTheoryServiceImpl, notes: list[Note]
     ) -> None:
-        """Property: analyze_key should never crash for any valid notes."""
-        result = await music_service.analyze_key(notes)
-        assert isinstance(result, list)
+        """Property: analyze_key never crashes and returns valid, ranked keys.
 
-    @given(notes=st.lists(note_strategy, min_size=1, max_size=50))
-    @settings(max_examples=30)
-    async def test_key_confidence_always_valid(
-        self, music_service: MusicTheoryServiceImpl, notes: list[Note]
-    ) -> None:
-        """Property: Key confidence is always between 0 and 1."""
+        The list type, confidence range and descending order invariants share a
+        single analyze_key call per example.
+        """
         results = await music_service.analyze_key(notes)
+        assert isinstance(results, list)
 
-        for key in results:
-            assert 0.0 <= key.confidence <= 1.0
+        assert all(0.0 <= k.confidence <= 1.0 for k in results)
 
-    @given(notes=st.lists(note_strategy, min_size=3, max_size=30))
-    @settings(max_examples=30)
-    async def test_keys_sorted_by_confidence(
-        self, music_service: MusicTheoryServiceImpl, notes: list[Note]
-    ) -> None:
-        """Property: Results are sorted by confidence (descending)."""
-        results = await music_service.analyze_key(notes)
+        confs = [k.confidence for k in results]
+        assert all(a >= b for a, b in pairwise(confs)), confs
 
-        if len(results) > 1:
-            confidences = [k.confidence for k in results]
-            assert confidences == sorted(confidences, reverse=True)
-
-    @given(
-        base_pitch=st.integers(min_value=24, max_value=96),
-        intervals=st.lists(
-            st.sampled_from([0, 2, 4, 5, 7, 9, 11]),  # Major scale intervals
-            min_size=4,
-            max_size=7,
-        ),
-    )
-    @settings(max_examples=30)
+    @given(base_pitch=scale_base_pitch, intervals=major_intervals)
+    @example(base_pitch=60, intervals=[0, 4, 7, 11])
     async def test_major_scale_notes_detected_as_major(
         self, music_service: MusicTheoryServiceImpl, base_pitch: int, intervals: list[int]
     ) -> None:
@@ -103,6 +97,10 @@ class TestKeyAnalysisProperties:
 
         results = await music_service.analyze_key(notes)
 
+        # Steer generation toward weak or empty analyses, where misclassification lives
+        target(-(results[0].confidence if results else 0.0), label="top_confidence")
+        target(-len(results), label="num_keys")
+
         # At least one major key should be in the top results
         if results:
             modes_in_top_5 = [k.mode for k in results[:5]]
@@ -130,12 +128,10 @@ class TestScaleOperationsProperties:
         expected_intervals = [2, 2, 1, 2, 2, 2, 1]
 
         if len(scale) == 7:
-            actual_intervals = []
-            for i in range(len(scale) - 1):
-                interval = (scale[i + 1] - scale[i]) % 12
-                actual_intervals.append(interval)
-            # Add interval from last note back to root
-            actual_intervals.append((12 - scale[-1] + scale[0]) % 12)
+            # Step between neighbours, wrapping from the last degree back to the root
+            actual_intervals = [
+                (b - a) % 12 for a, b in zip(scale, scale[1:] + scale[:1], strict=True)
+            ]
 
             assert actual_intervals == expected_intervals
 
@@ -151,24 +147,20 @@ class TestScaleOperationsProperties:
         expected_intervals = [2, 1, 2, 2, 1, 2, 2]
 
         if len(scale) == 7:
-            actual_intervals = []
-            for i in range(len(scale) - 1):
-                interval = (scale[i + 1] - scale[i]) % 12
-                actual_intervals.append(interval)
-            actual_intervals.append((12 - scale[-1] + scale[0]) % 12)
+            # Step between neighbours, wrapping from the last degree back to the root
+            actual_intervals = [
+                (b - a) % 12 for a, b in zip(scale, scale[1:] + scale[:1], strict=True)
+            ]
 
             assert actual_intervals == expected_intervals
 
-    @given(root=pitch_class, mode=valid_mode)
+    @given(root=pitch_class, mode=scale_mode)
     async def test_scale_contains_root(
         self, music_service: MusicTheoryServiceImpl, root: int, mode: str
     ) -> None:
         """Property: Every scale contains its root note."""
         key = MusicKey(root=root, mode=mode)
-        scale = key.scale_notes
-
-        if scale:  # Only test if scale is defined for this mode
-            assert root in scale
+        assert root in key.scale_set
 
 
 # =============================================================================
@@ -185,34 +177,27 @@ class TestChordProgressionProperties:
         self, music_service: MusicTheoryServiceImpl, root: int, mode: str, genre: str
     ) -> None:
         """Property: Valid inputs always produce some progression suggestions."""
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        root_name = note_names[root]
+        key = MusicKey(root=root, mode=mode)
 
-        result = await music_service.suggest_progressions(root_name, mode, genre)
+        result = await music_service.suggest_chord_progressions(key, genre)
 
         # Should return at least one progression for valid inputs
         assert isinstance(result, list)
+        assert result
 
     @given(root=pitch_class, mode=valid_mode)
     @settings(max_examples=20)
     async def test_progressions_contain_tonic(
         self, music_service: MusicTheoryServiceImpl, root: int, mode: str
     ) -> None:
-        """Property: Most chord progressions should reference the tonic chord."""
-        note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-        root_name = note_names[root]
-
-        result = await music_service.suggest_progressions(root_name, mode, "pop")
+        """Property: At least one chord progression references the tonic chord."""
+        # Progressions are chord roots as pitch classes, so the tonic is the key root
+        key = MusicKey(root=root, mode=mode)
 
-        if result:
-            # At least one progression should contain the tonic (I or i)
-            for progression in result:
-                chords = progression.get("chords", [])
-                if any("I" in str(c).upper() or root_name in str(c) for c in chords):
-                    break
+        result = await music_service.suggest_chord_progressions(key, "pop")
 
-            # This is a soft assertion - most progressions include tonic
-            # but we won't fail if they don't
+        assume(result)
+        assert any(root in progression for progression in result), result
 
 
 # =============================================================================
@@ -223,33 +208,29 @@ class TestChordProgressionProperties:
 class TestQuantizationProperties:
     """Property-based tests for note quantization."""
 
-    @given(
-        time=st.floats(min_value=0.0, max_value=1000.0, allow_nan=False, allow_infinity=False),
-        grid=st.sampled_from([0.0625, 0.125, 0.25, 0.5, 1.0]),
-    )
+    @given(time=beat_time, grid=grid_beats)
     async def test_quantized_time_on_grid(
         self, music_service: MusicTheoryServiceImpl, time: float, grid: float
     ) -> None:
         """Property: Quantized time is always on the grid."""
-        quantized = round(time / grid) * grid
+        note = Note(pitch=60, start=time, duration=1.0, velocity=100)
+        (quantized,) = await music_service.quantize_notes([note], grid)
 
-        # Check that quantized time is a multiple of grid
-        remainder = quantized % grid
-        assert abs(remainder) < 0.0001 or abs(remainder - grid) < 0.0001
+        # Grids are powers of two, so scaling by ticks per beat is exact
+        denom = round(1 / grid)
+        assert round(quantized.start * denom) == quantized.start * denom
 
-    @given(
-        time=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-        grid=st.sampled_from([0.125, 0.25, 0.5, 1.0]),
-    )
+    @given(time=beat_time, grid=grid_beats)
     async def test_quantization_moves_to_nearest(
         self, music_service: MusicTheoryServiceImpl, time: float, grid: float
     ) -> None:
         """Property: Quantization moves time to nearest grid point."""
-        quantized = round(time / grid) * grid
+        note = Note(pitch=60, start=time, duration=1.0, velocity=100)
+        (quantized,) = await music_service.quantize_notes([note], grid)
 
-        # Distance to quantized point should be <= half grid
-        distance = abs(time - quantized)
-        assert distance <= grid / 2 + 0.0001
+        # Distance to quantized point should be <= half a grid tick
+        denom = round(1 / grid)
+        assert abs(time * denom - quantized.start * denom) <= 0.5
 
 
 # =============================================================================
@@ -266,31 +247,25 @@ class TestScaleFilteringProperties:
     ) -> None:
         """Property: Filtered pitch is always in the target scale."""
         key = MusicKey(root=root, mode="major")
-        scale_pitches = key.scale_notes
-
-        if scale_pitches:
-            # Filter to nearest scale pitch
-            pitch_class = pitch % 12
-            if pitch_class not in scale_pitches:
-                # Find nearest scale pitch
-                distances = [(abs(pitch_class - sp) % 12, sp) for sp in scale_pitches]
-                nearest = min(distances, key=lambda x: x[0])[1]
-                filtered_pitch_class = nearest
-            else:
-                filtered_pitch_class = pitch_class
-
-            assert filtered_pitch_class in scale_pitches
-
-    @given(pitches=st.lists(midi_pitch, min_size=1, max_size=20), root=pitch_class)
+        note = Note(pitch=pitch, start=0.0, duration=1.0, velocity=100)
+
+        (filtered,) = await music_service.filter_notes_to_scale([note], key)
+
+        assert filtered.pitch % 12 in key.scale_set
+        # Major scale steps are at most a whole tone apart
+        assert _circular_distance(pitch % 12, filtered.pitch % 12) <= 1
+
+    @given(pitches=pitch_lists, root=pitch_class)
     async def test_all_filtered_pitches_diatonic(
         self, music_service: MusicTheoryServiceImpl, pitches: list[int], root: int
     ) -> None:
         """Property: All filtered pitches should be diatonic to the scale."""
         key = MusicKey(root=root, mode="major")
-        scale_pitches = set(key.scale_notes)
+        notes = [Note(pitch=pitch, start=0.0, duration=1.0, velocity=100) for pitch in pitches]
+
+        filtered = await music_service.filter_notes_to_scale(notes, key)
 
-        if scale_pitches:
-            for pitch in pitches:
-                pitch % 12
-                # After filtering, pitch class should be in scale
-                # (actual filtering implementation would need to be tested)
+        assert len(filtered) == len(notes)
+        for inp, out in zip(notes, filtered, strict=True):
+            assert out.pitch % 12 in key.scale_set
+            assert _circular_distance(inp.pitch % 12, out.pitch % 12) <= 1
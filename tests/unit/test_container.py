@@ -1,7 +1,49 @@
 """Unit tests for dependency injection container."""
 
+from operator import attrgetter
+
+import pytest
+
 from ableton_mcp.container import Container
 
+PROVIDERS = [
+    # Gateway
+    "ableton_gateway",
+    # Repositories
+    "song_repository",
+    "clip_repository",
+    "track_repository",
+    # Services
+    "music_theory_service",
+    "tempo_analysis_service",
+    "arrangement_service",
+    "mixing_service",
+    # Adapters
+    "connection_service",
+    "transport_service",
+    "track_service",
+    "clip_service",
+    # Use cases
+    "connect_use_case",
+    "transport_use_case",
+    "song_info_use_case",
+    "track_ops_use_case",
+    "add_notes_use_case",
+    "harmony_analysis_use_case",
+    "tempo_analysis_use_case",
+    "mix_analysis_use_case",
+    "arrangement_suggestions_use_case",
+    "clip_content_use_case",
+    # MCP server
+    "mcp_server",
+]
+
+
+@pytest.fixture(scope="module")
+def container() -> Container:
+    """Provide a container shared by the read-only provider checks."""
+    return Container()
+
 
 class TestContainer:
     """Tests for DI container configuration."""
@@ -11,53 +53,10 @@ class TestContainer:
         container = Container()
         assert container is not None
 
-    def test_gateway_provider(self) -> None:
-        """Test gateway provider is configured."""
-        container = Container()
-        # Gateway should be a singleton provider
-        assert container.ableton_gateway is not None
-
-    def test_repository_providers(self) -> None:
-        """Test repository providers are configured."""
-        container = Container()
-        assert container.song_repository is not None
-        assert container.clip_repository is not None
-        assert container.track_repository is not None
-
-    def test_service_providers(self) -> None:
-        """Test service providers are configured."""
-        container = Container()
-        assert container.music_theory_service is not None
-        assert container.tempo_analysis_service is not None
-        assert container.arrangement_service is not None
-        assert container.mixing_service is not None
-
-    def test_adapter_providers(self) -> None:
-        """Test adapter providers are configured."""
-        container = Container()
-        assert container.connection_service is not None
-        assert container.transport_service is not None
-        assert container.track_service is not None
-        assert container.clip_service is not None
-
-    def test_use_case_providers(self) -> None:
-        """Test use case providers are configured."""
-        container = Container()
-        assert container.connect_use_case is not None
-        assert container.transport_use_case is not None
-        assert container.song_info_use_case is not None
-        assert container.track_ops_use_case is not None
-        assert container.add_notes_use_case is not None
-        assert container.harmony_analysis_use_case is not None
-        assert container.tempo_analysis_use_case is not None
-        assert container.mix_analysis_use_case is not None
-        assert container.arrangement_suggestions_use_case is not None
-        assert container.clip_content_use_case is not None
-
-    def test_mcp_server_provider(self) -> None:
-        """Test MCP server provider is configured."""
-        container = Container()
-        assert container.mcp_server is not None
+    @pytest.mark.parametrize("name", PROVIDERS)
+    def test_provider_configured(self, container: Container, name: str) -> None:
+        """Test each provider is configured."""
+        assert attrgetter(name)(container) is not None
 
     def test_singleton_behavior(self) -> None:
         """Test that singletons return same instance."""
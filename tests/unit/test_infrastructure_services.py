@@ -18,17 +18,33 @@ from ableton_mcp.infrastructure.services import (
 )
 
 
+@pytest.fixture(scope="module")
+def many_track_song() -> Song:
+    """Create a 25-track song once for the module (read-only)."""
+    return Song(
+        id=EntityId("song-1"),
+        name="Complex Song",
+        tempo=120.0,
+        tracks=[
+            Track(id=EntityId(f"track-{i}"), name=f"Track {i}", track_type=TrackType.MIDI)
+            for i in range(25)
+        ],
+    )
+
+
 class TestTempoAnalysisServiceImpl:
     """Tests for TempoAnalysisServiceImpl."""
 
-    @pytest.fixture
-    def service(self) -> TempoAnalysisServiceImpl:
-        """Provide tempo analysis service instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls) -> TempoAnalysisServiceImpl:
+        """Provide a stateless tempo analysis service instance shared by the class."""
         return TempoAnalysisServiceImpl()
 
-    @pytest.fixture
-    def sample_clip(self) -> Clip:
-        """Create a sample clip."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_clip(cls) -> Clip:
+        """Create a sample clip shared by the class (read-only)."""
         return Clip(
             id=EntityId("clip-1"),
             name="Test Clip",
@@ -41,9 +57,10 @@ class TestTempoAnalysisServiceImpl:
             ],
         )
 
-    @pytest.fixture
-    def sample_song(self) -> Song:
-        """Create a sample song."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_song(cls) -> Song:
+        """Create a sample song shared by the class (read-only)."""
         return Song(
             id=EntityId("song-1"),
             name="Test Song",
@@ -82,29 +99,26 @@ class TestTempoAnalysisServiceImpl:
         tempo = await service.detect_tempo(audio_clip)
         assert tempo == 120.0  # Cannot analyze audio
 
-    async def test_suggest_tempo_for_genre_house(self, service: TempoAnalysisServiceImpl) -> None:
-        """Test tempo suggestion for house music."""
-        tempo = await service.suggest_tempo_for_genre("house", "medium")
-        assert 120 <= tempo <= 130
-
-    async def test_suggest_tempo_for_genre_hip_hop_low(
-        self, service: TempoAnalysisServiceImpl
+    @pytest.mark.parametrize(
+        ("genre", "energy_level", "low", "high"),
+        [
+            ("house", "medium", 120, 130),
+            ("hip_hop", "low", 70, 80),
+            ("techno", "high", 125, 135),
+            ("unknown_genre", "medium", 120, 120),  # Unknown genres default to 120
+        ],
+    )
+    async def test_suggest_tempo_for_genre(
+        self,
+        service: TempoAnalysisServiceImpl,
+        genre: str,
+        energy_level: str,
+        low: float,
+        high: float,
     ) -> None:
-        """Test tempo suggestion for hip hop with low energy."""
-        tempo = await service.suggest_tempo_for_genre("hip_hop", "low")
-        assert 70 <= tempo <= 80
-
-    async def test_suggest_tempo_for_genre_high_energy(
-        self, service: TempoAnalysisServiceImpl
-    ) -> None:
-        """Test tempo suggestion with high energy."""
-        tempo = await service.suggest_tempo_for_genre("techno", "high")
-        assert 125 <= tempo <= 135
-
-    async def test_suggest_tempo_for_unknown_genre(self, service: TempoAnalysisServiceImpl) -> None:
-        """Test tempo suggestion for unknown genre defaults to 120."""
-        tempo = await service.suggest_tempo_for_genre("unknown_genre", "medium")
-        assert tempo == 120.0
+        """Test tempo suggestion lands in the genre's range for the energy level."""
+        tempo = await service.suggest_tempo_for_genre(genre, energy_level)
+        assert low <= tempo <= high
 
     async def test_analyze_rhythmic_patterns(
         self, service: TempoAnalysisServiceImpl, sample_clip: Clip
@@ -127,11 +141,10 @@ class TestTempoAnalysisServiceImpl:
 
         assert len(suggestions) == 5
 
-        # Verify structure of suggestions
-        for time_pos, tempo in suggestions:
-            assert isinstance(time_pos, float)
-            assert isinstance(tempo, float)
-            assert 60.0 <= tempo <= 200.0
+        # Verify structure of suggestions column-wise
+        times, tempos = zip(*suggestions, strict=True)
+        assert all(isinstance(value, float) for value in times + tempos)
+        assert 60.0 <= min(tempos) <= max(tempos) <= 200.0
 
     async def test_suggest_tempo_changes_extreme_energy(
         self, service: TempoAnalysisServiceImpl, sample_song: Song
@@ -142,21 +155,23 @@ class TestTempoAnalysisServiceImpl:
         suggestions = await service.suggest_tempo_changes(sample_song, target_energy)
 
         # Check clamping to reasonable range
-        for _, tempo in suggestions:
-            assert 60.0 <= tempo <= 200.0
+        tempos = [tempo for _, tempo in suggestions]
+        assert 60.0 <= min(tempos) <= max(tempos) <= 200.0
 
 
 class TestArrangementServiceImpl:
     """Tests for ArrangementServiceImpl."""
 
-    @pytest.fixture
-    def service(self) -> ArrangementServiceImpl:
-        """Provide arrangement service instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls) -> ArrangementServiceImpl:
+        """Provide a stateless arrangement service instance shared by the class."""
         return ArrangementServiceImpl()
 
-    @pytest.fixture
-    def sample_song(self) -> Song:
-        """Create a sample song."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_song(cls) -> Song:
+        """Create a sample song shared by the class (read-only)."""
         return Song(
             id=EntityId("song-1"),
             name="Test Song",
@@ -251,22 +266,10 @@ class TestArrangementServiceImpl:
         assert len(suggestions) > 0
 
     async def test_suggest_arrangement_improvements_many_tracks(
-        self, service: ArrangementServiceImpl
+        self, service: ArrangementServiceImpl, many_track_song: Song
     ) -> None:
         """Test arrangement suggestions with many tracks."""
-        tracks = [
-            Track(id=EntityId(f"track-{i}"), name=f"Track {i}", track_type=TrackType.MIDI)
-            for i in range(25)
-        ]
-
-        song = Song(
-            id=EntityId("song-1"),
-            name="Complex Song",
-            tempo=120.0,
-            tracks=tracks,
-        )
-
-        suggestions = await service.suggest_arrangement_improvements(song, "rock")
+        suggestions = await service.suggest_arrangement_improvements(many_track_song, "rock")
 
         # Should suggest grouping when too many tracks
         assert any("group" in s.lower() for s in suggestions)
@@ -280,10 +283,9 @@ class TestArrangementServiceImpl:
         # Empty song returns default flat curve
         assert len(energy_points) >= 10
 
-        for time_pos, energy in energy_points:
-            assert isinstance(time_pos, float)
-            assert isinstance(energy, float)
-            assert 0.0 <= energy <= 1.0
+        times, energies = zip(*energy_points, strict=True)
+        assert all(isinstance(value, float) for value in times + energies)
+        assert 0.0 <= min(energies) <= max(energies) <= 1.0
 
     async def test_calculate_energy_curve_with_notes(self, service: ArrangementServiceImpl) -> None:
         """Test energy curve reflects MIDI content."""
@@ -320,54 +322,50 @@ class TestArrangementServiceImpl:
         # At least one point should have non-zero energy
         assert any(e[1] > 0 for e in energy_points)
 
-    async def test_suggest_section_lengths_pop(self, service: ArrangementServiceImpl) -> None:
-        """Test section length suggestions for pop."""
-        sections = await service.suggest_section_lengths("pop", 240.0)
+    @pytest.mark.parametrize(
+        ("genre", "song_length", "expected_sections"),
+        [
+            ("pop", 240.0, {"intro", "verse", "chorus", "bridge", "outro"}),
+            ("electronic", 300.0, {"intro", "build", "drop", "breakdown"}),
+            ("house", 300.0, {"intro", "drop"}),  # Same template as electronic
+            ("unknown_genre", 200.0, {"intro", "verse"}),  # Default template
+        ],
+    )
+    async def test_suggest_section_lengths(
+        self,
+        service: ArrangementServiceImpl,
+        genre: str,
+        song_length: float,
+        expected_sections: set[str],
+    ) -> None:
+        """Test section length suggestions include the genre's sections."""
+        sections = await service.suggest_section_lengths(genre, song_length)
 
-        assert "intro" in sections
-        assert "verse" in sections
-        assert "chorus" in sections
-        assert "bridge" in sections
-        assert "outro" in sections
+        assert expected_sections <= sections.keys()
 
-    async def test_suggest_section_lengths_electronic(
+    async def test_suggest_section_lengths_returns_copy(
         self, service: ArrangementServiceImpl
     ) -> None:
-        """Test section length suggestions for electronic music."""
-        sections = await service.suggest_section_lengths("electronic", 300.0)
-
-        assert "intro" in sections
-        assert "build" in sections
-        assert "drop" in sections
-        assert "breakdown" in sections
-
-    async def test_suggest_section_lengths_house(self, service: ArrangementServiceImpl) -> None:
-        """Test section length suggestions for house music."""
-        sections = await service.suggest_section_lengths("house", 300.0)
-
-        # House uses same template as electronic
-        assert "intro" in sections
-        assert "drop" in sections
-
-    async def test_suggest_section_lengths_default(self, service: ArrangementServiceImpl) -> None:
-        """Test section length suggestions for unknown genre uses default."""
-        sections = await service.suggest_section_lengths("unknown_genre", 200.0)
+        """Test mutating a suggestion does not leak into later calls."""
+        sections = await service.suggest_section_lengths("pop", 240.0)
+        sections["intro"] = 999.0
 
-        assert "intro" in sections
-        assert "verse" in sections
+        assert (await service.suggest_section_lengths("pop", 240.0))["intro"] == 8.0
 
 
 class TestMixingServiceImpl:
     """Tests for MixingServiceImpl."""
 
-    @pytest.fixture
-    def service(self) -> MixingServiceImpl:
-        """Provide mixing service instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls) -> MixingServiceImpl:
+        """Provide a stateless mixing service instance shared by the class."""
         return MixingServiceImpl()
 
-    @pytest.fixture
-    def sample_tracks(self) -> list[Track]:
-        """Create sample tracks."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_tracks(cls) -> list[Track]:
+        """Create sample tracks shared by the class (read-only)."""
         return [
             Track(
                 id=EntityId("track-1"),
@@ -420,9 +418,7 @@ class TestMixingServiceImpl:
         assert len(suggestions) > 0
 
         # Check structure
-        for suggestion in suggestions:
-            assert "frequency" in suggestion
-            assert "type" in suggestion
+        assert all({"frequency", "type"} <= suggestion.keys() for suggestion in suggestions)
 
     async def test_suggest_eq_adjustments_vocal(self, service: MixingServiceImpl) -> None:
         """Test EQ suggestions for vocal track."""
@@ -437,8 +433,7 @@ class TestMixingServiceImpl:
         assert len(suggestions) >= 3  # Should have multiple suggestions for vocals
 
         # Check for typical vocal EQ adjustments
-        frequencies = [s["frequency"] for s in suggestions]
-        assert any(f >= 3000 for f in frequencies)  # Presence boost
+        assert max(s["frequency"] for s in suggestions) >= 3000  # Presence boost
 
     async def test_suggest_eq_adjustments_drums(self, service: MixingServiceImpl) -> None:
         """Test EQ suggestions for drum track."""
@@ -453,8 +448,7 @@ class TestMixingServiceImpl:
         assert len(suggestions) >= 2
 
         # Check for drum-specific EQ
-        frequencies = [s["frequency"] for s in suggestions]
-        assert any(f <= 100 for f in frequencies)  # Sub-bass
+        assert min(s["frequency"] for s in suggestions) <= 100  # Sub-bass
 
     async def test_analyze_stereo_image_balanced(
         self, service: MixingServiceImpl, sample_tracks: list[Track]
@@ -481,52 +475,28 @@ class TestMixingServiceImpl:
 
         assert result.data["balance"] == "unbalanced"
 
-    async def test_calculate_lufs_target_spotify(self, service: MixingServiceImpl) -> None:
-        """Test LUFS target calculation for Spotify."""
-        lufs, peak = await service.calculate_lufs_target("pop", "spotify")
-
-        assert lufs == -14
-        assert peak == -1.0
-
-    async def test_calculate_lufs_target_apple_music(self, service: MixingServiceImpl) -> None:
-        """Test LUFS target calculation for Apple Music."""
-        lufs, peak = await service.calculate_lufs_target("pop", "apple_music")
-
-        assert lufs == -16
-        assert peak == -1.0
-
-    async def test_calculate_lufs_target_electronic(self, service: MixingServiceImpl) -> None:
-        """Test LUFS target for electronic genre."""
-        lufs, _peak = await service.calculate_lufs_target("electronic", "spotify")
-
-        # Electronic gets +1 adjustment
-        assert lufs == -13
-
-    async def test_calculate_lufs_target_jazz(self, service: MixingServiceImpl) -> None:
-        """Test LUFS target for jazz (more dynamic range)."""
-        lufs, peak = await service.calculate_lufs_target("jazz", "spotify")
-
-        # Jazz gets -2 adjustment for more dynamic range
-        assert lufs == -16
-        assert peak == -3.0
-
-    async def test_calculate_lufs_target_classical(self, service: MixingServiceImpl) -> None:
-        """Test LUFS target for classical (most dynamic range)."""
-        lufs, peak = await service.calculate_lufs_target("classical", "spotify")
-
-        # Classical gets -6 adjustment
-        assert lufs == -20
-        assert peak == -3.0
-
-    async def test_calculate_lufs_target_unknown_platform(self, service: MixingServiceImpl) -> None:
-        """Test LUFS target for unknown platform defaults to -14."""
-        lufs, _peak = await service.calculate_lufs_target("pop", "unknown_platform")
-
-        assert lufs == -14
-
-    async def test_calculate_lufs_target_hip_hop(self, service: MixingServiceImpl) -> None:
-        """Test LUFS target for hip hop."""
-        lufs, _peak = await service.calculate_lufs_target("hip_hop", "spotify")
+    @pytest.mark.parametrize(
+        ("genre", "platform", "expected_lufs", "expected_peak"),
+        [
+            ("pop", "spotify", -14, -1.0),
+            ("pop", "apple_music", -16, -1.0),
+            ("electronic", "spotify", -13, -1.0),  # +1 adjustment
+            ("jazz", "spotify", -16, -3.0),  # -2 adjustment for more dynamic range
+            ("classical", "spotify", -20, -3.0),  # -6 adjustment
+            ("pop", "unknown_platform", -14, -1.0),  # Unknown platforms default to -14
+            ("hip_hop", "spotify", -13, -1.0),  # +1 adjustment
+        ],
+    )
+    async def test_calculate_lufs_target(
+        self,
+        service: MixingServiceImpl,
+        genre: str,
+        platform: str,
+        expected_lufs: float,
+        expected_peak: float,
+    ) -> None:
+        """Test LUFS and true-peak targets per genre and platform."""
+        lufs, peak = await service.calculate_lufs_target(genre, platform)
 
-        # Hip hop gets +1 adjustment
-        assert lufs == -13
+        assert lufs == expected_lufs
+        assert peak == expected_peak
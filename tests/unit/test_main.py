@@ -1,8 +1,14 @@
 """Unit tests for main application entry point."""
 
-from unittest.mock import AsyncMock, Mock, patch
+import sys
+from collections.abc import Coroutine, Iterator
+from typing import Any
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
-from ableton_mcp.main import cli, display_banner, main
+import pytest
+
+from ableton_mcp.core.exceptions import AbletonMCPError
+from ableton_mcp.main import _loop_factory, cli, display_banner, main
 
 
 class TestDisplayBanner:
@@ -28,137 +34,98 @@ class TestDisplayBanner:
 class TestMain:
     """Tests for main async entry point."""
 
-    @patch("ableton_mcp.main.Container")
-    @patch("ableton_mcp.main.setup_logging")
-    @patch("ableton_mcp.main.get_logger")
-    @patch("ableton_mcp.main.display_banner")
-    async def test_main_initializes_components(
-        self,
-        mock_display_banner: Mock,
-        mock_get_logger: Mock,
-        mock_setup_logging: Mock,
-        mock_container_class: Mock,
-    ) -> None:
+    @pytest.fixture
+    def main_mocks(self) -> Iterator[dict[str, Any]]:
+        """Patch main's collaborators once and expose the mocks by name."""
+        with patch.multiple(
+            "ableton_mcp.main",
+            Container=DEFAULT,
+            setup_logging=DEFAULT,
+            get_logger=DEFAULT,
+            display_banner=DEFAULT,
+            sys=DEFAULT,
+        ) as mocks:
+            mocks["run"] = AsyncMock()
+            mocks["Container"].return_value.mcp_server.return_value.run = mocks["run"]
+            yield mocks
+
+    async def test_main_initializes_components(self, main_mocks: dict[str, Any]) -> None:
         """Test that main initializes all components."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        mock_container = Mock()
-        mock_mcp_server = Mock()
-        mock_mcp_server.run = AsyncMock()
-        mock_container.mcp_server.return_value = mock_mcp_server
-        mock_container_class.return_value = mock_container
-
         await main()
 
-        mock_setup_logging.assert_called_once()
-        mock_display_banner.assert_called_once()
-        mock_container_class.assert_called_once()
-        mock_mcp_server.run.assert_awaited_once()
+        main_mocks["setup_logging"].assert_called_once()
+        main_mocks["display_banner"].assert_called_once()
+        main_mocks["Container"].assert_called_once()
+        main_mocks["run"].assert_awaited_once()
 
-    @patch("ableton_mcp.main.Container")
-    @patch("ableton_mcp.main.setup_logging")
-    @patch("ableton_mcp.main.get_logger")
-    @patch("ableton_mcp.main.display_banner")
-    @patch("ableton_mcp.main.sys.exit")
-    async def test_main_handles_keyboard_interrupt(
-        self,
-        mock_exit: Mock,
-        mock_display_banner: Mock,
-        mock_get_logger: Mock,
-        mock_setup_logging: Mock,
-        mock_container_class: Mock,
-    ) -> None:
+    async def test_main_handles_keyboard_interrupt(self, main_mocks: dict[str, Any]) -> None:
         """Test that main handles KeyboardInterrupt gracefully."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        mock_container = Mock()
-        mock_mcp_server = Mock()
-        mock_mcp_server.run = AsyncMock(side_effect=KeyboardInterrupt())
-        mock_container.mcp_server.return_value = mock_mcp_server
-        mock_container_class.return_value = mock_container
+        main_mocks["run"].side_effect = KeyboardInterrupt()
 
         await main()
 
-        mock_exit.assert_called_once_with(0)
-        mock_logger.info.assert_called()
+        main_mocks["sys"].exit.assert_called_once_with(0)
+        main_mocks["get_logger"].return_value.info.assert_called()
 
-    @patch("ableton_mcp.main.Container")
-    @patch("ableton_mcp.main.setup_logging")
-    @patch("ableton_mcp.main.get_logger")
-    @patch("ableton_mcp.main.display_banner")
-    @patch("ableton_mcp.main.sys.exit")
-    async def test_main_handles_ableton_error(
-        self,
-        mock_exit: Mock,
-        mock_display_banner: Mock,
-        mock_get_logger: Mock,
-        mock_setup_logging: Mock,
-        mock_container_class: Mock,
-    ) -> None:
+    async def test_main_handles_ableton_error(self, main_mocks: dict[str, Any]) -> None:
         """Test that main handles AbletonMCPError."""
-        from ableton_mcp.core.exceptions import AbletonMCPError
-
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        mock_container = Mock()
-        mock_mcp_server = Mock()
-        mock_mcp_server.run = AsyncMock(side_effect=AbletonMCPError("Test error", "TEST_CODE"))
-        mock_container.mcp_server.return_value = mock_mcp_server
-        mock_container_class.return_value = mock_container
+        main_mocks["run"].side_effect = AbletonMCPError("Test error", "TEST_CODE")
 
         await main()
 
-        mock_exit.assert_called_once_with(1)
-        mock_logger.error.assert_called()
+        main_mocks["sys"].exit.assert_called_once_with(1)
+        main_mocks["get_logger"].return_value.error.assert_called()
 
-    @patch("ableton_mcp.main.Container")
-    @patch("ableton_mcp.main.setup_logging")
-    @patch("ableton_mcp.main.get_logger")
-    @patch("ableton_mcp.main.display_banner")
-    @patch("ableton_mcp.main.sys.exit")
-    async def test_main_handles_unexpected_error(
-        self,
-        mock_exit: Mock,
-        mock_display_banner: Mock,
-        mock_get_logger: Mock,
-        mock_setup_logging: Mock,
-        mock_container_class: Mock,
-    ) -> None:
+    async def test_main_handles_unexpected_error(self, main_mocks: dict[str, Any]) -> None:
         """Test that main handles unexpected exceptions."""
-        mock_logger = Mock()
-        mock_get_logger.return_value = mock_logger
-
-        mock_container = Mock()
-        mock_mcp_server = Mock()
-        mock_mcp_server.run = AsyncMock(side_effect=RuntimeError("Unexpected"))
-        mock_container.mcp_server.return_value = mock_mcp_server
-        mock_container_class.return_value = mock_container
+        main_mocks["run"].side_effect = RuntimeError("Unexpected")
 
         await main()
 
-        mock_exit.assert_called_once_with(1)
+        main_mocks["sys"].exit.assert_called_once_with(1)
 
 
 class TestCli:
     """Tests for CLI entry point."""
 
-    @patch("ableton_mcp.main.asyncio.run")
-    def test_cli_calls_asyncio_run(self, mock_asyncio_run: Mock) -> None:
-        """Test that cli() calls asyncio.run with main."""
+    @patch("ableton_mcp.main.asyncio.Runner")
+    def test_cli_runs_main(self, mock_runner: Mock) -> None:
+        """Test that cli() runs main on an asyncio.Runner."""
+        run = mock_runner.return_value.__enter__.return_value.run
+        run.side_effect = lambda coro: coro.close()
+
+        cli()
+
+        run.assert_called_once()
+
+    @patch("ableton_mcp.main.asyncio.Runner")
+    def test_cli_uses_uvloop_when_available(self, mock_runner: Mock) -> None:
+        """Test that cli() passes uvloop's loop factory when it is installed."""
+        uvloop = pytest.importorskip("uvloop")
+        mock_runner.return_value.__enter__.return_value.run.side_effect = lambda coro: coro.close()
+
         cli()
-        mock_asyncio_run.assert_called_once()
 
-    @patch("ableton_mcp.main.asyncio.run")
+        mock_runner.assert_called_once_with(loop_factory=uvloop.new_event_loop)
+
+    def test_loop_factory_falls_back_without_uvloop(self) -> None:
+        """Test that the default event loop is used when uvloop is not installed."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert _loop_factory() is None
+
+    @patch("ableton_mcp.main.asyncio.Runner")
     @patch("ableton_mcp.main.sys.exit")
     @patch("builtins.print")
     def test_cli_handles_keyboard_interrupt(
-        self, mock_print: Mock, mock_exit: Mock, mock_asyncio_run: Mock
+        self, mock_print: Mock, mock_exit: Mock, mock_runner: Mock
     ) -> None:
         """Test that cli() handles KeyboardInterrupt."""
-        mock_asyncio_run.side_effect = KeyboardInterrupt()
+
+        def interrupt(coro: Coroutine[Any, Any, None]) -> None:
+            coro.close()
+            raise KeyboardInterrupt
+
+        mock_runner.return_value.__enter__.return_value.run.side_effect = interrupt
 
         cli()
 
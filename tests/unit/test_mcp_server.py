@@ -1,39 +1,58 @@
 """Unit tests for MCP server implementation."""
 
-from unittest.mock import AsyncMock, Mock
+from collections.abc import Awaitable, Callable
+from types import SimpleNamespace
+from typing import Any, Final
 
+import mcp.types as types
 import pytest
-
-from ableton_mcp.application.use_cases import UseCaseResult
+from pytest_mock import MockerFixture
+
+from ableton_mcp.application.use_cases import (
+    AnalyzeHarmonyRequest,
+    ConnectToAbletonRequest,
+    TransportControlRequest,
+    UseCaseResult,
+)
 from ableton_mcp.interfaces.mcp_server import AbletonMCPServer
 
+USE_CASE_NAMES = (
+    "connect_use_case",
+    "transport_use_case",
+    "song_info_use_case",
+    "track_ops_use_case",
+    "add_notes_use_case",
+    "harmony_analysis_use_case",
+    "tempo_analysis_use_case",
+    "mix_analysis_use_case",
+    "arrangement_suggestions_use_case",
+    "clip_content_use_case",
+    "refresh_song_data_use_case",
+    "scene_ops_use_case",
+    "song_property_use_case",
+    "clip_ops_use_case",
+    "return_track_ops_use_case",
+    "device_ops_use_case",
+)
+
+
+SUCCESS_RESULT: Final = UseCaseResult(success=True)
+
+
+async def _succeed(request: object) -> UseCaseResult:
+    """Default stub execute: report success without touching Ableton."""
+    return SUCCESS_RESULT
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_use_cases() -> dict:
-    """Create mock use cases for testing."""
-    return {
-        "connect_use_case": Mock(),
-        "transport_use_case": Mock(),
-        "song_info_use_case": Mock(),
-        "track_ops_use_case": Mock(),
-        "add_notes_use_case": Mock(),
-        "harmony_analysis_use_case": Mock(),
-        "tempo_analysis_use_case": Mock(),
-        "mix_analysis_use_case": Mock(),
-        "arrangement_suggestions_use_case": Mock(),
-        "clip_content_use_case": Mock(),
-        "refresh_song_data_use_case": Mock(),
-        "scene_ops_use_case": Mock(),
-        "song_property_use_case": Mock(),
-        "clip_ops_use_case": Mock(),
-        "return_track_ops_use_case": Mock(),
-        "device_ops_use_case": Mock(),
-    }
-
-
-@pytest.fixture
+    """Create stub use cases shared by the session (patch, never reassign, attributes)."""
+    return {name: SimpleNamespace(execute=_succeed) for name in USE_CASE_NAMES}
+
+
+@pytest.fixture(scope="session")
 def mcp_server(mock_use_cases: dict) -> AbletonMCPServer:
-    """Create MCP server instance with mocked use cases."""
+    """Create one MCP server instance with mocked use cases for the session."""
     return AbletonMCPServer(
         connect_use_case=mock_use_cases["connect_use_case"],
         transport_use_case=mock_use_cases["transport_use_case"],
@@ -54,6 +73,76 @@ def mcp_server(mock_use_cases: dict) -> AbletonMCPServer:
     )
 
 
+# Read-only _format_data inputs, one per recognised shape
+SONG_INFO_DATA: Final[dict] = {
+    "name": "Test Song",
+    "tempo": 120.0,
+    "time_signature": "4/4",
+    "key": "C major",
+    "transport_state": "playing",
+    "tracks": [
+        {"name": "Track 1", "type": "midi", "muted": False, "soloed": False},
+        {"name": "Track 2", "type": "audio", "muted": True, "soloed": False},
+    ],
+}
+
+HARMONY_DATA: Final[dict] = {
+    "detected_keys": [
+        {"root_name": "C", "mode": "major", "confidence": 0.89},
+        {"root_name": "A", "mode": "minor", "confidence": 0.75},
+    ],
+    "chord_progressions": [[0, 4, 5, 3]],
+}
+
+TEMPO_DATA: Final[dict] = {
+    "current_tempo": 128.0,
+    "suggestions": {
+        "genre_optimal": 130.0,
+        "relationships": {
+            "half_time": 64.0,
+            "double_time": 256.0,
+        },
+    },
+}
+
+CLIP_CONTENT_DATA: Final[dict] = {
+    "track_id": 0,
+    "clip_id": 0,
+    "note_count": 2,
+    "notes": [
+        {
+            "pitch": 60,
+            "note_name": "C4",
+            "start": 0.0,
+            "duration": 1.0,
+            "velocity": 100,
+            "mute": False,
+        },
+        {
+            "pitch": 64,
+            "note_name": "E4",
+            "start": 1.0,
+            "duration": 0.5,
+            "velocity": 80,
+            "mute": True,
+        },
+    ],
+}
+
+EMPTY_CLIP_DATA: Final[dict] = {"track_id": 0, "clip_id": 0, "note_count": 0, "notes": []}
+
+GENERIC_DICT_DATA: Final[dict] = {"simple_key": "simple_value", "number": 42}
+
+
+# Prebuilt use case results returned by the tool-call stubs
+CONNECTED_RESULT: Final = UseCaseResult(success=True, message="Connected")
+PLAYING_RESULT: Final = UseCaseResult(success=True, message="Playing")
+HARMONY_RESULT: Final = UseCaseResult(
+    success=True,
+    data={"detected_keys": [{"root_name": "C", "mode": "major", "confidence": 0.9}]},
+)
+
+
 class TestAbletonMCPServerInit:
     """Tests for MCP server initialization."""
 
@@ -72,169 +161,104 @@ class TestAbletonMCPServerInit:
 class TestFormatResult:
     """Tests for result formatting."""
 
-    async def test_format_success_with_data(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting successful result with data."""
-        result = UseCaseResult(
-            success=True,
-            data={"key": "value"},
-            message="Operation completed",
-        )
+    @pytest.mark.parametrize(
+        ("result", "expected_substrings"),
+        [
+            pytest.param(
+                UseCaseResult(success=True, data={"key": "value"}, message="Operation completed"),
+                ["Operation completed"],
+                id="success_with_data",
+            ),
+            pytest.param(
+                UseCaseResult(success=True, data=None, message="Done"),
+                ["Done"],
+                id="success_without_data",
+            ),
+            pytest.param(
+                UseCaseResult(
+                    success=False, message="Something went wrong", error_code="TEST_ERROR"
+                ),
+                ["[ERROR]", "[TEST_ERROR]", "Something went wrong"],
+                id="failure_with_error_code",
+            ),
+            pytest.param(
+                UseCaseResult(success=False, message="Generic error"),
+                ["[ERROR]", "Generic error"],
+                id="failure_without_error_code",
+            ),
+        ],
+    )
+    async def test_format_result(
+        self,
+        mcp_server: AbletonMCPServer,
+        result: UseCaseResult,
+        expected_substrings: list[str],
+    ) -> None:
+        """Test formatting a result into a single text content block."""
         formatted = await mcp_server._format_result(result)
 
         assert len(formatted) == 1
         assert formatted[0].type == "text"
-        assert "Operation completed" in formatted[0].text
-
-    async def test_format_success_without_data(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting successful result without data."""
-        result = UseCaseResult(
-            success=True,
-            data=None,
-            message="Done",
-        )
-        formatted = await mcp_server._format_result(result)
-
-        assert len(formatted) == 1
-        assert "Done" in formatted[0].text
-
-    async def test_format_failure_with_error_code(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting failure result with error code."""
-        result = UseCaseResult(
-            success=False,
-            message="Something went wrong",
-            error_code="TEST_ERROR",
-        )
-        formatted = await mcp_server._format_result(result)
-
-        assert len(formatted) == 1
-        assert "[ERROR]" in formatted[0].text
-        assert "[TEST_ERROR]" in formatted[0].text
-        assert "Something went wrong" in formatted[0].text
-
-    async def test_format_failure_without_error_code(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting failure result without error code."""
-        result = UseCaseResult(
-            success=False,
-            message="Generic error",
-        )
-        formatted = await mcp_server._format_result(result)
-
-        assert "[ERROR]" in formatted[0].text
-        assert "Generic error" in formatted[0].text
+        assert [s for s in expected_substrings if s not in formatted[0].text] == []
 
 
 class TestFormatData:
     """Tests for data formatting."""
 
-    async def test_format_song_info(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting song info data."""
-        data = {
-            "name": "Test Song",
-            "tempo": 120.0,
-            "time_signature": "4/4",
-            "key": "C major",
-            "transport_state": "playing",
-            "tracks": [
-                {"name": "Track 1", "type": "midi", "muted": False, "soloed": False},
-                {"name": "Track 2", "type": "audio", "muted": True, "soloed": False},
-            ],
-        }
-        formatted = await mcp_server._format_data(data)
-
-        assert "**Song Information**" in formatted
-        assert "Test Song" in formatted
-        assert "120" in formatted
-        assert "4/4" in formatted
-        assert "C major" in formatted
-        assert "**Tracks (2)**" in formatted
-        assert "[MUTED]" in formatted
-
-    async def test_format_harmony_analysis(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting harmony analysis data."""
-        data = {
-            "detected_keys": [
-                {"root_name": "C", "mode": "major", "confidence": 0.89},
-                {"root_name": "A", "mode": "minor", "confidence": 0.75},
-            ],
-            "chord_progressions": [[0, 4, 5, 3]],
-        }
-        formatted = await mcp_server._format_data(data)
-
-        assert "**Harmony Analysis**" in formatted
-        assert "C" in formatted
-        assert "major" in formatted
-        assert "89" in formatted  # confidence percentage
-
-    async def test_format_tempo_analysis(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting tempo analysis data."""
-        data = {
-            "current_tempo": 128.0,
-            "suggestions": {
-                "genre_optimal": 130.0,
-                "relationships": {
-                    "half_time": 64.0,
-                    "double_time": 256.0,
-                },
-            },
-        }
-        formatted = await mcp_server._format_data(data)
-
-        assert "**Tempo Analysis**" in formatted
-        assert "128" in formatted
-        assert "130" in formatted
-
-    async def test_format_clip_content(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting clip content data."""
-        data = {
-            "track_id": 0,
-            "clip_id": 0,
-            "note_count": 2,
-            "notes": [
-                {
-                    "pitch": 60,
-                    "note_name": "C4",
-                    "start": 0.0,
-                    "duration": 1.0,
-                    "velocity": 100,
-                    "mute": False,
-                },
-                {
-                    "pitch": 64,
-                    "note_name": "E4",
-                    "start": 1.0,
-                    "duration": 0.5,
-                    "velocity": 80,
-                    "mute": True,
-                },
-            ],
-        }
-        formatted = await mcp_server._format_data(data)
-
-        assert "**Clip Content**" in formatted
-        assert "Total Notes: 2" in formatted
-        assert "C4" in formatted
-        assert "E4" in formatted
-        assert "[MUTED]" in formatted
-
-    async def test_format_empty_clip(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting empty clip content."""
-        data = {
-            "track_id": 0,
-            "clip_id": 0,
-            "note_count": 0,
-            "notes": [],
-        }
-        formatted = await mcp_server._format_data(data)
-
-        assert "(No notes in this clip)" in formatted
-
-    async def test_format_generic_dict(self, mcp_server: AbletonMCPServer) -> None:
-        """Test formatting generic dictionary data."""
-        data = {"simple_key": "simple_value", "number": 42}
+    @pytest.mark.parametrize(
+        ("data", "expected_substrings"),
+        [
+            pytest.param(
+                SONG_INFO_DATA,
+                [
+                    "**Song Information**",
+                    "Test Song",
+                    "120",
+                    "4/4",
+                    "C major",
+                    "**Tracks (2)**",
+                    "[MUTED]",
+                ],
+                id="song_info",
+            ),
+            pytest.param(
+                HARMONY_DATA,
+                # "89" is the confidence percentage
+                ["**Harmony Analysis**", "C", "major", "89"],
+                id="harmony_analysis",
+            ),
+            pytest.param(
+                TEMPO_DATA,
+                ["**Tempo Analysis**", "128", "130"],
+                id="tempo_analysis",
+            ),
+            pytest.param(
+                CLIP_CONTENT_DATA,
+                ["**Clip Content**", "Total Notes: 2", "C4", "E4", "[MUTED]"],
+                id="clip_content",
+            ),
+            pytest.param(
+                EMPTY_CLIP_DATA,
+                ["(No notes in this clip)"],
+                id="empty_clip",
+            ),
+            pytest.param(
+                GENERIC_DICT_DATA,
+                ["simple_key", "simple_value"],
+                id="generic_dict",
+            ),
+        ],
+    )
+    async def test_format_data(
+        self,
+        mcp_server: AbletonMCPServer,
+        data: dict,
+        expected_substrings: list[str],
+    ) -> None:
+        """Test formatting dictionary data for each recognised shape."""
         formatted = await mcp_server._format_data(data)
 
-        assert "simple_key" in formatted
-        assert "simple_value" in formatted
+        assert [s for s in expected_substrings if s not in formatted] == []
 
     async def test_format_non_dict(self, mcp_server: AbletonMCPServer) -> None:
         """Test formatting non-dictionary data."""
@@ -247,55 +271,78 @@ class TestFormatData:
 class TestHandleCallTool:
     """Tests for tool call handling."""
 
-    async def test_connect_ableton_tool(
-        self, mcp_server: AbletonMCPServer, mock_use_cases: dict
-    ) -> None:
-        """Test connect_ableton tool handling."""
-        mock_use_cases["connect_use_case"].execute = AsyncMock(
-            return_value=UseCaseResult(success=True, message="Connected")
+    @staticmethod
+    async def _call_tool(mcp_server: AbletonMCPServer, name: str, arguments: dict) -> str:
+        """Dispatch a tool call through the registered MCP handler and return its text."""
+        handler = mcp_server.server.request_handlers[types.CallToolRequest]
+        response = await handler(
+            types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(name=name, arguments=arguments),
+            )
         )
+        return str(response.root.content[0].text)
 
-        # Test via the use case directly since handlers are internal
-        from ableton_mcp.application.use_cases import ConnectToAbletonRequest
+    @staticmethod
+    def _recording_execute(
+        result: UseCaseResult,
+    ) -> tuple[list[Any], Callable[[Any], Awaitable[UseCaseResult]]]:
+        """Build a stub execute that records its requests and returns a prebuilt result."""
+        received: list[Any] = []
 
-        request = ConnectToAbletonRequest(host="127.0.0.1", send_port=11000, receive_port=11001)
-        result = await mock_use_cases["connect_use_case"].execute(request)
+        async def execute(request: Any) -> UseCaseResult:
+            received.append(request)
+            return result
 
-        assert result.success is True
+        return received, execute
 
-    async def test_transport_control_tool(
-        self, mcp_server: AbletonMCPServer, mock_use_cases: dict
+    async def test_connect_ableton_tool(
+        self, mcp_server: AbletonMCPServer, mock_use_cases: dict, mocker: MockerFixture
     ) -> None:
-        """Test transport_control tool handling."""
-        mock_use_cases["transport_use_case"].execute = AsyncMock(
-            return_value=UseCaseResult(success=True, message="Playing")
+        """Test connect_ableton builds the request and reports the use case result."""
+        received, execute = self._recording_execute(CONNECTED_RESULT)
+        mocker.patch.object(mock_use_cases["connect_use_case"], "execute", execute)
+
+        text = await self._call_tool(
+            mcp_server,
+            "connect_ableton",
+            {"host": "127.0.0.1", "send_port": 11000, "receive_port": 11001},
         )
 
-        from ableton_mcp.application.use_cases import TransportControlRequest
+        assert received == [
+            ConnectToAbletonRequest(host="127.0.0.1", send_port=11000, receive_port=11001)
+        ]
+        assert "Connected" in text
 
-        request = TransportControlRequest(action="play")
-        result = await mock_use_cases["transport_use_case"].execute(request)
+    async def test_transport_control_tool(
+        self, mcp_server: AbletonMCPServer, mock_use_cases: dict, mocker: MockerFixture
+    ) -> None:
+        """Test transport_control builds the request and reports the use case result."""
+        received, execute = self._recording_execute(PLAYING_RESULT)
+        mocker.patch.object(mock_use_cases["transport_use_case"], "execute", execute)
+
+        text = await self._call_tool(mcp_server, "transport_control", {"action": "play"})
 
-        assert result.success is True
+        assert received == [TransportControlRequest(action="play")]
+        assert "Playing" in text
 
     async def test_analyze_harmony_tool(
-        self, mcp_server: AbletonMCPServer, mock_use_cases: dict
+        self, mcp_server: AbletonMCPServer, mock_use_cases: dict, mocker: MockerFixture
     ) -> None:
-        """Test analyze_harmony tool handling."""
-        mock_use_cases["harmony_analysis_use_case"].execute = AsyncMock(
-            return_value=UseCaseResult(
-                success=True,
-                data={"detected_keys": [{"root_name": "C", "mode": "major", "confidence": 0.9}]},
-            )
-        )
+        """Test analyze_harmony builds the request and formats the detected keys."""
+        received, execute = self._recording_execute(HARMONY_RESULT)
+        mocker.patch.object(mock_use_cases["harmony_analysis_use_case"], "execute", execute)
+
+        text = await self._call_tool(mcp_server, "analyze_harmony", {"notes": [60, 64, 67]})
 
-        from ableton_mcp.application.use_cases import AnalyzeHarmonyRequest
+        assert received == [AnalyzeHarmonyRequest(notes=[60, 64, 67])]
+        assert "**Harmony Analysis**" in text
 
-        request = AnalyzeHarmonyRequest(notes=[60, 64, 67])
-        result = await mock_use_cases["harmony_analysis_use_case"].execute(request)
+    async def test_unknown_tool(self, mcp_server: AbletonMCPServer) -> None:
+        """Test an unknown tool name is reported as an error."""
+        text = await self._call_tool(mcp_server, "no_such_tool", {})
 
-        assert result.success is True
-        assert "detected_keys" in result.data
+        assert "[UNKNOWN_TOOL]" in text
 
 
 class TestListTools:
@@ -2,28 +2,41 @@
 
 import pytest
 
-from ableton_mcp.domain.entities import Note
+from ableton_mcp.domain.entities import MusicKey, Note
 from ableton_mcp.infrastructure.services import MusicTheoryServiceImpl
 
 
+@pytest.fixture(scope="module")
+def c_major_key() -> MusicKey:
+    """Provide a C major key shared by the module (read-only)."""
+    return MusicKey(root=0, mode="major")
+
+
+@pytest.fixture(scope="module")
+def c_major_arpeggio() -> tuple[Note, ...]:
+    """Provide C4-E4-G4-C5 quarter notes as an immutable tuple shared by the module."""
+    return (
+        Note(pitch=60, start=0.0, duration=1.0),  # C4
+        Note(pitch=64, start=1.0, duration=1.0),  # E4
+        Note(pitch=67, start=2.0, duration=1.0),  # G4
+        Note(pitch=72, start=3.0, duration=1.0),  # C5
+    )
+
+
 class TestMusicTheoryService:
     """Test cases for music theory service."""
 
-    @pytest.fixture
-    def service(self) -> MusicTheoryServiceImpl:
-        """Provide music theory service instance."""
+    @pytest.fixture(scope="module")
+    @classmethod
+    def service(cls) -> MusicTheoryServiceImpl:
+        """Provide a stateless music theory service instance shared by the module."""
         return MusicTheoryServiceImpl()
 
-    async def test_analyze_key_c_major(self, service: MusicTheoryServiceImpl) -> None:
+    async def test_analyze_key_c_major(
+        self, service: MusicTheoryServiceImpl, c_major_arpeggio: tuple[Note, ...]
+    ) -> None:
         """Test key analysis for C major scale."""
-        notes = [
-            Note(pitch=60, start=0.0, duration=1.0),  # C4
-            Note(pitch=64, start=1.0, duration=1.0),  # E4
-            Note(pitch=67, start=2.0, duration=1.0),  # G4
-            Note(pitch=72, start=3.0, duration=1.0),  # C5
-        ]
-
-        keys = await service.analyze_key(notes)
+        keys = await service.analyze_key(list(c_major_arpeggio))
 
         assert len(keys) > 0
         best_key = keys[0]
@@ -36,30 +49,25 @@ class TestMusicTheoryService:
         keys = await service.analyze_key([])
         assert keys == []
 
-    async def test_suggest_chord_progressions_pop(self, service: MusicTheoryServiceImpl) -> None:
-        """Test chord progression suggestions for pop genre."""
-        from ableton_mcp.domain.entities import MusicKey
-
-        key = MusicKey(root=0, mode="major")  # C major
-        progressions = await service.suggest_chord_progressions(key, "pop")
+    @pytest.mark.parametrize("genre", ["pop", "unknown_genre"])  # Unknown defaults to pop
+    async def test_suggest_chord_progressions(
+        self, service: MusicTheoryServiceImpl, c_major_key: MusicKey, genre: str
+    ) -> None:
+        """Test chord progression suggestions include common multi-chord progressions."""
+        progressions = await service.suggest_chord_progressions(c_major_key, genre)
 
         assert len(progressions) > 0
+        assert any(len(prog) >= 3 for prog in progressions)
 
-        # Check that we get some common pop progressions
-        progression_lengths = [len(prog) for prog in progressions]
-        assert any(length >= 3 for length in progression_lengths)
-
-    async def test_harmonize_melody(self, service: MusicTheoryServiceImpl) -> None:
+    async def test_harmonize_melody(
+        self,
+        service: MusicTheoryServiceImpl,
+        c_major_key: MusicKey,
+        c_major_arpeggio: tuple[Note, ...],
+    ) -> None:
         """Test melody harmonization."""
-        from ableton_mcp.domain.entities import MusicKey
-
-        melody_notes = [
-            Note(pitch=60, start=0.0, duration=1.0),  # C4
-            Note(pitch=64, start=1.0, duration=1.0),  # E4
-        ]
-
-        key = MusicKey(root=0, mode="major")  # C major
-        harmony_notes = await service.harmonize_melody(melody_notes, key)
+        melody_notes = list(c_major_arpeggio[:2])  # C4, E4
+        harmony_notes = await service.harmonize_melody(melody_notes, c_major_key)
 
         # Should generate harmony notes (thirds and fifths)
         assert len(harmony_notes) == 4  # 2 melody notes * 2 harmony notes each
@@ -69,28 +77,25 @@ class TestMusicTheoryService:
             assert harmony_note.velocity < 100
 
     async def test_quantize_notes(self, service: MusicTheoryServiceImpl) -> None:
-        """Test note quantization."""
+        """Test note quantization to the nearest grid step with a minimum duration."""
         notes = [
             Note(pitch=60, start=0.1, duration=0.9),  # Slightly off-grid
             Note(pitch=64, start=1.05, duration=1.1),  # Slightly off-grid
+            Note(pitch=67, start=0.0, duration=0.01),  # Very short note
         ]
 
         quantized = await service.quantize_notes(notes, grid_division=0.25)
 
-        assert len(quantized) == 2
-
-        # Check quantization
-        assert quantized[0].start == 0.0  # Quantized to nearest 0.25
-        assert quantized[1].start == 1.0  # Quantized to nearest 0.25
-
-        # Duration should be quantized too
-        assert quantized[0].duration == 1.0  # Quantized up to 1.0
-        assert quantized[1].duration == 1.0  # Quantized down to 1.0
+        assert [(n.start, n.duration) for n in quantized] == [
+            (0.0, 1.0),  # Start down to 0.0, duration up to 1.0
+            (1.0, 1.0),  # Start down to 1.0, duration down to 1.0
+            (0.0, 0.25),  # Duration raised to at least the grid division
+        ]
 
-    async def test_filter_notes_to_scale(self, service: MusicTheoryServiceImpl) -> None:
+    async def test_filter_notes_to_scale(
+        self, service: MusicTheoryServiceImpl, c_major_key: MusicKey
+    ) -> None:
         """Test filtering notes to a musical scale."""
-        from ableton_mcp.domain.entities import MusicKey
-
         # Notes including some outside C major
         notes = [
             Note(pitch=60, start=0.0, duration=1.0),  # C4 (in scale)
@@ -99,8 +104,7 @@ class TestMusicTheoryService:
             Note(pitch=66, start=3.0, duration=1.0),  # F#4 (not in scale)
         ]
 
-        key = MusicKey(root=0, mode="major")  # C major
-        filtered = await service.filter_notes_to_scale(notes, key)
+        filtered = await service.filter_notes_to_scale(notes, c_major_key)
 
         assert len(filtered) == 4
 
@@ -128,39 +132,15 @@ class TestMusicTheoryService:
         confidences = [key.confidence for key in keys]
         assert confidences == sorted(confidences, reverse=True)
 
-    async def test_chord_progressions_unknown_genre(self, service: MusicTheoryServiceImpl) -> None:
-        """Test chord progressions with unknown genre defaults to pop."""
-        from ableton_mcp.domain.entities import MusicKey
-
-        key = MusicKey(root=0, mode="major")
-        progressions = await service.suggest_chord_progressions(key, "unknown_genre")
-
-        # Should still return progressions (defaulting to pop)
-        assert len(progressions) > 0
-
-    async def test_quantize_notes_minimum_duration(self, service: MusicTheoryServiceImpl) -> None:
-        """Test that quantization respects minimum duration."""
-        notes = [
-            Note(pitch=60, start=0.0, duration=0.01),  # Very short note
-        ]
-
-        quantized = await service.quantize_notes(notes, grid_division=0.25)
-
-        # Should be quantized to at least the grid division
-        assert quantized[0].duration >= 0.25
-
     async def test_harmonize_melody_out_of_scale_notes(
-        self, service: MusicTheoryServiceImpl
+        self, service: MusicTheoryServiceImpl, c_major_key: MusicKey
     ) -> None:
         """Test harmonization with notes outside the scale."""
-        from ableton_mcp.domain.entities import MusicKey
-
         melody_notes = [
             Note(pitch=61, start=0.0, duration=1.0),  # C# (not in C major)
         ]
 
-        key = MusicKey(root=0, mode="major")
-        harmony_notes = await service.harmonize_melody(melody_notes, key)
+        harmony_notes = await service.harmonize_melody(melody_notes, c_major_key)
 
         # Should handle gracefully, possibly with no harmony notes
         # or by adjusting the melody note to fit the scale
@@ -1,6 +1,8 @@
 """Unit tests for OSC correlator."""
 
 import asyncio
+from collections.abc import Iterator
+from unittest.mock import patch
 
 import pytest
 
@@ -10,75 +12,84 @@ from ableton_mcp.infrastructure.osc.correlator import OSCCorrelator
 class TestOSCCorrelator:
     """Test cases for OSC request-response correlation."""
 
-    async def test_basic_request_response(self) -> None:
-        """Test basic request-response correlation."""
+    @pytest.fixture
+    def correlator(self) -> Iterator[OSCCorrelator]:
+        """Provide a correlator and cancel anything still pending afterwards."""
         correlator = OSCCorrelator()
+        yield correlator
+        correlator.cancel_all()
+
+    @pytest.fixture
+    def short_timeout_correlator(self) -> Iterator[OSCCorrelator]:
+        """Provide a correlator whose waits time out almost immediately."""
+        # Only the TimeoutError path matters, so keep the wall-clock wait minimal
+        correlator = OSCCorrelator(default_timeout=0.001)
+        yield correlator
+        correlator.cancel_all()
 
+    async def test_basic_request_response(self, correlator: OSCCorrelator) -> None:
+        """Test basic request-response correlation."""
         # Set up expectation
         future = await correlator.expect_response("/live/song/get/tempo")
 
-        # Simulate response
-        handled = correlator.handle_response("/live/song/get/tempo", [120.0])
-
-        assert handled is True
-        assert future.done()
-        assert await future == [120.0]
+        # Simulate response; handle_response resolves the future synchronously
+        assert correlator.handle_response("/live/song/get/tempo", [120.0]) is True
+        assert future.result() == [120.0]
 
-    async def test_response_without_pending_request(self) -> None:
+    async def test_response_without_pending_request(self, correlator: OSCCorrelator) -> None:
         """Test handling response when no request is pending."""
-        correlator = OSCCorrelator()
-
         # Handle response without pending request
         handled = correlator.handle_response("/live/song/get/tempo", [120.0])
 
         assert handled is False
 
-    async def test_fifo_ordering(self) -> None:
-        """Test that requests are handled in FIFO order."""
-        correlator = OSCCorrelator()
+    async def test_handle_response_no_pending_is_noop(self, correlator: OSCCorrelator) -> None:
+        """Test responses with nothing in flight return early without logging."""
+        future = await correlator.expect_response("/live/song/get/tempo")
+        correlator.handle_response("/live/song/get/tempo", [120.0])
 
+        with patch("ableton_mcp.infrastructure.osc.correlator.logger") as mock_logger:
+            assert correlator.handle_response("/live/song/get/tempo", [121.0]) is False
+            assert correlator.handle_response("/live/track/get/name", [0, "Bass"]) is False
+
+        mock_logger.debug.assert_not_called()
+        assert future.result() == [120.0]
+
+    async def test_fifo_ordering(self, correlator: OSCCorrelator) -> None:
+        """Test that requests are handled in FIFO order."""
         # Set up multiple expectations on same address
         future1 = await correlator.expect_response("/live/song/get/tempo")
         future2 = await correlator.expect_response("/live/song/get/tempo")
 
         # First response goes to first request
         correlator.handle_response("/live/song/get/tempo", [120.0])
-        assert future1.done()
-        assert await future1 == [120.0]
+        assert future1.result() == [120.0]
         assert not future2.done()
 
         # Second response goes to second request
         correlator.handle_response("/live/song/get/tempo", [130.0])
-        assert future2.done()
-        assert await future2 == [130.0]
+        assert future2.result() == [130.0]
 
-    async def test_wait_for_response_success(self) -> None:
+    async def test_wait_for_response_success(self, correlator: OSCCorrelator) -> None:
         """Test waiting for response with success."""
-        correlator = OSCCorrelator(default_timeout=1.0)
-
-        async def send_response_delayed() -> None:
-            await asyncio.sleep(0.1)
-            correlator.handle_response("/live/song/get/tempo", [120.0])
-
-        # Start response in background
-        asyncio.create_task(send_response_delayed())
+        # Deliver the response on the next loop iteration, after
+        # wait_for_response has registered its expectation
+        asyncio.get_running_loop().call_soon(
+            correlator.handle_response, "/live/song/get/tempo", [120.0]
+        )
 
         # Wait for response
         result = await correlator.wait_for_response("/live/song/get/tempo")
 
         assert result == [120.0]
 
-    async def test_wait_for_response_timeout(self) -> None:
+    async def test_wait_for_response_timeout(self, short_timeout_correlator: OSCCorrelator) -> None:
         """Test that waiting times out correctly."""
-        correlator = OSCCorrelator(default_timeout=0.1)
-
         with pytest.raises(asyncio.TimeoutError):
-            await correlator.wait_for_response("/live/song/get/tempo")
+            await short_timeout_correlator.wait_for_response("/live/song/get/tempo")
 
-    async def test_cancel_all(self) -> None:
+    async def test_cancel_all(self, correlator: OSCCorrelator) -> None:
         """Test cancelling all pending requests."""
-        correlator = OSCCorrelator()
-
         # Set up expectations
         future1 = await correlator.expect_response("/live/song/get/tempo")
         future2 = await correlator.expect_response("/live/track/get/name")
@@ -89,10 +100,8 @@ class TestOSCCorrelator:
         assert future1.cancelled()
         assert future2.cancelled()
 
-    async def test_different_addresses_independent(self) -> None:
+    async def test_different_addresses_independent(self, correlator: OSCCorrelator) -> None:
         """Test that different addresses are handled independently."""
-        correlator = OSCCorrelator()
-
         # Set up expectations on different addresses
         future_tempo = await correlator.expect_response("/live/song/get/tempo")
         future_tracks = await correlator.expect_response("/live/song/get/num_tracks")
@@ -101,10 +110,35 @@ class TestOSCCorrelator:
         correlator.handle_response("/live/song/get/num_tracks", [5])
 
         assert not future_tempo.done()
-        assert future_tracks.done()
-        assert await future_tracks == [5]
+        assert future_tracks.result() == [5]
 
         # Now respond to tempo
         correlator.handle_response("/live/song/get/tempo", [128.0])
-        assert future_tempo.done()
-        assert await future_tempo == [128.0]
+        assert future_tempo.result() == [128.0]
+
+    async def test_sibling_addresses_dispatch(self, correlator: OSCCorrelator) -> None:
+        """Test many addresses sharing a prefix each resolve their own request."""
+        properties = ["volume", "panning", "mute", "solo", "arm", "name"]
+        futures = {
+            prop: await correlator.expect_response(f"/live/track/get/{prop}") for prop in properties
+        }
+
+        for index, prop in enumerate(reversed(properties)):
+            assert correlator.handle_response(f"/live/track/get/{prop}", [index]) is True
+
+        assert {prop: future.result() for prop, future in futures.items()} == {
+            prop: [index] for index, prop in enumerate(reversed(properties))
+        }
+        assert correlator.handle_response("/live/track/get/volume", [0]) is False
+
+    async def test_timed_out_request_is_removed(
+        self, short_timeout_correlator: OSCCorrelator
+    ) -> None:
+        """Test a timed-out request no longer absorbs the next response."""
+        with pytest.raises(asyncio.TimeoutError):
+            await short_timeout_correlator.wait_for_response("/live/song/get/tempo")
+
+        future = await short_timeout_correlator.expect_response("/live/song/get/tempo")
+        short_timeout_correlator.handle_response("/live/song/get/tempo", [120.0])
+
+        assert future.result() == [120.0]
@@ -1,948 +1,549 @@
 """Unit tests for Ableton OSC gateway."""
 
 import asyncio
-from typing import Any
+import re
+from collections.abc import Iterator
+from typing import Any, Final, TypeAlias
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from ableton_mcp.core.exceptions import ConnectionError, OSCCommunicationError
-from ableton_mcp.infrastructure.osc.correlator import OSCCorrelator
 from ableton_mcp.infrastructure.osc.gateway import AbletonOSCGateway
-from ableton_mcp.infrastructure.osc.transport import AsyncOSCTransport
 
+ResponseFuture: TypeAlias = asyncio.Future[list[Any]]
 
-class TestAbletonOSCGateway:
-    """Test cases for AbletonOSCGateway."""
+EMPTY_RESPONSE: Final[list[Any]] = []
+TEMPO_RESPONSE: Final[list[Any]] = [120.0]
 
-    @pytest.fixture
-    def mock_transport(self) -> Mock:
-        """Create a mock transport."""
-        transport = Mock(spec=AsyncOSCTransport)
-        transport.connect = AsyncMock()
-        transport.disconnect = AsyncMock()
-        transport.is_connected.return_value = True
-        transport.send = Mock()
-        return transport
-
-    @pytest.fixture
-    def mock_correlator(self) -> Mock:
-        """Create a mock correlator."""
-        correlator = Mock(spec=OSCCorrelator)
-        correlator.expect_response = AsyncMock()
-        correlator.handle_response = Mock()
-        correlator.cancel_all = Mock()
-        return correlator
-
-    async def test_connect_success(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test successful connection to Ableton."""
-        # Set up correlator to return tempo response
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([120.0])
-        mock_correlator.expect_response.return_value = future
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+def ready(value: list[Any]) -> ResponseFuture:
+    """Return an already-resolved response future carrying ``value``."""
+    future: ResponseFuture = asyncio.Future()
+    future.set_result(value)
+    return future
 
-        await gateway.connect("127.0.0.1", 11000, 11001)
 
-        mock_transport.connect.assert_called_once()
-        assert gateway.is_connected()
+class ExpectResponseStub:
+    """Lightweight stand-in for ``OSCCorrelator.expect_response``.
 
-    async def test_connect_timeout_raises_error(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test connection times out when Ableton doesn't respond."""
-        # Set up correlator to return a future that never completes
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        mock_correlator.expect_response.return_value = future
+    Records the requested addresses and hands back ``return_value`` without
+    the call bookkeeping an ``AsyncMock`` performs on every await.
+    """
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=0.1,
-        )
+    def __init__(self) -> None:
+        self.return_value: ResponseFuture | None = None
+        self.calls: list[str] = []
 
-        with pytest.raises(ConnectionError) as exc_info:
-            await gateway.connect("127.0.0.1", 11000, 11001)
+    async def __call__(self, address: str) -> ResponseFuture | None:
+        self.calls.append(address)
+        return self.return_value
 
-        assert "not responding" in str(exc_info.value)
-        # Should disconnect after timeout
-        mock_transport.disconnect.assert_called_once()
+    def reset(self) -> None:
+        """Forget the configured response and recorded calls."""
+        self.return_value = None
+        self.calls.clear()
 
-    async def test_disconnect(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test disconnection."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
 
-        await gateway.disconnect()
+@pytest.fixture(scope="module")
+async def empty_future() -> ResponseFuture:
+    """Share one resolved empty response; the gateway only reads it."""
+    return ready(EMPTY_RESPONSE)
 
-        mock_correlator.cancel_all.assert_called_once()
-        mock_transport.disconnect.assert_called_once()
 
-    async def test_fire_and_forget_operations(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test fire-and-forget transport operations."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
+class FakeTransport:
+    """Hand-rolled stand-in for ``AsyncOSCTransport``.
 
-        # Test transport controls
-        await gateway.start_playing()
-        mock_transport.send.assert_called_with("/live/song/start_playing", [])
+    Exposes only the methods the gateway calls, so building it skips the
+    class introspection ``Mock(spec=...)`` performs.
+    """
 
-        await gateway.stop_playing()
-        mock_transport.send.assert_called_with("/live/song/stop_playing", [])
+    def __init__(self) -> None:
+        self.connect = AsyncMock()
+        self.disconnect = AsyncMock()
+        self.send = Mock()
+        self.send_bundle = Mock()
 
-        await gateway.start_recording()
-        mock_transport.send.assert_called_with("/live/song/start_recording", [])
+    def reset(self) -> None:
+        """Clear recorded calls and any configured behaviour."""
+        for method in (self.connect, self.disconnect, self.send, self.send_bundle):
+            method.reset_mock(return_value=True, side_effect=True)
 
-        await gateway.stop_recording()
-        mock_transport.send.assert_called_with("/live/song/stop_recording", [])
 
-    async def test_fire_and_forget_when_disconnected(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test that operations fail when disconnected."""
-        mock_transport.is_connected.return_value = False
+class FakeCorrelator:
+    """Hand-rolled stand-in for ``OSCCorrelator``."""
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
+    def __init__(self) -> None:
+        self.expect_response = ExpectResponseStub()
+        self.handle_response = Mock()
+        self.cancel_all = Mock()
 
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.start_playing()
-
-        assert "Not connected" in str(exc_info.value)
-
-    async def test_get_tempo(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting tempo from Ableton."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([120.0])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        tempo = await gateway.get_tempo()
-
-        assert tempo == 120.0
-        mock_transport.send.assert_called_with("/live/song/get/tempo", [])
-        mock_correlator.expect_response.assert_called_with("/live/song/get/tempo")
-
-    async def test_set_tempo_validates_range(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test that set_tempo validates BPM range."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.set_tempo(10.0)  # Too low
-
-        assert "20 and 999" in str(exc_info.value)
-
-        with pytest.raises(OSCCommunicationError):
-            await gateway.set_tempo(1000.0)  # Too high
+    def reset(self) -> None:
+        """Clear recorded calls and any configured behaviour."""
+        self.expect_response.reset()
+        self.handle_response.reset_mock(return_value=True, side_effect=True)
+        self.cancel_all.reset_mock(return_value=True, side_effect=True)
 
-    async def test_track_operations(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test track operation methods."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        # Test volume
-        await gateway.set_track_volume(0, 0.8)
-        mock_transport.send.assert_called_with("/live/track/set/volume", [0, 0.8])
-
-        # Test pan
-        await gateway.set_track_pan(0, -0.5)
-        mock_transport.send.assert_called_with("/live/track/set/panning", [0, -0.5])
-
-        # Test mute
-        await gateway.set_track_mute(0, True)
-        mock_transport.send.assert_called_with("/live/track/set/mute", [0, 1])
 
-        # Test solo
-        await gateway.set_track_solo(0, True)
-        mock_transport.send.assert_called_with("/live/track/set/solo", [0, 1])
+@pytest.fixture(scope="module")
+def mock_transport() -> FakeTransport:
+    """Create a fake transport shared by the whole module."""
+    return FakeTransport()
 
-        # Test arm
-        await gateway.set_track_arm(0, True)
-        mock_transport.send.assert_called_with("/live/track/set/arm", [0, 1])
-
-    async def test_track_volume_validates_range(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test that track volume validates range."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
 
-        with pytest.raises(OSCCommunicationError):
-            await gateway.set_track_volume(0, 1.5)  # Too high
-
-        with pytest.raises(OSCCommunicationError):
-            await gateway.set_track_volume(0, -0.1)  # Too low
-
-    async def test_track_pan_validates_range(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test that track pan validates range."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        with pytest.raises(OSCCommunicationError):
-            await gateway.set_track_pan(0, 1.5)  # Too high
-
-        with pytest.raises(OSCCommunicationError):
-            await gateway.set_track_pan(0, -1.5)  # Too low
-
-    async def test_add_note(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test adding a MIDI note."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        await gateway.add_note(
-            track_id=0,
-            clip_id=0,
-            pitch=60,
-            start=0.0,
-            duration=1.0,
-            velocity=100,
-            mute=False,
-        )
-
-        mock_transport.send.assert_called_with(
-            "/live/clip/add/notes",
-            [0, 0, 60, 0.0, 1.0, 100, 0],
-        )
-
-    async def test_message_handler_dispatches_to_correlator(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test that incoming messages are dispatched to correlator."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        # Simulate message received
-        gateway._handle_osc_message("/live/song/get/tempo", [120.0])
-
-        mock_correlator.handle_response.assert_called_once_with("/live/song/get/tempo", [120.0])
-
-    async def test_connect_cleanup_error_is_logged(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test that cleanup errors during connection timeout are handled."""
-        # Set up correlator to return a future that never completes
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        mock_correlator.expect_response.return_value = future
-        # Make disconnect raise an error
-        mock_transport.disconnect = AsyncMock(side_effect=RuntimeError("Cleanup failed"))
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=0.1,
-        )
-
-        with pytest.raises(ConnectionError) as exc_info:
-            await gateway.connect("127.0.0.1", 11000, 11001)
-
-        assert "not responding" in str(exc_info.value)
-
-    async def test_connect_os_error(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test OSError during connection."""
-        mock_transport.connect = AsyncMock(side_effect=OSError("Network error"))
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        with pytest.raises(ConnectionError) as exc_info:
-            await gateway.connect("127.0.0.1", 11000, 11001)
-
-        assert "Failed to connect" in str(exc_info.value)
-
-    async def test_request_when_not_connected(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test that _request raises when not connected."""
-        mock_transport.is_connected.return_value = False
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_tempo()
-
-        assert "Not connected" in str(exc_info.value)
-
-    async def test_get_tempo_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test get_tempo with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_tempo()
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_set_tempo_valid(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test setting valid tempo."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        await gateway.set_tempo(140.0)
-
-        mock_transport.send.assert_called_with("/live/song/set/tempo", [140.0])
-
-    async def test_get_time_signature(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting time signature."""
-        future_num: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future_num.set_result([4])
-        future_denom: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future_denom.set_result([4])
-
-        mock_correlator.expect_response.side_effect = [future_num, future_denom]
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        numerator, denominator = await gateway.get_time_signature()
-
-        assert numerator == 4
-        assert denominator == 4
-
-    async def test_get_time_signature_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test get_time_signature with empty response."""
-        future_num: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future_num.set_result([])
-        future_denom: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future_denom.set_result([])
-
-        mock_correlator.expect_response.side_effect = [future_num, future_denom]
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_time_signature()
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_get_song_time(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting song time."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([8.5])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        song_time = await gateway.get_song_time()
-
-        assert song_time == 8.5
-
-    async def test_get_song_time_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test get_song_time with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_song_time()
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_get_num_tracks(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting number of tracks."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([8])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        num_tracks = await gateway.get_num_tracks()
-
-        assert num_tracks == 8
-
-    async def test_get_num_tracks_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test get_num_tracks with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_num_tracks()
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_get_is_playing(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test checking if playing."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([1])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        is_playing = await gateway.get_is_playing()
-
-        assert is_playing is True
-
-    async def test_get_is_playing_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test get_is_playing with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_is_playing()
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_get_track_name(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting track name."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, "Bass"])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        name = await gateway.get_track_name(0)
-
-        assert name == "Bass"
-
-    async def test_get_track_name_single_value_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track name with single value response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result(["Drums"])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        name = await gateway.get_track_name(0)
-
-        assert name == "Drums"
-
-    async def test_get_track_name_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track name with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_track_name(0)
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_set_track_name(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test setting track name."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
-        await gateway.set_track_name(0, "Lead Synth")
-
-        mock_transport.send.assert_called_with("/live/track/set/name", [0, "Lead Synth"])
-
-    async def test_get_track_volume(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting track volume."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, 0.75])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        volume = await gateway.get_track_volume(0)
-
-        assert volume == 0.75
-
-    async def test_get_track_volume_single_value_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track volume with single value response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0.5])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        volume = await gateway.get_track_volume(0)
-
-        assert volume == 0.5
-
-    async def test_get_track_volume_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track volume with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_track_volume(0)
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_get_track_pan(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting track pan."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, -0.3])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        pan = await gateway.get_track_pan(0)
-
-        assert pan == -0.3
-
-    async def test_get_track_pan_single_value_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track pan with single value response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0.5])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        pan = await gateway.get_track_pan(0)
-
-        assert pan == 0.5
-
-    async def test_get_track_pan_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track pan with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        with pytest.raises(OSCCommunicationError) as exc_info:
-            await gateway.get_track_pan(0)
-
-        assert "Empty response" in str(exc_info.value)
-
-    async def test_get_track_mute(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting track mute state."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, 1])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
-
-        muted = await gateway.get_track_mute(0)
-
-        assert muted is True
-
-    async def test_get_track_mute_single_value_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track mute with single value response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+@pytest.fixture(scope="module")
+def mock_correlator() -> FakeCorrelator:
+    """Create a fake correlator shared by the whole module."""
+    return FakeCorrelator()
 
-        muted = await gateway.get_track_mute(0)
 
-        assert muted is False
+@pytest.fixture(scope="module")
+def gateway(mock_transport: FakeTransport, mock_correlator: FakeCorrelator) -> AbletonOSCGateway:
+    """Create a gateway wired to the shared fakes."""
+    return AbletonOSCGateway(
+        transport=mock_transport,
+        correlator=mock_correlator,
+        default_timeout=1.0,
+    )
 
-    async def test_get_track_mute_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test getting track mute with empty response returns False."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+@pytest.fixture(scope="module")
+def gateway_fast(
+    mock_transport: FakeTransport, mock_correlator: FakeCorrelator
+) -> AbletonOSCGateway:
+    """Create a short-timeout gateway for tests that wait out a timeout."""
+    return AbletonOSCGateway(
+        transport=mock_transport,
+        correlator=mock_correlator,
+        default_timeout=0.1,
+    )
 
-        muted = await gateway.get_track_mute(0)
 
-        assert muted is False
+@pytest.fixture(autouse=True)
+def reset_mocks(
+    gateway: AbletonOSCGateway,
+    gateway_fast: AbletonOSCGateway,
+    mock_transport: FakeTransport,
+    mock_correlator: FakeCorrelator,
+) -> Iterator[None]:
+    """Give every test connected gateways and freshly reset mocks."""
+    gateway._connected = True
+    gateway_fast._connected = True
+    yield
+    mock_transport.reset()
+    mock_correlator.reset()
 
-    async def test_get_track_solo(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting track solo state."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, 1])
-        mock_correlator.expect_response.return_value = future
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+class TestAbletonOSCGateway:
+    """Test cases for AbletonOSCGateway."""
+
+    async def test_connect_success(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        mock_correlator: FakeCorrelator,
+    ) -> None:
+        """Test successful connection to Ableton."""
+        # Set up correlator to return tempo response
+        mock_correlator.expect_response.return_value = ready(TEMPO_RESPONSE)
 
-        soloed = await gateway.get_track_solo(0)
+        await gateway.connect("127.0.0.1", 11000, 11001)
 
-        assert soloed is True
+        mock_transport.connect.assert_called_once()
+        assert gateway.is_connected()
 
-    async def test_get_track_solo_single_value_response(
-        self, mock_transport: Mock, mock_correlator: Mock
+    async def test_connect_timeout_raises_error(
+        self,
+        gateway_fast: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        mock_correlator: FakeCorrelator,
     ) -> None:
-        """Test getting track solo with single value response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([1])
-        mock_correlator.expect_response.return_value = future
+        """Test connection times out when Ableton doesn't respond."""
+        # Set up correlator to return a future that never completes
+        mock_correlator.expect_response.return_value = asyncio.Future()
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        with pytest.raises(ConnectionError) as exc_info:
+            await gateway_fast.connect("127.0.0.1", 11000, 11001)
+
+        assert "not responding" in str(exc_info.value)
+        assert not gateway_fast.is_connected()
+        # Should disconnect after timeout
+        mock_transport.disconnect.assert_called_once()
 
-        soloed = await gateway.get_track_solo(0)
+    async def test_disconnect(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        mock_correlator: FakeCorrelator,
+    ) -> None:
+        """Test disconnection."""
+        await gateway.disconnect()
 
-        assert soloed is True
+        assert not gateway.is_connected()
+        mock_correlator.cancel_all.assert_called_once()
+        mock_transport.disconnect.assert_called_once()
 
-    async def test_get_track_solo_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
+    async def test_fire_and_forget_operations(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
     ) -> None:
-        """Test getting track solo with empty response returns False."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
+        """Test fire-and-forget transport operations."""
+        await gateway.start_playing()
+        await gateway.stop_playing()
+        await gateway.start_recording()
+        await gateway.stop_recording()
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        assert [c.args for c in mock_transport.send.call_args_list] == [
+            ("/live/song/start_playing", []),
+            ("/live/song/stop_playing", []),
+            ("/live/song/start_recording", []),
+            ("/live/song/stop_recording", []),
+        ]
 
-        soloed = await gateway.get_track_solo(0)
+    async def test_fire_and_forget_when_disconnected(self, gateway: AbletonOSCGateway) -> None:
+        """Test that operations fail when disconnected."""
+        await gateway.disconnect()
 
-        assert soloed is False
+        with pytest.raises(OSCCommunicationError) as exc_info:
+            await gateway.start_playing()
 
-    async def test_get_track_arm(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting track arm state."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, 1])
-        mock_correlator.expect_response.return_value = future
+        assert "Not connected" in str(exc_info.value)
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
+    @pytest.mark.parametrize(
+        ("method", "address", "response", "expected"),
+        [
+            ("get_tempo", "/live/song/get/tempo", TEMPO_RESPONSE, 120.0),
+            ("get_song_time", "/live/song/get/current_song_time", [8.5], 8.5),
+            ("get_num_tracks", "/live/song/get/num_tracks", [8], 8),
+            ("get_is_playing", "/live/song/get/is_playing", [1], True),
+        ],
+    )
+    async def test_song_getter(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        mock_correlator: FakeCorrelator,
+        method: str,
+        address: str,
+        response: list[Any],
+        expected: Any,
+    ) -> None:
+        """Test song-level getters request their address and unwrap the reply."""
+        mock_correlator.expect_response.return_value = ready(response)
+
+        result = await getattr(gateway, method)()
+
+        assert result == expected
+        assert type(result) is type(expected)
+        mock_transport.send.assert_called_once_with(address, [])
+        assert mock_correlator.expect_response.calls == [address]
+
+    @pytest.mark.parametrize(
+        ("method", "args", "fragment"),
+        [
+            ("set_tempo", (10.0,), "20 and 999"),
+            ("set_tempo", (1000.0,), "20 and 999"),
+            ("set_track_volume", (0, 1.5), "0.0 and 1.0"),
+            ("set_track_volume", (0, -0.1), "0.0 and 1.0"),
+            ("set_track_pan", (0, 1.5), "-1.0 and 1.0"),
+            ("set_track_pan", (0, -1.5), "-1.0 and 1.0"),
+        ],
+        ids=["tempo-low", "tempo-high", "volume-high", "volume-low", "pan-high", "pan-low"],
+    )
+    async def test_setter_validates_range(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        method: str,
+        args: tuple[float, ...],
+        fragment: str,
+    ) -> None:
+        """Test that setters reject out-of-range values without sending."""
+        with pytest.raises(OSCCommunicationError, match=re.escape(fragment)):
+            await getattr(gateway, method)(*args)
+
+        mock_transport.send.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("method", "args", "address", "payload"),
+        [
+            ("set_track_volume", (0, 0.8), "/live/track/set/volume", [0, 0.8]),
+            ("set_track_pan", (0, -0.5), "/live/track/set/panning", [0, -0.5]),
+            ("set_track_mute", (0, True), "/live/track/set/mute", [0, 1]),
+            ("set_track_solo", (0, True), "/live/track/set/solo", [0, 1]),
+            ("set_track_arm", (0, True), "/live/track/set/arm", [0, 1]),
+        ],
+    )
+    async def test_track_operations(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        method: str,
+        args: tuple[Any, ...],
+        address: str,
+        payload: list[Any],
+    ) -> None:
+        """Test each track setter sends one message with its payload."""
+        await getattr(gateway, method)(*args)
+
+        mock_transport.send.assert_called_once_with(address, payload)
+
+    async def test_add_note(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
+        """Test adding a MIDI note."""
+        await gateway.add_note(
+            track_id=0,
+            clip_id=0,
+            pitch=60,
+            start=0.0,
+            duration=1.0,
+            velocity=100,
+            mute=False,
+        )
+
+        assert mock_transport.send.call_args.args == (
+            "/live/clip/add/notes",
+            [0, 0, 60, 0.0, 1.0, 100, 0],
         )
 
-        armed = await gateway.get_track_arm(0)
+    async def test_add_notes_batches_per_datagram(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
+        """Test that add_notes packs NOTE_BATCH_SIZE notes into each message."""
+        batch = AbletonOSCGateway.NOTE_BATCH_SIZE
+        notes = [(60, 0.0, 0.5, 100, False)] * batch + [(64, 8.0, 1.0, 90, True)]
+
+        await gateway.add_notes(1, 2, notes)
 
-        assert armed is True
+        sent = [c.args for c in mock_transport.send.call_args_list]
+        assert [address for address, _ in sent] == ["/live/clip/add/notes"] * 2
+        assert len(sent[0][1]) == 2 + 5 * batch
+        assert sent[1][1] == [1, 2, 64, 8.0, 1.0, 90, 1]
 
-    async def test_get_track_arm_single_value_response(
-        self, mock_transport: Mock, mock_correlator: Mock
+    async def test_message_handler_dispatches_to_correlator(
+        self, gateway: AbletonOSCGateway, mock_correlator: FakeCorrelator
     ) -> None:
-        """Test getting track arm with single value response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0])
-        mock_correlator.expect_response.return_value = future
+        """Test that incoming messages are dispatched to correlator."""
+        # Simulate message received
+        gateway._handle_osc_message("/live/song/get/tempo", [120.0])
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        mock_correlator.handle_response.assert_called_once_with("/live/song/get/tempo", [120.0])
+
+    async def test_connect_cleanup_error_is_logged(
+        self,
+        gateway_fast: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        mock_correlator: FakeCorrelator,
+    ) -> None:
+        """Test that cleanup errors during connection timeout are handled."""
+        # Set up correlator to return a future that never completes
+        mock_correlator.expect_response.return_value = asyncio.Future()
+        # Make disconnect raise an error
+        mock_transport.disconnect.side_effect = RuntimeError("Cleanup failed")
 
-        armed = await gateway.get_track_arm(0)
+        with pytest.raises(ConnectionError) as exc_info:
+            await gateway_fast.connect("127.0.0.1", 11000, 11001)
 
-        assert armed is False
+        assert "not responding" in str(exc_info.value)
 
-    async def test_get_track_arm_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
+    async def test_connect_os_error(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
     ) -> None:
-        """Test getting track arm with empty response returns False."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
+        """Test OSError during connection."""
+        mock_transport.connect.side_effect = OSError("Network error")
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        with pytest.raises(ConnectionError) as exc_info:
+            await gateway.connect("127.0.0.1", 11000, 11001)
 
-        armed = await gateway.get_track_arm(0)
+        assert "Failed to connect" in str(exc_info.value)
+        assert not gateway.is_connected()
 
-        assert armed is False
+    async def test_request_when_not_connected(self, gateway: AbletonOSCGateway) -> None:
+        """Test that _request raises when not connected."""
+        await gateway.disconnect()
 
-    async def test_get_track_has_midi_input(
-        self, mock_transport: Mock, mock_correlator: Mock
-    ) -> None:
-        """Test checking if track has MIDI input."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, 1])
-        mock_correlator.expect_response.return_value = future
+        with pytest.raises(OSCCommunicationError) as exc_info:
+            await gateway.get_tempo()
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        assert "Not connected" in str(exc_info.value)
 
-        has_midi = await gateway.get_track_has_midi_input(0)
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("get_tempo", ()),
+            ("get_time_signature", ()),
+            ("get_song_time", ()),
+            ("get_num_tracks", ()),
+            ("get_is_playing", ()),
+            ("get_track_name", (0,)),
+            ("get_track_volume", (0,)),
+            ("get_track_pan", (0,)),
+        ],
+    )
+    async def test_getter_empty_response(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_correlator: FakeCorrelator,
+        empty_future: ResponseFuture,
+        method: str,
+        args: tuple[int, ...],
+    ) -> None:
+        """Test that getters reject an empty response."""
+        mock_correlator.expect_response.return_value = empty_future
 
-        assert has_midi is True
+        with pytest.raises(OSCCommunicationError) as exc_info:
+            await getattr(gateway, method)(*args)
+
+        assert "Empty response" in str(exc_info.value)
 
-    async def test_get_track_has_midi_input_single_value_response(
-        self, mock_transport: Mock, mock_correlator: Mock
+    @pytest.mark.parametrize(
+        "method", ["get_track_mute", "get_track_solo", "get_track_arm", "get_track_has_midi_input"]
+    )
+    async def test_track_flag_empty_response_is_false(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_correlator: FakeCorrelator,
+        empty_future: ResponseFuture,
+        method: str,
     ) -> None:
-        """Test track MIDI input with single value response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([1])
-        mock_correlator.expect_response.return_value = future
+        """Test that track flag getters return False for an empty response."""
+        mock_correlator.expect_response.return_value = empty_future
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        assert await getattr(gateway, method)(0) is False
 
-        has_midi = await gateway.get_track_has_midi_input(0)
+    async def test_set_tempo_valid(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
+        """Test setting valid tempo."""
+        await gateway.set_tempo(140.0)
 
-        assert has_midi is True
+        assert mock_transport.send.call_args.args == ("/live/song/set/tempo", [140.0])
 
-    async def test_get_track_has_midi_input_empty_response(
-        self, mock_transport: Mock, mock_correlator: Mock
+    async def test_get_time_signature(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_transport: FakeTransport,
+        mock_correlator: FakeCorrelator,
     ) -> None:
-        """Test track MIDI input with empty response returns False."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
+        """Test getting time signature in one bundled round trip."""
+        # A resolved future can be awaited repeatedly, so both requests share it
+        mock_correlator.expect_response.return_value = ready([4])
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        numerator, denominator = await gateway.get_time_signature()
 
-        has_midi = await gateway.get_track_has_midi_input(0)
+        assert numerator == 4
+        assert denominator == 4
+        addresses = [
+            "/live/song/get/signature_numerator",
+            "/live/song/get/signature_denominator",
+        ]
+        assert mock_correlator.expect_response.calls == addresses
+        mock_transport.send_bundle.assert_called_once_with([(a, []) for a in addresses])
+        mock_transport.send.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("method", "response", "expected"),
+        [
+            ("get_track_name", [0, "Bass"], "Bass"),
+            ("get_track_name", ["Drums"], "Drums"),
+            ("get_track_volume", [0, 0.75], 0.75),
+            ("get_track_volume", [0.5], 0.5),
+            ("get_track_pan", [0, -0.3], -0.3),
+            ("get_track_pan", [0.5], 0.5),
+            ("get_track_mute", [0, 1], True),
+            ("get_track_mute", [0], False),
+            ("get_track_solo", [0, 1], True),
+            ("get_track_solo", [1], True),
+            ("get_track_arm", [0, 1], True),
+            ("get_track_arm", [0], False),
+            ("get_track_has_midi_input", [0, 1], True),
+            ("get_track_has_midi_input", [1], True),
+        ],
+    )
+    async def test_track_getter(
+        self,
+        gateway: AbletonOSCGateway,
+        mock_correlator: FakeCorrelator,
+        method: str,
+        response: list[Any],
+        expected: Any,
+    ) -> None:
+        """Test track getters with [track_id, value] and bare [value] responses."""
+        mock_correlator.expect_response.return_value = ready(response)
+
+        result = await getattr(gateway, method)(0)
+
+        assert result == expected
+        assert type(result) is type(expected)
+
+    async def test_set_track_name(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
+        """Test setting track name."""
+        await gateway.set_track_name(0, "Lead Synth")
 
-        assert has_midi is False
+        assert mock_transport.send.call_args.args == ("/live/track/set/name", [0, "Lead Synth"])
 
-    async def test_create_midi_track(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_create_midi_track(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test creating MIDI track."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.create_midi_track(2)
 
-        mock_transport.send.assert_called_with("/live/song/create_midi_track", [2])
+        assert mock_transport.send.call_args.args == ("/live/song/create_midi_track", [2])
 
-    async def test_create_audio_track(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_create_audio_track(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test creating audio track."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.create_audio_track(3)
 
-        mock_transport.send.assert_called_with("/live/song/create_audio_track", [3])
+        assert mock_transport.send.call_args.args == ("/live/song/create_audio_track", [3])
 
-    async def test_delete_track(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_delete_track(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test deleting track."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.delete_track(1)
 
-        mock_transport.send.assert_called_with("/live/song/delete_track", [1])
+        assert mock_transport.send.call_args.args == ("/live/song/delete_track", [1])
 
-    async def test_fire_clip(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_fire_clip(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test firing a clip."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.fire_clip(0, 1)
 
-        mock_transport.send.assert_called_with("/live/clip_slot/fire", [0, 1])
+        assert mock_transport.send.call_args.args == ("/live/clip_slot/fire", [0, 1])
 
-    async def test_stop_clip(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_stop_clip(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test stopping a clip."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.stop_clip(0, 1)
 
-        mock_transport.send.assert_called_with("/live/clip_slot/stop", [0, 1])
+        assert mock_transport.send.call_args.args == ("/live/clip_slot/stop", [0, 1])
 
-    async def test_create_clip(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_create_clip(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test creating a clip."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.create_clip(0, 1, 4.0)
 
-        mock_transport.send.assert_called_with("/live/clip_slot/create_clip", [0, 1, 4.0])
+        assert mock_transport.send.call_args.args == ("/live/clip_slot/create_clip", [0, 1, 4.0])
 
-    async def test_delete_clip(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_delete_clip(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test deleting a clip."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.delete_clip(0, 1)
 
-        mock_transport.send.assert_called_with("/live/clip_slot/delete_clip", [0, 1])
+        assert mock_transport.send.call_args.args == ("/live/clip_slot/delete_clip", [0, 1])
 
-    async def test_add_note_with_mute(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_add_note_with_mute(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test adding a muted MIDI note."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.add_note(
             track_id=0,
             clip_id=0,
@@ -953,18 +554,15 @@ class TestAbletonOSCGateway:
             mute=True,
         )
 
-        mock_transport.send.assert_called_with(
+        assert mock_transport.send.call_args.args == (
             "/live/clip/add/notes",
             [0, 0, 64, 1.0, 0.5, 80, 1],
         )
 
-    async def test_remove_notes(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_remove_notes(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test removing notes from a clip."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.remove_notes(
             track_id=0,
             clip_id=0,
@@ -974,22 +572,18 @@ class TestAbletonOSCGateway:
             pitch_span=12,
         )
 
-        mock_transport.send.assert_called_with(
+        assert mock_transport.send.call_args.args == (
             "/live/clip/remove_notes",
             [0, 0, 0.0, 4.0, 60, 12],
         )
 
-    async def test_get_clip_notes(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_get_clip_notes(
+        self, gateway: AbletonOSCGateway, mock_correlator: FakeCorrelator
+    ) -> None:
         """Test getting clip notes."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
         # Response format: [track_id, clip_id, pitch, start, duration, velocity, mute, ...]
-        future.set_result([0, 0, 60, 0.0, 1.0, 100, 0, 64, 1.0, 0.5, 80, 1])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
+        mock_correlator.expect_response.return_value = ready(
+            [0, 0, 60, 0.0, 1.0, 100, 0, 64, 1.0, 0.5, 80, 1]
         )
 
         notes = await gateway.get_clip_notes(0, 0)
@@ -1003,51 +597,49 @@ class TestAbletonOSCGateway:
         assert notes[1]["pitch"] == 64
         assert notes[1]["mute"] is True
 
-    async def test_get_clip_notes_empty(self, mock_transport: Mock, mock_correlator: Mock) -> None:
-        """Test getting notes from empty clip."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([0, 0])  # Just track_id and clip_id
-        mock_correlator.expect_response.return_value = future
+    async def test_get_clip_notes_drops_partial_note(
+        self, gateway: AbletonOSCGateway, mock_correlator: FakeCorrelator
+    ) -> None:
+        """Test that a truncated trailing note is ignored."""
+        mock_correlator.expect_response.return_value = ready([0, 0, 60, 0.0, 1.0, 100, 0, 64, 1.0])
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        notes = await gateway.get_clip_notes(0, 0)
+
+        assert notes == [
+            {"pitch": 60, "start": 0.0, "duration": 1.0, "velocity": 100, "mute": False}
+        ]
+
+    async def test_get_clip_notes_empty(
+        self, gateway: AbletonOSCGateway, mock_correlator: FakeCorrelator
+    ) -> None:
+        """Test getting notes from empty clip."""
+        # Just track_id and clip_id
+        mock_correlator.expect_response.return_value = ready([0, 0])
 
         notes = await gateway.get_clip_notes(0, 0)
 
         assert len(notes) == 0
 
     async def test_get_clip_notes_no_response(
-        self, mock_transport: Mock, mock_correlator: Mock
+        self,
+        gateway: AbletonOSCGateway,
+        mock_correlator: FakeCorrelator,
+        empty_future: ResponseFuture,
     ) -> None:
         """Test getting notes with no response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        mock_correlator.expect_response.return_value = empty_future
 
         notes = await gateway.get_clip_notes(0, 0)
 
         assert len(notes) == 0
 
-    async def test_get_device_parameters(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_get_device_parameters(
+        self, gateway: AbletonOSCGateway, mock_correlator: FakeCorrelator
+    ) -> None:
         """Test getting device parameters."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
         # Response format: [param_count, id1, name1, value1, min1, max1, ...]
-        future.set_result([2, 0, "Freq", 1000.0, 20.0, 20000.0, 1, "Gain", 0.5, 0.0, 1.0])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
+        mock_correlator.expect_response.return_value = ready(
+            [2, 0, "Freq", 1000.0, 20.0, 20000.0, 1, "Gain", 0.5, 0.0, 1.0]
         )
 
         params = await gateway.get_device_parameters(0, 0)
@@ -1061,93 +653,87 @@ class TestAbletonOSCGateway:
         assert params[1]["id"] == 1
         assert params[1]["name"] == "Gain"
 
+    async def test_get_device_parameters_capped_by_data(
+        self, gateway: AbletonOSCGateway, mock_correlator: FakeCorrelator
+    ) -> None:
+        """Test that a parameter count larger than the payload is capped."""
+        mock_correlator.expect_response.return_value = ready([3, 0, "Freq", 1000.0, 20.0, 20000.0])
+
+        params = await gateway.get_device_parameters(0, 0)
+
+        assert [p["name"] for p in params] == ["Freq"]
+
     async def test_get_device_parameters_empty(
-        self, mock_transport: Mock, mock_correlator: Mock
+        self,
+        gateway: AbletonOSCGateway,
+        mock_correlator: FakeCorrelator,
+        empty_future: ResponseFuture,
     ) -> None:
         """Test getting device parameters with empty response."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([])
-        mock_correlator.expect_response.return_value = future
-
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=1.0,
-        )
+        mock_correlator.expect_response.return_value = empty_future
 
         params = await gateway.get_device_parameters(0, 0)
 
         assert len(params) == 0
 
-    async def test_set_device_parameter(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_set_device_parameter(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test setting device parameter."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.set_device_parameter(0, 0, 1, 0.75)
 
-        mock_transport.send.assert_called_with(
+        assert mock_transport.send.call_args.args == (
             "/live/device/set/parameter/value",
             [0, 0, 1, 0.75],
         )
 
-    async def test_bypass_device(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_bypass_device(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test bypassing a device."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.bypass_device(0, 0, True)
 
-        mock_transport.send.assert_called_with(
+        assert mock_transport.send.call_args.args == (
             "/live/device/set/enabled",
             [0, 0, 0],  # 0 means bypassed/disabled
         )
 
-    async def test_enable_device(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_enable_device(
+        self, gateway: AbletonOSCGateway, mock_transport: FakeTransport
+    ) -> None:
         """Test enabling a device."""
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-        )
-
         await gateway.bypass_device(0, 0, False)
 
-        mock_transport.send.assert_called_with(
+        assert mock_transport.send.call_args.args == (
             "/live/device/set/enabled",
             [0, 0, 1],  # 1 means enabled
         )
 
-    async def test_request_timeout(self, mock_transport: Mock, mock_correlator: Mock) -> None:
+    async def test_request_timeout(
+        self, gateway_fast: AbletonOSCGateway, mock_correlator: FakeCorrelator
+    ) -> None:
         """Test request timeout handling."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
+        future: ResponseFuture = asyncio.Future()
         mock_correlator.expect_response.return_value = future
 
-        gateway = AbletonOSCGateway(
-            transport=mock_transport,
-            correlator=mock_correlator,
-            default_timeout=0.1,
-        )
-
         with pytest.raises(asyncio.TimeoutError):
-            await gateway.get_tempo()
+            await gateway_fast.get_tempo()
+
+        # The expired future is left done, so a late reply is not delivered
+        assert future.done()
 
     async def test_request_custom_timeout(
-        self, mock_transport: Mock, mock_correlator: Mock
+        self, mock_transport: FakeTransport, mock_correlator: FakeCorrelator
     ) -> None:
         """Test request with custom timeout."""
-        future: asyncio.Future[list[Any]] = asyncio.get_event_loop().create_future()
-        future.set_result([120.0])
-        mock_correlator.expect_response.return_value = future
+        mock_correlator.expect_response.return_value = ready(TEMPO_RESPONSE)
 
         gateway = AbletonOSCGateway(
             transport=mock_transport,
             correlator=mock_correlator,
             default_timeout=10.0,  # Long default timeout
         )
+        gateway._connected = True
 
         # Should complete quickly since future is already resolved
         tempo = await gateway.get_tempo()
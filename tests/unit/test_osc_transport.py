@@ -1,11 +1,113 @@
 """Unit tests for OSC transport layer."""
 
 import asyncio
+import logging
+import socket
+import struct
+import sys
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-
-from ableton_mcp.infrastructure.osc.transport import AsyncOSCTransport, OSCProtocol
+from pythonosc.osc_bundle import OscBundle
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from ableton_mcp.infrastructure.osc.transport import (
+    DEFAULT_SOCKET_BUFFER_BYTES,
+    AsyncOSCTransport,
+    OSCProtocol,
+    _encode_message,
+    _parse_message,
+)
+
+
+def _build(address: str, *args: Any) -> bytes:
+    builder = OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+def _connected_transport() -> tuple[AsyncOSCTransport, Mock]:
+    """Return a transport marked connected and its mocked ``sendto``."""
+    transport = AsyncOSCTransport()
+    transport._send_transport = Mock()
+    transport._sendto = transport._send_transport.sendto
+    transport._connected = True
+    return transport, transport._sendto
+
+
+class TestParseMessage:
+    """Tests for the single-pass OSC message decoder."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            (),
+            (42,),
+            (-7, 0.5),
+            ("Bass",),
+            ("abc", 1, "defg", 2.25),
+            (True, False, 3),
+            (0, 0, 60, 0.0, 1.0, 100, 0, 64, 1.0, 0.5, 80, 1),
+        ],
+    )
+    def test_matches_pythonosc(self, args: tuple[Any, ...]) -> None:
+        """Test decoding agrees with pythonosc for the argument types Live sends."""
+        dgram = _build("/live/clip/get/notes", *args)
+
+        parsed = _parse_message(dgram)
+
+        message = OscMessage(dgram)
+        assert parsed == (message.address, list(message.params))
+
+    def test_repeated_address_is_shared(self) -> None:
+        """Test every decode of an address returns the same interned str."""
+        first = _parse_message(_build("/live/song/get/tempo", 120.0))
+        second = _parse_message(_build("/live/song/get/tempo", 121.0))
+
+        assert first is not None and second is not None
+        assert first[0] is second[0]
+        assert first[0] is sys.intern("/live/song/get/tempo")
+
+    def test_unsupported_type_falls_back(self) -> None:
+        """Test that other type tags are left to pythonosc."""
+        builder = OscMessageBuilder(address="/test")
+        builder.add_arg(1.5, OscMessageBuilder.ARG_TYPE_DOUBLE)
+
+        assert _parse_message(builder.build().dgram) is None
+
+    def test_truncated_payload_raises(self) -> None:
+        """Test that a payload shorter than its type tags is rejected."""
+        with pytest.raises(struct.error):
+            _parse_message(_build("/test", 1, 2)[:-4])
+
+
+class TestEncodeMessage:
+    """Tests for the struct-based message encoder."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            (3,),
+            (0, 0.75),
+            (1, 2),
+            (0, 1, 60, 0.0, 1.0, 100, False),
+            (-(2**31) + 1, 2**31 - 1, True),
+        ],
+        ids=["int", "int-float", "int-int", "note", "bounds-bool"],
+    )
+    def test_matches_pythonosc(self, args: tuple[Any, ...]) -> None:
+        """Test the encoder produces the same bytes as OscMessageBuilder."""
+        assert _encode_message("/live/clip/add/notes", list(args)) == _build(
+            "/live/clip/add/notes", *args
+        )
+
+    @pytest.mark.parametrize("arg", ["name", 2**31, None], ids=["str", "int64", "none"])
+    def test_other_types_fall_back(self, arg: Any) -> None:
+        """Test arguments outside int32/float32/bool defer to the builder."""
+        assert _encode_message("/live/track/set/name", [0, arg]) is None
 
 
 class TestOSCProtocol:
@@ -49,6 +151,25 @@ class TestOSCProtocol:
         assert call_args[0] == "/test/address"
         assert 42 in call_args[1]
 
+    def test_debug_logging_follows_cached_level(self) -> None:
+        """Test per-message debug logs are gated on the level read at refresh."""
+        stdlib_logger = logging.getLogger("ableton_mcp.infrastructure.osc.transport")
+        original_level = stdlib_logger.level
+        datagram = _build("/test/address", 42)
+        try:
+            stdlib_logger.setLevel(logging.INFO)
+            protocol = OSCProtocol(Mock())
+            with patch("ableton_mcp.infrastructure.osc.transport.logger") as mock_logger:
+                protocol.datagram_received(datagram, ("127.0.0.1", 11001))
+                mock_logger.debug.assert_not_called()
+
+                stdlib_logger.setLevel(logging.DEBUG)
+                protocol.refresh_log_levels()
+                protocol.datagram_received(datagram, ("127.0.0.1", 11001))
+                mock_logger.debug.assert_called_once()
+        finally:
+            stdlib_logger.setLevel(original_level)
+
     def test_datagram_received_parse_error(self) -> None:
         """Test handling of parse errors."""
         handler = Mock()
@@ -71,6 +192,17 @@ class TestOSCProtocol:
 
         assert protocol._parse_error_count >= OSCProtocol.PARSE_ERROR_WARN_THRESHOLD
 
+    def test_parse_error_warnings_back_off(self) -> None:
+        """Test the warning repeats only at power-of-two error counts."""
+        protocol = OSCProtocol(Mock())
+
+        with patch("ableton_mcp.infrastructure.osc.transport.logger") as mock_logger:
+            for _ in range(40):
+                protocol.datagram_received(b"invalid", ("127.0.0.1", 11001))
+
+        assert mock_logger.error.call_count == 40
+        assert [c.kwargs["error_count"] for c in mock_logger.warning.call_args_list] == [8, 16, 32]
+
     def test_error_received(self) -> None:
         """Test error_received callback."""
         handler = Mock()
@@ -159,7 +291,40 @@ class TestAsyncOSCTransport:
 
             assert transport._connected is True
             assert transport._send_transport == mock_send_transport
+            assert transport._sendto == mock_send_transport.sendto
             assert transport._receive_transport == mock_receive_transport
+            send_socket = mock_send_transport.get_extra_info.return_value
+            receive_socket = mock_receive_transport.get_extra_info.return_value
+            send_socket.setsockopt.assert_called_once_with(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, DEFAULT_SOCKET_BUFFER_BYTES
+            )
+            receive_socket.setsockopt.assert_called_once_with(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, DEFAULT_SOCKET_BUFFER_BYTES
+            )
+
+    async def test_connect_buffer_sizes_configurable(self) -> None:
+        """Test custom buffer sizes are applied and None keeps the OS default."""
+        transport = AsyncOSCTransport(send_buffer_bytes=None, receive_buffer_bytes=4096)
+        mock_send_transport = Mock()
+        mock_receive_transport = Mock()
+        mock_receive_transport.get_extra_info.return_value.setsockopt.side_effect = OSError
+
+        with patch.object(asyncio, "get_running_loop") as mock_loop:
+            mock_loop.return_value.create_datagram_endpoint = AsyncMock(
+                side_effect=[
+                    (mock_send_transport, None),
+                    (mock_receive_transport, Mock()),
+                ]
+            )
+
+            # A refused buffer size must not fail the connection
+            await transport.connect("127.0.0.1", 11000, 11001, Mock())
+
+        assert transport.is_connected() is True
+        mock_send_transport.get_extra_info.assert_not_called()
+        mock_receive_transport.get_extra_info.return_value.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 4096
+        )
 
     async def test_disconnect(self) -> None:
         """Test disconnect closes transports."""
@@ -177,6 +342,7 @@ class TestAsyncOSCTransport:
         mock_receive.close.assert_called_once()
         assert transport._connected is False
         assert transport._send_transport is None
+        assert transport._sendto is None
         assert transport._receive_transport is None
 
     async def test_disconnect_when_not_connected(self) -> None:
@@ -190,13 +356,50 @@ class TestAsyncOSCTransport:
 
     def test_send_when_connected(self) -> None:
         """Test send works when connected."""
-        transport = AsyncOSCTransport()
-        transport._connected = True
-        transport._send_transport = Mock()
+        transport, sendto = _connected_transport()
 
         transport.send("/test/address", [42, "hello"])
 
-        transport._send_transport.sendto.assert_called_once()
+        sendto.assert_called_once()
+
+    def test_send_reuses_builder_without_leaking_args(self) -> None:
+        """Test consecutive sends through the shared builder encode independently."""
+        transport, sendto = _connected_transport()
+
+        transport.send("/live/track/set/volume", [0, 0.5])
+        transport.send("/live/track/get/name", [3])
+
+        first, second = (c.args[0] for c in sendto.call_args_list)
+        assert first == _build("/live/track/set/volume", 0, 0.5)
+        assert second == _build("/live/track/get/name", 3)
+
+    def test_send_without_args_reuses_cached_datagram(self) -> None:
+        """Test argument-less messages encode once and match the builder output."""
+        transport, sendto = _connected_transport()
+
+        transport.send("/live/song/start_playing", [])
+        transport.send("/live/song/start_playing", [])
+
+        first, second = (c.args[0] for c in sendto.call_args_list)
+        assert first is second
+        assert first == OscMessageBuilder(address="/live/song/start_playing").build().dgram
+
+    def test_send_bundle_packs_messages_in_one_datagram(self) -> None:
+        """Test send_bundle writes one bundle holding every message in order."""
+        transport, sendto = _connected_transport()
+
+        transport.send_bundle([("/live/song/get/tempo", []), ("/live/track/get/name", [3])])
+
+        (dgram,) = sendto.call_args.args
+        messages = [(m.address, m.params) for m in OscBundle(dgram)]
+        assert messages == [("/live/song/get/tempo", []), ("/live/track/get/name", [3])]
+
+    def test_send_bundle_when_not_connected(self) -> None:
+        """Test send_bundle raises when not connected."""
+        transport = AsyncOSCTransport()
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            transport.send_bundle([("/test/address", [])])
 
     def test_send_when_not_connected(self) -> None:
         """Test send raises when not connected."""
@@ -1,5 +1,8 @@
 """Unit tests for repository implementations."""
 
+import asyncio
+from typing import Final
+
 import pytest
 
 from ableton_mcp.domain.entities import (
@@ -23,6 +26,243 @@ from ableton_mcp.infrastructure.repositories import (
     InMemoryTrackRepository,
 )
 
+SAMPLE_SONG: Final[Song] = Song(
+    id=EntityId("song-1"),
+    name="Test Song",
+    tempo=120.0,
+    time_signature_numerator=4,
+    time_signature_denominator=4,
+    tracks=[],
+)
+
+SAMPLE_TRACK: Final[Track] = Track(
+    id=EntityId("track-1"),
+    name="Test Track",
+    track_type=TrackType.MIDI,
+    volume=0.8,
+    pan=0.0,
+    is_muted=False,
+    is_soloed=False,
+    is_armed=False,
+)
+
+SAMPLE_DEVICE: Final[Device] = Device(
+    id=EntityId("device-1"),
+    name="EQ Eight",
+    device_type=DeviceType.AUDIO_EFFECT,
+    is_enabled=True,
+    parameters=[
+        Parameter(
+            id=0,
+            name="Freq",
+            value=0.5,
+            min_value=0.0,
+            max_value=1.0,
+        )
+    ],
+)
+
+SAMPLE_CLIP: Final[Clip] = Clip(
+    id=EntityId("clip-1"),
+    name="Test Clip",
+    clip_type=ClipType.MIDI,
+    length=4.0,
+    is_playing=False,
+    notes=[
+        Note(
+            pitch=60,
+            start=0.0,
+            duration=1.0,
+            velocity=100,
+        )
+    ],
+)
+
+SAMPLE_ANALYSIS: Final[AnalysisResult] = AnalysisResult(
+    id=EntityId("analysis-1"),
+    analysis_type="harmony",
+    confidence=0.9,
+    data={"key": "C major"},
+)
+
+SECOND_TRACK: Final[Track] = Track(
+    id=EntityId("track-2"),
+    name="Track 2",
+    track_type=TrackType.AUDIO,
+    volume=0.7,
+    pan=0.5,
+    is_muted=True,
+    is_soloed=False,
+    is_armed=False,
+)
+
+SECOND_DEVICE: Final[Device] = Device(
+    id=EntityId("device-2"),
+    name="Compressor",
+    device_type=DeviceType.AUDIO_EFFECT,
+    is_enabled=True,
+    parameters=[],
+)
+
+SECOND_CLIP: Final[Clip] = Clip(
+    id=EntityId("clip-2"),
+    name="Clip 2",
+    clip_type=ClipType.AUDIO,
+    length=8.0,
+    is_playing=False,
+    notes=[],
+)
+
+SECOND_HARMONY_ANALYSIS: Final[AnalysisResult] = AnalysisResult(
+    id=EntityId("analysis-2"),
+    analysis_type="harmony",
+    confidence=0.85,
+    data={"key": "G major"},
+)
+
+TEMPO_ANALYSIS: Final[AnalysisResult] = AnalysisResult(
+    id=EntityId("analysis-3"),
+    analysis_type="tempo",
+    confidence=0.95,
+    data={"bpm": 120},
+)
+
+# Three id ranges, one per concurrent writer in TestConcurrentAccess
+CONCURRENT_TRACKS: Final[tuple[Track, ...]] = tuple(
+    Track(
+        id=EntityId(f"track-{index}"),
+        name=f"Track {index}",
+        track_type=TrackType.MIDI,
+        volume=0.8,
+        pan=0.0,
+        is_muted=False,
+        is_soloed=False,
+        is_armed=False,
+    )
+    for start in (0, 100, 200)
+    for index in range(start, start + 10)
+)
+
+
+@pytest.fixture(scope="module")
+def sample_song() -> Song:
+    """Provide the shared sample song (read-only)."""
+    return SAMPLE_SONG
+
+
+@pytest.fixture(scope="module")
+def sample_track() -> Track:
+    """Provide the shared sample track (read-only)."""
+    return SAMPLE_TRACK
+
+
+@pytest.fixture(scope="module")
+def sample_device() -> Device:
+    """Provide the shared sample device (read-only)."""
+    return SAMPLE_DEVICE
+
+
+@pytest.fixture(scope="module")
+def sample_clip() -> Clip:
+    """Provide the shared sample clip (read-only)."""
+    return SAMPLE_CLIP
+
+
+@pytest.fixture(scope="module")
+def sample_analysis() -> AnalysisResult:
+    """Provide the shared sample analysis result (read-only)."""
+    return SAMPLE_ANALYSIS
+
+
+REPOSITORY_CASES = [
+    pytest.param(
+        InMemoryTrackRepository,
+        "sample_track",
+        "get_track",
+        "create_track",
+        "delete_track",
+        id="track",
+    ),
+    pytest.param(
+        InMemoryDeviceRepository,
+        "sample_device",
+        "get_device",
+        "create_device",
+        "delete_device",
+        id="device",
+    ),
+    pytest.param(
+        InMemoryClipRepository,
+        "sample_clip",
+        "get_clip",
+        "create_clip",
+        "delete_clip",
+        id="clip",
+    ),
+    pytest.param(
+        InMemoryAnalysisRepository,
+        "sample_analysis",
+        "get_analysis",
+        "save_analysis",
+        "delete_analysis",
+        id="analysis",
+    ),
+]
+
+
+@pytest.mark.parametrize(("repository_cls", "sample", "get", "add", "delete"), REPOSITORY_CASES)
+class TestInMemoryRepositoryContract:
+    """Get/add/delete behaviour shared by the id-keyed repositories."""
+
+    async def test_get_when_empty(
+        self, repository_cls: type, sample: str, get: str, add: str, delete: str
+    ) -> None:
+        """Test getting an entity when none exists."""
+        result = await getattr(repository_cls(), get)(EntityId("nonexistent"))
+        assert result is None
+
+    async def test_add_then_get(
+        self,
+        request: pytest.FixtureRequest,
+        repository_cls: type,
+        sample: str,
+        get: str,
+        add: str,
+        delete: str,
+    ) -> None:
+        """Test an added entity can be fetched by id."""
+        entity = request.getfixturevalue(sample)
+        repository = repository_cls()
+
+        await getattr(repository, add)(entity)
+        result = await getattr(repository, get)(entity.id)
+
+        assert result is entity
+
+    async def test_seeded_then_delete(
+        self,
+        request: pytest.FixtureRequest,
+        repository_cls: type,
+        sample: str,
+        get: str,
+        add: str,
+        delete: str,
+    ) -> None:
+        """Test a constructor-seeded entity is stored and can be deleted."""
+        entity = request.getfixturevalue(sample)
+        repository = repository_cls([entity])
+
+        assert await getattr(repository, get)(entity.id) is entity
+        await getattr(repository, delete)(entity.id)
+        assert await getattr(repository, get)(entity.id) is None
+
+    async def test_delete_nonexistent(
+        self, repository_cls: type, sample: str, get: str, add: str, delete: str
+    ) -> None:
+        """Test deleting an entity that doesn't exist."""
+        # Should not raise
+        await getattr(repository_cls(), delete)(EntityId("nonexistent"))
+
 
 class TestInMemorySongRepository:
     """Tests for InMemorySongRepository."""
@@ -33,16 +273,9 @@ class TestInMemorySongRepository:
         return InMemorySongRepository()
 
     @pytest.fixture
-    def sample_song(self) -> Song:
-        """Create a sample song."""
-        return Song(
-            id=EntityId("song-1"),
-            name="Test Song",
-            tempo=120.0,
-            time_signature_numerator=4,
-            time_signature_denominator=4,
-            tracks=[],
-        )
+    def seeded_repository(self, sample_song: Song) -> InMemorySongRepository:
+        """Create a repository that already holds the sample song."""
+        return InMemorySongRepository(sample_song)
 
     async def test_get_current_song_when_empty(self, repository: InMemorySongRepository) -> None:
         """Test getting current song when none exists."""
@@ -53,15 +286,12 @@ class TestInMemorySongRepository:
         """Test saving a song."""
         await repository.save_song(sample_song)
         result = await repository.get_current_song()
-        assert result is not None
-        assert result.id == sample_song.id
-        assert result.name == sample_song.name
+        assert result == sample_song
 
-    async def test_update_song(self, repository: InMemorySongRepository, sample_song: Song) -> None:
+    async def test_update_song(
+        self, seeded_repository: InMemorySongRepository, sample_song: Song
+    ) -> None:
         """Test updating a song."""
-        # First save the song
-        await repository.save_song(sample_song)
-
         # Create updated version
         updated_song = Song(
             id=sample_song.id,
@@ -72,20 +302,15 @@ class TestInMemorySongRepository:
             tracks=[],
         )
 
-        await repository.update_song(updated_song)
-        result = await repository.get_current_song()
+        await seeded_repository.update_song(updated_song)
+        result = await seeded_repository.get_current_song()
 
-        assert result is not None
-        assert result.name == "Updated Song"
-        assert result.tempo == 140.0
+        assert result == updated_song
 
     async def test_update_song_with_different_id(
-        self, repository: InMemorySongRepository, sample_song: Song
+        self, seeded_repository: InMemorySongRepository, sample_song: Song
     ) -> None:
         """Test updating with different ID doesn't change the song."""
-        # First save the song
-        await repository.save_song(sample_song)
-
         # Try to update with different ID
         different_song = Song(
             id=EntityId("different-id"),
@@ -96,13 +321,11 @@ class TestInMemorySongRepository:
             tracks=[],
         )
 
-        await repository.update_song(different_song)
-        result = await repository.get_current_song()
+        await seeded_repository.update_song(different_song)
+        result = await seeded_repository.get_current_song()
 
         # Original song should remain unchanged
-        assert result is not None
-        assert result.name == sample_song.name
-        assert result.tempo == sample_song.tempo
+        assert result == sample_song
 
 
 class TestInMemoryTrackRepository:
@@ -114,64 +337,27 @@ class TestInMemoryTrackRepository:
         return InMemoryTrackRepository()
 
     @pytest.fixture
-    def sample_track(self) -> Track:
-        """Create a sample track."""
-        return Track(
-            id=EntityId("track-1"),
-            name="Test Track",
-            track_type=TrackType.MIDI,
-            volume=0.8,
-            pan=0.0,
-            is_muted=False,
-            is_soloed=False,
-            is_armed=False,
-        )
-
-    async def test_get_track_when_empty(self, repository: InMemoryTrackRepository) -> None:
-        """Test getting a track when none exists."""
-        result = await repository.get_track(EntityId("nonexistent"))
-        assert result is None
-
-    async def test_create_track(
-        self, repository: InMemoryTrackRepository, sample_track: Track
-    ) -> None:
-        """Test creating a track."""
-        await repository.create_track(sample_track)
-        result = await repository.get_track(sample_track.id)
-
-        assert result is not None
-        assert result.id == sample_track.id
-        assert result.name == sample_track.name
+    def seeded_repository(self, sample_track: Track) -> InMemoryTrackRepository:
+        """Create a repository that already holds the sample track."""
+        return InMemoryTrackRepository([sample_track])
 
     async def test_get_tracks_by_song(
         self, repository: InMemoryTrackRepository, sample_track: Track
     ) -> None:
         """Test getting all tracks."""
-        # Create multiple tracks
-        track2 = Track(
-            id=EntityId("track-2"),
-            name="Track 2",
-            track_type=TrackType.AUDIO,
-            volume=0.7,
-            pan=0.5,
-            is_muted=True,
-            is_soloed=False,
-            is_armed=False,
+        await asyncio.gather(
+            repository.create_track(sample_track),
+            repository.create_track(SECOND_TRACK),
         )
 
-        await repository.create_track(sample_track)
-        await repository.create_track(track2)
-
         tracks = await repository.get_tracks_by_song(EntityId("song-1"))
 
         assert len(tracks) == 2
 
     async def test_update_track(
-        self, repository: InMemoryTrackRepository, sample_track: Track
+        self, seeded_repository: InMemoryTrackRepository, sample_track: Track
     ) -> None:
         """Test updating a track."""
-        await repository.create_track(sample_track)
-
         updated_track = Track(
             id=sample_track.id,
             name="Updated Track",
@@ -183,28 +369,10 @@ class TestInMemoryTrackRepository:
             is_armed=True,
         )
 
-        await repository.update_track(updated_track)
-        result = await repository.get_track(sample_track.id)
-
-        assert result is not None
-        assert result.name == "Updated Track"
-        assert result.volume == 0.5
-        assert result.is_muted is True
-
-    async def test_delete_track(
-        self, repository: InMemoryTrackRepository, sample_track: Track
-    ) -> None:
-        """Test deleting a track."""
-        await repository.create_track(sample_track)
-        await repository.delete_track(sample_track.id)
-
-        result = await repository.get_track(sample_track.id)
-        assert result is None
+        await seeded_repository.update_track(updated_track)
+        result = await seeded_repository.get_track(sample_track.id)
 
-    async def test_delete_nonexistent_track(self, repository: InMemoryTrackRepository) -> None:
-        """Test deleting a track that doesn't exist."""
-        # Should not raise
-        await repository.delete_track(EntityId("nonexistent"))
+        assert result == updated_track
 
 
 class TestInMemoryDeviceRepository:
@@ -216,65 +384,27 @@ class TestInMemoryDeviceRepository:
         return InMemoryDeviceRepository()
 
     @pytest.fixture
-    def sample_device(self) -> Device:
-        """Create a sample device."""
-        return Device(
-            id=EntityId("device-1"),
-            name="EQ Eight",
-            device_type=DeviceType.AUDIO_EFFECT,
-            is_enabled=True,
-            parameters=[
-                Parameter(
-                    id=0,
-                    name="Freq",
-                    value=0.5,
-                    min_value=0.0,
-                    max_value=1.0,
-                )
-            ],
-        )
-
-    async def test_get_device_when_empty(self, repository: InMemoryDeviceRepository) -> None:
-        """Test getting a device when none exists."""
-        result = await repository.get_device(EntityId("nonexistent"))
-        assert result is None
-
-    async def test_create_device(
-        self, repository: InMemoryDeviceRepository, sample_device: Device
-    ) -> None:
-        """Test creating a device."""
-        await repository.create_device(sample_device)
-        result = await repository.get_device(sample_device.id)
-
-        assert result is not None
-        assert result.id == sample_device.id
-        assert result.name == sample_device.name
+    def seeded_repository(self, sample_device: Device) -> InMemoryDeviceRepository:
+        """Create a repository that already holds the sample device."""
+        return InMemoryDeviceRepository([sample_device])
 
     async def test_get_devices_by_track(
         self, repository: InMemoryDeviceRepository, sample_device: Device
     ) -> None:
         """Test getting all devices for a track."""
-        device2 = Device(
-            id=EntityId("device-2"),
-            name="Compressor",
-            device_type=DeviceType.AUDIO_EFFECT,
-            is_enabled=True,
-            parameters=[],
+        await asyncio.gather(
+            repository.create_device(sample_device),
+            repository.create_device(SECOND_DEVICE),
         )
 
-        await repository.create_device(sample_device)
-        await repository.create_device(device2)
-
         devices = await repository.get_devices_by_track(EntityId("track-1"))
 
         assert len(devices) == 2
 
     async def test_update_device(
-        self, repository: InMemoryDeviceRepository, sample_device: Device
+        self, seeded_repository: InMemoryDeviceRepository, sample_device: Device
     ) -> None:
         """Test updating a device."""
-        await repository.create_device(sample_device)
-
         updated_device = Device(
             id=sample_device.id,
             name="Updated EQ",
@@ -283,27 +413,10 @@ class TestInMemoryDeviceRepository:
             parameters=[],
         )
 
-        await repository.update_device(updated_device)
-        result = await repository.get_device(sample_device.id)
-
-        assert result is not None
-        assert result.name == "Updated EQ"
-        assert result.is_enabled is False
-
-    async def test_delete_device(
-        self, repository: InMemoryDeviceRepository, sample_device: Device
-    ) -> None:
-        """Test deleting a device."""
-        await repository.create_device(sample_device)
-        await repository.delete_device(sample_device.id)
-
-        result = await repository.get_device(sample_device.id)
-        assert result is None
+        await seeded_repository.update_device(updated_device)
+        result = await seeded_repository.get_device(sample_device.id)
 
-    async def test_delete_nonexistent_device(self, repository: InMemoryDeviceRepository) -> None:
-        """Test deleting a device that doesn't exist."""
-        # Should not raise
-        await repository.delete_device(EntityId("nonexistent"))
+        assert result == updated_device
 
 
 class TestInMemoryClipRepository:
@@ -315,62 +428,27 @@ class TestInMemoryClipRepository:
         return InMemoryClipRepository()
 
     @pytest.fixture
-    def sample_clip(self) -> Clip:
-        """Create a sample clip."""
-        return Clip(
-            id=EntityId("clip-1"),
-            name="Test Clip",
-            clip_type=ClipType.MIDI,
-            length=4.0,
-            is_playing=False,
-            notes=[
-                Note(
-                    pitch=60,
-                    start=0.0,
-                    duration=1.0,
-                    velocity=100,
-                )
-            ],
-        )
-
-    async def test_get_clip_when_empty(self, repository: InMemoryClipRepository) -> None:
-        """Test getting a clip when none exists."""
-        result = await repository.get_clip(EntityId("nonexistent"))
-        assert result is None
-
-    async def test_create_clip(self, repository: InMemoryClipRepository, sample_clip: Clip) -> None:
-        """Test creating a clip."""
-        await repository.create_clip(sample_clip)
-        result = await repository.get_clip(sample_clip.id)
-
-        assert result is not None
-        assert result.id == sample_clip.id
-        assert result.name == sample_clip.name
+    def seeded_repository(self, sample_clip: Clip) -> InMemoryClipRepository:
+        """Create a repository that already holds the sample clip."""
+        return InMemoryClipRepository([sample_clip])
 
     async def test_get_clips_by_track(
         self, repository: InMemoryClipRepository, sample_clip: Clip
     ) -> None:
         """Test getting all clips for a track."""
-        clip2 = Clip(
-            id=EntityId("clip-2"),
-            name="Clip 2",
-            clip_type=ClipType.AUDIO,
-            length=8.0,
-            is_playing=False,
-            notes=[],
+        await asyncio.gather(
+            repository.create_clip(sample_clip),
+            repository.create_clip(SECOND_CLIP),
         )
 
-        await repository.create_clip(sample_clip)
-        await repository.create_clip(clip2)
-
         clips = await repository.get_clips_by_track(EntityId("track-1"))
 
         assert len(clips) == 2
 
-    async def test_update_clip(self, repository: InMemoryClipRepository, sample_clip: Clip) -> None:
+    async def test_update_clip(
+        self, seeded_repository: InMemoryClipRepository, sample_clip: Clip
+    ) -> None:
         """Test updating a clip."""
-        await repository.create_clip(sample_clip)
-
         updated_clip = Clip(
             id=sample_clip.id,
             name="Updated Clip",
@@ -380,26 +458,10 @@ class TestInMemoryClipRepository:
             notes=[],
         )
 
-        await repository.update_clip(updated_clip)
-        result = await repository.get_clip(sample_clip.id)
-
-        assert result is not None
-        assert result.name == "Updated Clip"
-        assert result.length == 8.0
-        assert result.is_playing is True
-
-    async def test_delete_clip(self, repository: InMemoryClipRepository, sample_clip: Clip) -> None:
-        """Test deleting a clip."""
-        await repository.create_clip(sample_clip)
-        await repository.delete_clip(sample_clip.id)
-
-        result = await repository.get_clip(sample_clip.id)
-        assert result is None
+        await seeded_repository.update_clip(updated_clip)
+        result = await seeded_repository.get_clip(sample_clip.id)
 
-    async def test_delete_nonexistent_clip(self, repository: InMemoryClipRepository) -> None:
-        """Test deleting a clip that doesn't exist."""
-        # Should not raise
-        await repository.delete_clip(EntityId("nonexistent"))
+        assert result == updated_clip
 
 
 class TestInMemoryAnalysisRepository:
@@ -410,107 +472,44 @@ class TestInMemoryAnalysisRepository:
         """Create a fresh repository instance."""
         return InMemoryAnalysisRepository()
 
-    @pytest.fixture
-    def sample_analysis(self) -> AnalysisResult:
-        """Create a sample analysis result."""
-        return AnalysisResult(
-            id=EntityId("analysis-1"),
-            analysis_type="harmony",
-            confidence=0.9,
-            data={"key": "C major"},
-        )
-
-    async def test_get_analysis_when_empty(self, repository: InMemoryAnalysisRepository) -> None:
-        """Test getting an analysis when none exists."""
-        result = await repository.get_analysis(EntityId("nonexistent"))
-        assert result is None
-
-    async def test_save_analysis(
-        self, repository: InMemoryAnalysisRepository, sample_analysis: AnalysisResult
-    ) -> None:
-        """Test saving an analysis."""
-        await repository.save_analysis(sample_analysis)
-        result = await repository.get_analysis(sample_analysis.id)
-
-        assert result is not None
-        assert result.id == sample_analysis.id
-        assert result.analysis_type == sample_analysis.analysis_type
-
     async def test_get_analyses_by_type(
         self, repository: InMemoryAnalysisRepository, sample_analysis: AnalysisResult
     ) -> None:
         """Test getting analyses by type."""
-        analysis2 = AnalysisResult(
-            id=EntityId("analysis-2"),
-            analysis_type="harmony",
-            confidence=0.85,
-            data={"key": "G major"},
-        )
-        analysis3 = AnalysisResult(
-            id=EntityId("analysis-3"),
-            analysis_type="tempo",
-            confidence=0.95,
-            data={"bpm": 120},
+        await asyncio.gather(
+            repository.save_analysis(sample_analysis),
+            repository.save_analysis(SECOND_HARMONY_ANALYSIS),
+            repository.save_analysis(TEMPO_ANALYSIS),
         )
 
-        await repository.save_analysis(sample_analysis)
-        await repository.save_analysis(analysis2)
-        await repository.save_analysis(analysis3)
-
-        harmony_results = await repository.get_analyses_by_type("harmony")
-        tempo_results = await repository.get_analyses_by_type("tempo")
+        harmony_results, tempo_results = await asyncio.gather(
+            repository.get_analyses_by_type("harmony"),
+            repository.get_analyses_by_type("tempo"),
+        )
 
         assert len(harmony_results) == 2
         assert len(tempo_results) == 1
 
-    async def test_delete_analysis(
-        self, repository: InMemoryAnalysisRepository, sample_analysis: AnalysisResult
-    ) -> None:
-        """Test deleting an analysis."""
-        await repository.save_analysis(sample_analysis)
-        await repository.delete_analysis(sample_analysis.id)
-
-        result = await repository.get_analysis(sample_analysis.id)
-        assert result is None
-
-    async def test_delete_nonexistent_analysis(
-        self, repository: InMemoryAnalysisRepository
-    ) -> None:
-        """Test deleting an analysis that doesn't exist."""
-        # Should not raise
-        await repository.delete_analysis(EntityId("nonexistent"))
-
 
 class TestConcurrentAccess:
     """Test concurrent access to repositories."""
 
     async def test_concurrent_track_operations(self) -> None:
         """Test concurrent track operations are thread-safe."""
-        import asyncio
-
         repository = InMemoryTrackRepository()
 
-        async def create_tracks(start_idx: int) -> None:
-            for i in range(10):
-                track = Track(
-                    id=EntityId(f"track-{start_idx + i}"),
-                    name=f"Track {start_idx + i}",
-                    track_type=TrackType.MIDI,
-                    volume=0.8,
-                    pan=0.0,
-                    is_muted=False,
-                    is_soloed=False,
-                    is_armed=False,
-                )
-                await repository.create_track(track)
-
-        # Run multiple concurrent operations
+        async def create_tracks(batch: tuple[Track, ...]) -> None:
+            # Every create in the batch contends for the lock at once
+            await asyncio.gather(*(repository.create_track(track) for track in batch))
+
+        # Run multiple concurrent operations, one batch of ten tracks each
         await asyncio.gather(
-            create_tracks(0),
-            create_tracks(100),
-            create_tracks(200),
+            create_tracks(CONCURRENT_TRACKS[:10]),
+            create_tracks(CONCURRENT_TRACKS[10:20]),
+            create_tracks(CONCURRENT_TRACKS[20:]),
         )
 
         # Verify all tracks were created
         tracks = await repository.get_tracks_by_song(EntityId("any"))
         assert len(tracks) == 30
+        assert {track.id for track in tracks} == {track.id for track in CONCURRENT_TRACKS}
@@ -225,6 +225,23 @@ class TestAbletonClipService:
             mute=False,
         )
 
+    async def test_add_notes(self) -> None:
+        """Test adding several notes to a clip in one gateway call."""
+        mock_gateway = Mock(spec=AbletonGateway)
+        mock_gateway.add_notes = AsyncMock()
+
+        notes = [
+            Note(pitch=60, start=0.0, duration=1.0, velocity=100, mute=False),
+            Note(pitch=64, start=1.0, duration=0.5, velocity=90, mute=True),
+        ]
+
+        service = AbletonClipService(gateway=mock_gateway)
+        await service.add_notes(0, 1, notes)
+
+        mock_gateway.add_notes.assert_called_once_with(
+            0, 1, [(60, 0.0, 1.0, 100, False), (64, 1.0, 0.5, 90, True)]
+        )
+
     async def test_create_clip(self) -> None:
         """Test creating a clip."""
         mock_gateway = Mock(spec=AbletonGateway)
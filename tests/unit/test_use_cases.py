@@ -1,5 +1,8 @@
 """Unit tests for use cases."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
 from unittest.mock import AsyncMock, Mock
 
 from ableton_mcp.application.use_cases import (
@@ -17,6 +20,8 @@ from ableton_mcp.application.use_cases import (
     GetClipContentUseCase,
     GetSongInfoRequest,
     GetSongInfoUseCase,
+    RefreshSongDataRequest,
+    RefreshSongDataUseCase,
     ReturnTrackOperationRequest,
     ReturnTrackOperationsUseCase,
     SceneOperationRequest,
@@ -33,6 +38,77 @@ from ableton_mcp.infrastructure.repositories import InMemorySongRepository
 from ableton_mcp.infrastructure.services import MusicTheoryServiceImpl
 
 
+def _held_track_gateway(started: list[tuple[str, int]], releases: list[asyncio.Event]) -> Mock:
+    """Create a gateway whose track queries wait until their track is released."""
+    values: dict[str, Callable[[int], Any]] = {
+        "name": lambda i: f"Track {i}",
+        "volume": lambda i: 0.25 * (i + 1),
+        "pan": lambda i: -0.5 + 0.5 * i,
+        "has_midi_input": lambda i: i != 1,
+        "mute": lambda i: i == 0,
+        "solo": lambda i: i == 1,
+        "arm": lambda i: i == 2,
+    }
+
+    def held(field: str) -> AsyncMock:
+        async def query(track_index: int) -> Any:
+            started.append((field, track_index))
+            await releases[track_index].wait()
+            return values[field](track_index)
+
+        return AsyncMock(side_effect=query)
+
+    mock_gateway = Mock()
+    mock_gateway.get_tempo = AsyncMock(return_value=120.0)
+    mock_gateway.get_time_signature = AsyncMock(return_value=(4, 4))
+    mock_gateway.get_song_time = AsyncMock(return_value=0.0)
+    mock_gateway.get_is_playing = AsyncMock(return_value=False)
+    mock_gateway.get_num_tracks = AsyncMock(return_value=len(releases))
+    for field in values:
+        setattr(mock_gateway, f"get_track_{field}", held(field))
+    return mock_gateway
+
+
+async def _assert_track_queries_pipelined(
+    run: Callable[[Mock, Mock], Awaitable[Any]],
+) -> None:
+    """Check each track's queries are in flight together and land in its fields."""
+    fields = ["arm", "has_midi_input", "mute", "name", "pan", "solo", "volume"]
+    started: list[tuple[str, int]] = []
+    releases = [asyncio.Event() for _ in range(3)]
+    mock_gateway = _held_track_gateway(started, releases)
+    mock_repository = Mock()
+    mock_repository.save_song = AsyncMock()
+
+    task = asyncio.create_task(run(mock_gateway, mock_repository))
+    for i, release in enumerate(releases):
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert sorted(started) == [(field, i) for field in fields]
+        started.clear()
+        release.set()
+
+    assert (await task).success is True
+    song = mock_repository.save_song.call_args.args[0]
+    assert [
+        (
+            t.id.value,
+            t.name,
+            t.track_type,
+            t.volume,
+            t.pan,
+            t.is_muted,
+            t.is_soloed,
+            t.is_armed,
+        )
+        for t in song.tracks
+    ] == [
+        ("track_0", "Track 0", TrackType.MIDI, 0.25, -0.5, True, False, False),
+        ("track_1", "Track 1", TrackType.AUDIO, 0.5, 0.0, False, True, False),
+        ("track_2", "Track 2", TrackType.MIDI, 0.75, 0.5, False, False, True),
+    ]
+
+
 class TestConnectToAbletonUseCase:
     """Test cases for connection use case."""
 
@@ -67,6 +143,56 @@ class TestConnectToAbletonUseCase:
         mock_service.connect.assert_called_once_with("localhost", 11000, 11001)
         mock_repository.save_song.assert_called_once()
 
+    async def test_song_queries_are_pipelined(self) -> None:
+        """Test the song-level queries are all in flight before any resolves."""
+        started: list[str] = []
+        release = asyncio.Event()
+
+        def held(name: str, value: Any) -> AsyncMock:
+            async def query() -> Any:
+                started.append(name)
+                await release.wait()
+                return value
+
+            return AsyncMock(side_effect=query)
+
+        mock_gateway = Mock()
+        mock_gateway.get_tempo = held("tempo", 120.0)
+        mock_gateway.get_time_signature = held("time_signature", (4, 4))
+        mock_gateway.get_song_time = held("song_time", 0.0)
+        mock_gateway.get_is_playing = held("is_playing", False)
+        mock_gateway.get_num_tracks = held("num_tracks", 0)
+        mock_service = Mock()
+        mock_service.connect = AsyncMock()
+        mock_repository = Mock()
+        mock_repository.save_song = AsyncMock()
+
+        use_case = ConnectToAbletonUseCase(mock_service, mock_repository, mock_gateway)
+        task = asyncio.create_task(use_case.execute(ConnectToAbletonRequest()))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert sorted(started) == [
+            "is_playing",
+            "num_tracks",
+            "song_time",
+            "tempo",
+            "time_signature",
+        ]
+        release.set()
+        assert (await task).success is True
+
+    async def test_track_queries_are_pipelined(self) -> None:
+        """Test each track's queries are in flight together, one track at a time."""
+        mock_service = Mock()
+        mock_service.connect = AsyncMock()
+
+        async def run(mock_gateway: Mock, mock_repository: Mock) -> Any:
+            use_case = ConnectToAbletonUseCase(mock_service, mock_repository, mock_gateway)
+            return await use_case.execute(ConnectToAbletonRequest())
+
+        await _assert_track_queries_pipelined(run)
+
     async def test_connection_failure(self) -> None:
         """Test connection failure handling."""
         mock_service = Mock()
@@ -84,6 +210,66 @@ class TestConnectToAbletonUseCase:
         assert result.error_code == "CONNECTION_FAILED"
 
 
+class TestRefreshSongDataUseCase:
+    """Test cases for song data refresh use case."""
+
+    async def test_track_queries_are_pipelined(self) -> None:
+        """Test each track's queries are in flight together, one track at a time."""
+
+        async def run(mock_gateway: Mock, mock_repository: Mock) -> Any:
+            use_case = RefreshSongDataUseCase(mock_repository, mock_gateway)
+            return await use_case.execute(RefreshSongDataRequest())
+
+        await _assert_track_queries_pipelined(run)
+
+    async def test_failed_track_settles_before_next_track(self) -> None:
+        """Test a failed track's pending queries settle before the next track starts."""
+        started: list[tuple[str, int]] = []
+        releases = [asyncio.Event() for _ in range(2)]
+        mock_gateway = _held_track_gateway(started, releases)
+        mock_gateway.get_track_volume = AsyncMock(side_effect=[TimeoutError("no reply"), 0.5])
+        mock_repository = Mock()
+        mock_repository.save_song = AsyncMock()
+
+        use_case = RefreshSongDataUseCase(mock_repository, mock_gateway)
+        task = asyncio.create_task(use_case.execute(RefreshSongDataRequest()))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert {track_index for _, track_index in started} == {0}
+        for release in releases:
+            release.set()
+        assert (await task).success is True
+        song = mock_repository.save_song.call_args.args[0]
+        assert [t.id.value for t in song.tracks] == ["track_1"]
+
+    async def test_failed_song_query_settles_before_raising(self) -> None:
+        """Test a failed song query is reported only after its siblings settle."""
+        release = asyncio.Event()
+
+        async def held() -> Any:
+            await release.wait()
+            return 0
+
+        mock_gateway = _held_track_gateway([], [])
+        mock_gateway.get_tempo = AsyncMock(side_effect=TimeoutError("no reply"))
+        mock_gateway.get_song_time = AsyncMock(side_effect=held)
+        mock_repository = Mock()
+        mock_repository.save_song = AsyncMock()
+
+        use_case = RefreshSongDataUseCase(mock_repository, mock_gateway)
+        task = asyncio.create_task(use_case.execute(RefreshSongDataRequest()))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert not task.done()
+        release.set()
+        result = await task
+        assert result.success is False
+        assert result.error_code == "REFRESH_FAILED"
+        mock_repository.save_song.assert_not_called()
+
+
 class TestTransportControlUseCase:
     """Test cases for transport control use case."""
 
@@ -271,7 +457,7 @@ class TestAddNotesUseCase:
         clip_repository = InMemoryClipRepository()
         music_theory_service = MusicTheoryServiceImpl()
         clip_service = Mock()
-        clip_service.add_note = AsyncMock()
+        clip_service.add_notes = AsyncMock()
         clip_service.create_clip = AsyncMock()
 
         # Setup song with track and clip
@@ -296,6 +482,7 @@ class TestAddNotesUseCase:
 
         assert result.success is True
         assert "Added 1 notes" in result.message
+        clip_service.add_notes.assert_awaited_once()
 
     async def test_add_notes_with_quantization(self) -> None:
         """Test adding notes with quantization."""
@@ -305,7 +492,7 @@ class TestAddNotesUseCase:
         clip_repository = InMemoryClipRepository()
         music_theory_service = MusicTheoryServiceImpl()
         clip_service = Mock()
-        clip_service.add_note = AsyncMock()
+        clip_service.add_notes = AsyncMock()
         clip_service.create_clip = AsyncMock()
 
         # Setup song with track and clip